@@ -1,108 +1,139 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
+import argparse
 import os
-import sys
-import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+from eishro_catalog import assign_badges
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.incremental import (
+    ChangedProducts,
+    empty_badge_cache,
+    forget_store,
+    load_badge_cache,
+    remember_store_file,
+    save_badge_cache,
+    store_file_unchanged,
+)
+from eishro_catalog.publish import publish_stream
+from eishro_catalog.store_io import BATCH_SIZE
+from eishro_catalog.stores import (
+    add_workers_argument,
+    discover_stores,
+    run_per_store,
+    store_display_name,
+)
+from eishro_catalog.timing import add_timing_arguments, effective_workers, instrumented, timed
 
-def calculate_badge(product):
-    """حساب التمييز بناءً على الإحصائيات"""
-    quantity = product.get('quantity', 0)
-    orders = product.get('orders', 0)
-    likes = product.get('likes', 0)
-    views = product.get('views', 0)
-    rating = product.get('rating', 0)
-    price = product.get('price', 0)
-    original_price = product.get('originalPrice', 0)
-    
-    # حساب نسبة التخفيف
-    discount = 0
-    if original_price > 0:
-        discount = ((original_price - price) / original_price) * 100
-    
-    # أولويات التمييز
-    if quantity <= 0:
-        return "غير متوفر"
-    elif discount > 10:
-        return "تخفيضات"
-    elif orders > 100 and likes > 200:
-        return "مميزة"
-    elif orders > 100:
-        return "أكثر مبيعاً"
-    elif likes > 200:
-        return "أكثر إعجاباً"
-    elif orders > 50:
-        return "أكثر طلباً"
-    elif views > 400:
-        return "أكثر مشاهدة"
-    else:
-        return "جديد"
+def process_store(store_folder, store_name, cache=None):
+    """معالجة ملف store.json لمتجر معين (تزايدياً عند تمرير ذاكرة البصمات)
 
-def process_store(store_folder, store_name):
-    """معالجة ملف store.json لمتجر معين"""
+    تُرجع (نجاح المعالجة، هل كُتب الملف فعلاً).
+    """
     store_path = f"public/assets/{store_folder}/store.json"
     
     if not os.path.exists(store_path):
         print(f"WARNING: {store_path} لم يتم العثور عليه")
-        return False
+        return False, False
+    
+    if cache is not None and store_file_unchanged(cache, store_folder, store_path):
+        print(f"SKIP - {store_name}: لا تغيير منذ التشغيل السابق")
+        return True, False
+    
+    tracker = ChangedProducts(cache, store_folder) if cache is not None else None
+    counts = {'rated': 0, 'updated': 0}
+    
+    def apply_badges_to_batch(products):
+        rated_products = [p for p in products if 'rating' in p and 'orders' in p]
+        if tracker is not None:
+            rated_products = tracker.select(rated_products)
+        counts['rated'] += len(rated_products)
+        counts['updated'] += assign_badges(rated_products, with_color=False)
+        return products
     
     try:
-        with open(store_path, 'r', encoding='utf-8') as f:
-            store_data = json.load(f)
-        
-        products = store_data.get('products', [])
-        updated_count = 0
-        
-        for product in products:
-            if 'rating' in product and 'orders' in product:
-                old_badge = product.get('badge', '')
-                new_badge = calculate_badge(product)
-                product['badge'] = new_badge
-                
-                if old_badge != new_badge:
-                    updated_count += 1
+        # قراءة وحساب وكتابة متدفقة على دفعات، ثم خطوة النشر المشتركة؛
+        # إن لم تتغير أي شارة لا يُستبدل الملف (بصمة الناتج مطابقة)
+        with timed('stream'):
+            product_count, written = publish_stream(store_folder, apply_badges_to_batch, batch_size=BATCH_SIZE)
         
-        # حفظ البيانات المحدثة
-        with open(store_path, 'w', encoding='utf-8') as f:
-            json.dump(store_data, f, ensure_ascii=False, indent=2)
+        if tracker is not None:
+            tracker.finish()
+            remember_store_file(cache, store_folder, store_path)
         
-        # حفظ نسخة في dist
-        dist_path = f"dist/assets/{store_folder}/store.json"
-        os.makedirs(os.path.dirname(dist_path), exist_ok=True)
-        with open(dist_path, 'w', encoding='utf-8') as f:
-            json.dump(store_data, f, ensure_ascii=False, indent=2)
-        
-        print(f"OK - {store_name}: تم تحديث {updated_count} منتج من {len(products)}")
-        return True
+        if cache is not None and counts['updated'] == 0:
+            print(f"OK - {store_name}: لا تغيير في الشارات ({counts['rated']} منتج أعيد حسابه)")
+        else:
+            print(f"OK - {store_name}: تم تحديث {counts['updated']} منتج من {product_count}")
+        return True, written
         
     except Exception as e:
+        if cache is not None:
+            forget_store(cache, store_folder)
         print(f"ERROR - {store_name}: {str(e)}")
-        return False
+        return False, False
+
+def process_store_job(store_folder, cache_entry=None, incremental=False):
+    """تشغيل process_store في عملية منفصلة مع جزء المتجر من ذاكرة البصمات"""
+    cache = None
+    if incremental:
+        cache = empty_badge_cache()
+        if cache_entry is not None:
+            cache['stores'][store_folder] = cache_entry
+    ok, written = process_store(store_folder, store_display_name(store_folder), cache)
+    return ok, written, cache['stores'].get(store_folder) if cache is not None else None
 
-def main():
+def main(argv=None):
     """الدالة الرئيسية"""
-    stores = [
-        ('nawaem', 'نواعم'),
-        ('sheirine', 'شيرين'),
-        ('delta-store', 'دالتا ستور'),
-        ('pretty', 'بريتي'),
-        ('magna-beauty', 'ماغنا بيوتي')
-    ]
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="تطبيق نظام التمييز على المتاجر")
+    parser.add_argument('--incremental', action='store_true',
+                        help="إعادة حساب المنتجات التي تغيرت إحصائياتها فقط")
+    add_workers_argument(parser)
+    add_timing_arguments(parser)
+    args = parser.parse_args(argv)
     
+    with instrumented(args) as timings:
+        run(args, timings)
+
+def run(args, timings):
+    """معالجة كل المتاجر وتجميع النتائج"""
     print("=" * 60)
     print("تطبيق نظام التمييز على المتاجر")
     print("=" * 60)
     
+    cache = load_badge_cache() if args.incremental else None
+    tasks = [
+        (folder, cache['stores'].get(folder) if cache is not None else None, args.incremental)
+        for folder in discover_stores()
+    ]
+    
     success_count = 0
-    for folder, name in stores:
-        if process_store(folder, name):
+    written_count = 0
+    for result in run_per_store(process_store_job, tasks, effective_workers(args)):
+        print(result.output, end='')
+        timings.extend(result.timings)
+        if result.error:
+            print(f"ERROR - {store_display_name(result.folder)}: {result.error}")
+            if cache is not None:
+                forget_store(cache, result.folder)
+            continue
+        ok, written, cache_entry = result.value
+        if ok:
             success_count += 1
+        if written:
+            written_count += 1
+        if cache is not None:
+            if cache_entry is None:
+                forget_store(cache, result.folder)
+            else:
+                cache['stores'][result.folder] = cache_entry
+    
+    if cache is not None:
+        save_badge_cache(cache)
     
     print("=" * 60)
-    print(f"تم معالجة {success_count} متجر بنجاح")
+    print(f"تم معالجة {success_count} متجر بنجاح، وكتابة {written_count} منها")
     print("=" * 60)
 
 if __name__ == "__main__":
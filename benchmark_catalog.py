@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""قياس أداء مراحل خط معالجة الكتالوج على متاجر تجريبية بأحجام مختلفة
+
+كل مرحلة تُقاس بالزمن (أفضل تكرار) وبذروة الذاكرة (tracemalloc في تشغيل
+منفصل حتى لا يؤثر على الزمن)، وتُكتب النتائج في ملف JSON للمقارنة بين
+الإصدارات عبر --compare.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+from eishro_catalog import assign_badges, calculate_badge
+from eishro_catalog.badges import np
+from eishro_catalog.columnar import encode_columns, load_columns
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.publish import encode_store, write_atomic
+from eishro_catalog.store_io import StoreReader
+from eishro_catalog.synthetic import synthetic_store, write_ts_module
+from eishro_catalog.ts_literal import iter_ts_products
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+RESULTS_VERSION = 1
+
+
+def stage_generate(ctx):
+    ctx['store'] = synthetic_store(ctx['size'], seed=ctx['seed'])
+
+
+def stage_calculate_badge(ctx):
+    for product in ctx['store']['products']:
+        calculate_badge(product)
+
+
+def stage_assign_badges(ctx):
+    assign_badges(ctx['store']['products'])
+
+
+def stage_save_json(ctx):
+    write_atomic(ctx['json_path'], encode_store(ctx['store']), skip_unchanged=False)
+
+
+def stage_load_json(ctx):
+    with open(ctx['json_path'], 'r', encoding='utf-8') as f:
+        json.load(f)
+
+
+def stage_stream_read(ctx):
+    with StoreReader(ctx['json_path']) as reader:
+        for _ in reader.products():
+            pass
+
+
+def stage_columns_write(ctx):
+    write_atomic(ctx['columns_path'], encode_columns(ctx['store']['products']), skip_unchanged=False)
+
+
+def stage_columns_read(ctx):
+    with load_columns(ctx['columns_path']) as columns:
+        sum(columns.columns['price'])
+
+
+def stage_ts_write(ctx):
+    with open(ctx['ts_path'], 'w', encoding='utf-8') as f:
+        write_ts_module(f, ctx['store']['products'])
+
+
+def stage_ts_extract(ctx):
+    for _ in iter_ts_products(ctx['ts_path']):
+        pass
+
+
+# بالترتيب: كل مرحلة قد تعتمد على ناتج ما قبلها
+STAGES = (
+    ('generate', stage_generate),
+    ('calculate_badge', stage_calculate_badge),
+    ('assign_badges', stage_assign_badges),
+    ('save_json', stage_save_json),
+    ('load_json', stage_load_json),
+    ('stream_read', stage_stream_read),
+    ('columns_write', stage_columns_write),
+    ('columns_read', stage_columns_read),
+    ('ts_write', stage_ts_write),
+    ('ts_extract', stage_ts_extract),
+)
+
+# ما تحتاجه كل مرحلة من مراحل سابقة (تُشغَّل بدون قياس إن لم تُطلب في --stages)
+STAGE_REQUIRES = {
+    'calculate_badge': ('generate',),
+    'assign_badges': ('generate',),
+    'save_json': ('generate',),
+    'load_json': ('save_json',),
+    'stream_read': ('save_json',),
+    'columns_write': ('generate',),
+    'columns_read': ('columns_write',),
+    'ts_write': ('generate',),
+    'ts_extract': ('ts_write',),
+}
+
+
+def stage_plan(names=None):
+    """[(الاسم، الدالة، هل تُقاس)] بترتيب STAGES: المراحل المطلوبة وكل ما تعتمد عليه"""
+    if not names:
+        return [(name, stage, True) for name, stage in STAGES]
+    needed = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending.extend(STAGE_REQUIRES.get(name, ()))
+    return [(name, stage, name in names) for name, stage in STAGES if name in needed]
+
+
+def measure(stage, ctx, repeat, memory):
+    """تشغيل مرحلة وإرجاع (أفضل زمن بالثواني، ذروة الذاكرة بالبايت أو None)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stage(ctx)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            stage(ctx)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+
+def run_size(size, args, workdir):
+    """قياس المراحل المطلوبة لحجم واحد (بعد تشغيل ما تحتاجه بدون قياس)"""
+    ctx = {
+        'size': size,
+        'seed': args.seed,
+        'json_path': os.path.join(workdir, f'store-{size}.json'),
+        'columns_path': os.path.join(workdir, f'store-{size}.columns.bin'),
+        'ts_path': os.path.join(workdir, f'products-{size}.ts'),
+    }
+    results = []
+    for name, stage, timed in stage_plan(args.stages):
+        if not timed:
+            stage(ctx)
+            continue
+        seconds, peak = measure(stage, ctx, args.repeat, not args.no_memory)
+        result = {'size': size, 'stage': name, 'seconds': round(seconds, 6), 'peak_bytes': peak}
+        if name in ('save_json', 'columns_write', 'ts_write'):
+            path = ctx[{'save_json': 'json_path', 'columns_write': 'columns_path', 'ts_write': 'ts_path'}[name]]
+            result['file_bytes'] = os.path.getsize(path)
+        results.append(result)
+        memory = f"{peak / 1048576:9.1f} MB" if peak is not None else ''
+        print(f"  {name:<16} {seconds:10.4f} s  {size / seconds if seconds else 0:14,.0f} منتج/ث  {memory}")
+    for key in ('json_path', 'columns_path', 'ts_path'):
+        if os.path.exists(ctx[key]):
+            os.remove(ctx[key])
+    return results
+
+
+def environment():
+    """وصف بيئة القياس ليُحفظ مع النتائج"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__ if np is not None else None,
+        'commit': commit,
+    }
+
+
+def compare(results, baseline_path):
+    """طباعة نسبة الزمن الحالي إلى زمن ملف نتائج سابق"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {(r['size'], r['stage']): r for r in baseline.get('results', [])}
+    print("\nمقارنة مع", baseline_path, f"({baseline.get('environment', {}).get('commit')})")
+    for result in results:
+        old = previous.get((result['size'], result['stage']))
+        if not old or not old['seconds']:
+            continue
+        ratio = result['seconds'] / old['seconds']
+        marker = '⚠️' if ratio > 1.2 else '  '
+        print(f"{marker} {result['size']:>9,} {result['stage']:<16} {old['seconds']:10.4f} → {result['seconds']:10.4f} s  (×{ratio:.2f})")
+
+
+def parse_sizes(text):
+    return [int(size.replace('_', '')) for size in text.split(',') if size.strip()]
+
+
+def main(argv=None):
+    """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="قياس أداء خط معالجة الكتالوج")
+    parser.add_argument('--sizes', type=parse_sizes, default=list(DEFAULT_SIZES),
+                        help="أحجام المتاجر مفصولة بفواصل (مثلاً 1000,10000,1000000)")
+    parser.add_argument('--stages', type=lambda text: text.split(','), default=None,
+                        help="قياس مراحل محددة فقط: " + ','.join(name for name, _ in STAGES))
+    parser.add_argument('--repeat', type=int, default=1, help="عدد التكرارات لكل مرحلة (يُؤخذ الأسرع)")
+    parser.add_argument('--seed', type=int, default=0, help="بذرة توليد المنتجات")
+    parser.add_argument('--no-memory', action='store_true', help="عدم قياس ذروة الذاكرة")
+    parser.add_argument('--output', default='benchmark_results.json', help="ملف النتائج")
+    parser.add_argument('--compare', metavar='BASELINE', help="مقارنة مع ملف نتائج سابق")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.stages or () if name not in dict(STAGES)]
+    if unknown:
+        parser.error(f"مراحل غير معروفة: {', '.join(unknown)}")
+
+    print("=" * 60)
+    print("قياس أداء خط معالجة الكتالوج")
+    print("=" * 60)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='eishro-bench-') as workdir:
+        for size in args.sizes:
+            print(f"\n📦 {size:,} منتج")
+            results.extend(run_size(size, args, workdir))
+
+    report = {
+        'version': RESULTS_VERSION,
+        'environment': environment(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 النتائج في {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
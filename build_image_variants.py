@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import os
+
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.images import (
+    DEFAULT_FORMATS,
+    DEFAULT_WIDTHS,
+    IMAGES_MANIFEST_NAME,
+    RASTER_EXTENSIONS,
+    encode_variants,
+    load_meta,
+    local_path,
+    manifest_entry,
+    missing_formats,
+    source_digest,
+    store_image_refs,
+    supported_formats,
+    variant_dir,
+)
+from eishro_catalog.publish import mirror_artifact, mirror_file, write_artifact
+from eishro_catalog.stores import (
+    ASSETS_DIR,
+    DIST_ASSETS_DIR,
+    add_workers_argument,
+    discover_stores,
+    dist_store_path,
+    store_display_name,
+    store_path,
+)
+from eishro_catalog.timing import add_timing_arguments, effective_workers, instrumented, timed
+
+def comma_list(text):
+    return [item.strip() for item in text.split(',') if item.strip()]
+
+def collect_sources(folders):
+    """روابط الصور لكل متجر، ومسار كل صورة محلية موجودة"""
+    refs = {}
+    sources = {}
+    missing = set()
+    for folder in folders:
+        with timed('load', folder), open(store_path(folder), 'r', encoding='utf-8') as f:
+            refs[folder] = store_image_refs(json.load(f))
+        for url in refs[folder]:
+            path = local_path(url)
+            if not url.lower().endswith(RASTER_EXTENSIONS):
+                continue
+            if os.path.isfile(path):
+                sources[url] = path
+            else:
+                missing.add(url)
+    return refs, sources, missing
+
+def encode_pending(pending, widths, workers):
+    """ترميز الصيغ الناقصة في مجمع عمليات: pending {بصمة: (مسار، صيغ، meta)} ← {بصمة: meta}"""
+    results = {}
+    if not pending:
+        return results
+    if workers == 1 or len(pending) == 1:
+        for digest, (path, formats, meta) in pending.items():
+            try:
+                results[digest] = encode_variants(path, digest, ASSETS_DIR, widths, formats, meta=meta)
+            except Exception as e:
+                print(f"❌ {path}: {type(e).__name__}: {e}")
+        return results
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            digest: pool.submit(encode_variants, path, digest, ASSETS_DIR, widths, formats, meta=meta)
+            for digest, (path, formats, meta) in pending.items()
+        }
+        for digest, future in futures.items():
+            try:
+                results[digest] = future.result()
+            except Exception as e:
+                print(f"❌ {pending[digest][0]}: {type(e).__name__}: {e}")
+    return results
+
+def mirror_variants(digest, meta):
+    """نسخ ملفات نسخ صورة إلى dist"""
+    source_dir = variant_dir(digest, ASSETS_DIR)
+    target_dir = variant_dir(digest, DIST_ASSETS_DIR)
+    for variants in meta['variants'].values():
+        for variant in variants:
+            name = variant['url'].rsplit('/', 1)[1]
+            mirror_file(os.path.join(source_dir, name), os.path.join(target_dir, name))
+
+def write_manifest(folder, urls, entries):
+    """كتابة store.images.json ونسخه المضغوطة بجانب store.json ونسخها إلى dist"""
+    manifest = {'format': 1, 'images': {url: entries[url] for url in urls if url in entries}}
+    path = os.path.join(os.path.dirname(store_path(folder)), IMAGES_MANIFEST_NAME)
+    written = write_artifact(path, json.dumps(manifest, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    mirror_artifact(path, os.path.join(os.path.dirname(dist_store_path(folder)), IMAGES_MANIFEST_NAME))
+    return written, len(manifest['images'])
+
+def main(argv=None):
+    """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="إنشاء نسخ WebP/AVIF متجاوبة لصور المنتجات في store.json")
+    parser.add_argument('--stores', type=comma_list, default=None,
+                        help="متاجر محددة مفصولة بفواصل (الافتراضي: كل المتاجر)")
+    parser.add_argument('--widths', type=lambda text: sorted(int(w) for w in comma_list(text)),
+                        default=list(DEFAULT_WIDTHS), help="العروض بالبكسل مفصولة بفواصل")
+    parser.add_argument('--formats', type=comma_list, default=list(DEFAULT_FORMATS),
+                        help="الصيغ مفصولة بفواصل (webp,avif)")
+    parser.add_argument('--force', action='store_true', help="إعادة ترميز كل الصور وتجاهل الذاكرة")
+    add_workers_argument(parser)
+    add_timing_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with instrumented(args):
+        run(args)
+
+def run(args):
+    """جمع الصور، ترميز الجديد منها، وكتابة ملفات النسخ لكل متجر"""
+    formats = [fmt for fmt in args.formats if fmt in supported_formats(args.formats)]
+    if formats != args.formats:
+        unsupported = [fmt for fmt in args.formats if fmt not in formats]
+        print(f"⚠️  صيغ غير مدعومة في هذه البيئة: {', '.join(unsupported)} (تتطلب Pillow: pip install pillow)")
+    if not formats:
+        print("❌ لا توجد صيغة مطلوبة يمكن ترميزها، لم يُكتب شيء")
+        return
+
+    folders = args.stores or discover_stores()
+    refs, sources, missing = collect_sources(folders)
+    print(f"🖼️  صور مستخدمة: {len(sources)} (مفقودة: {len(missing)})")
+
+    from concurrent.futures import ThreadPoolExecutor
+    with timed('hash'), ThreadPoolExecutor(max_workers=args.workers) as pool:
+        digests = dict(zip(sources, pool.map(source_digest, sources.values())))
+
+    metas = {}
+    pending = {}
+    for url, digest in digests.items():
+        if digest in metas or digest in pending:
+            continue
+        meta = None if args.force else load_meta(digest, ASSETS_DIR, args.widths)
+        needed = missing_formats(meta, formats)
+        if needed:
+            pending[digest] = (sources[url], needed, meta)
+        else:
+            metas[digest] = meta
+    print(f"♻️  من الذاكرة: {len(metas)}، للترميز: {len(pending)}")
+
+    with timed('encode'):
+        metas.update(encode_pending(pending, args.widths, effective_workers(args)))
+
+    with timed('write'):
+        for digest, meta in metas.items():
+            mirror_variants(digest, meta)
+        entries = {
+            url: manifest_entry(metas[digest], args.formats)
+            for url, digest in digests.items() if digest in metas
+        }
+        for folder in folders:
+            written, count = write_manifest(folder, refs[folder], entries)
+            status = '✅' if written else '⏭️ '
+            print(f"{status} {store_display_name(folder)}: {count} صورة في {IMAGES_MANIFEST_NAME}")
+
+    for url in sorted(missing):
+        print(f"   ⚠️  غير موجودة: {url}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.health import combine_reports, store_health, write_health_csv, write_health_json
+from eishro_catalog.stores import (
+    add_workers_argument,
+    discover_stores,
+    run_per_store,
+    store_display_name,
+    store_path,
+)
+
+def store_report(folder, listing=False):
+    """تقرير متجر واحد (يعمل في عملية منفصلة)"""
+    return store_health(folder, store_path(folder), listing)
+
+def print_listing(report):
+    """طباعة منتجات متجر سطراً سطراً"""
+    print(f"\n🔍 منتجات {store_display_name(report['store'])}:")
+    print('=' * 80)
+    for product in report['listing']:
+        status = '✅' if product['quantity'] > 0 else '❌'
+        print(f"{status} {str(product['name'])[:35]:35} | الكمية: {product['quantity']:2} | الشارة: {product['badge']}")
+    print('=' * 80)
+
+def print_table(reports, total):
+    """جدول ملخص لكل المتاجر"""
+    print(f"{'المتجر':<14}{'المنتجات':>9}{'متوفر':>8}{'منخفض':>8}{'نافد':>7}{'مخفض':>7}{'حقول ناقصة':>12}  الشارة الأكثر")
+    print('-' * 80)
+    for report in reports + [dict(total, store='الإجمالي')]:
+        stock = report['stock']
+        top_badge = next(iter(report['badges']), '-')
+        name = store_display_name(report['store'])
+        print(f"{name:<14}{report['products']:>9}{stock.get('in_stock', 0):>8}{stock.get('low_stock', 0):>8}"
+              f"{stock.get('out_of_stock', 0):>7}{sum(report['discounts'].values()):>7}"
+              f"{sum(report['missing'].values()):>12}  {top_badge}")
+    
+    print("\nتوزيع الشارات:")
+    for badge, count in total['badges'].items():
+        print(f"   • {badge}: {count}")
+    if total['discounts']:
+        print("\nنسب التخفيض:")
+        for bucket, count in total['discounts'].items():
+            print(f"   • {bucket}: {count}")
+    if total['missing']:
+        print("\nحقول ناقصة:")
+        for field, count in total['missing'].items():
+            print(f"   • {field}: {count}")
+
+def main(argv=None):
+    """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="تقرير صحة الكتالوج لكل المتاجر في تمريرة واحدة")
+    parser.add_argument('--stores', type=lambda text: text.split(','), default=None,
+                        help="متاجر محددة مفصولة بفواصل (الافتراضي: كل المتاجر)")
+    parser.add_argument('--products', action='store_true', help="طباعة كل منتج سطراً سطراً")
+    parser.add_argument('--json', metavar='PATH', help="كتابة التقرير بصيغة JSON")
+    parser.add_argument('--csv', metavar='PATH', help="كتابة التقرير بصيغة CSV")
+    add_workers_argument(parser)
+    args = parser.parse_args(argv)
+    
+    folders = args.stores or discover_stores()
+    tasks = [(folder, args.products) for folder in folders]
+    
+    reports = []
+    for result in run_per_store(store_report, tasks, args.workers):
+        if result.error:
+            print(f"❌ متجر {store_display_name(result.folder)}: {result.error}")
+            continue
+        reports.append(result.value)
+    total = combine_reports(reports)
+    
+    if args.products:
+        for report in reports:
+            print_listing(report)
+        print()
+    
+    print("=" * 80)
+    print("📊 تقرير صحة الكتالوج")
+    print("=" * 80)
+    print_table(reports, total)
+    
+    if args.json:
+        write_health_json(args.json, reports, total)
+        print(f"\n💾 JSON: {args.json}")
+    if args.csv:
+        write_health_csv(args.csv, reports, total)
+        print(f"💾 CSV: {args.csv}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import sys
+
+from eishro_catalog.asset_refs import AssetIndex, check_store_refs
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.stores import ASSETS_DIR, discover_stores, store_display_name, store_path
+from eishro_catalog.timing import add_timing_arguments, instrumented, timed
+
+def check_stores(folders, index):
+    """تقرير كل متجر: {'store', 'references', 'missing'}"""
+    reports = []
+    for folder in folders:
+        with timed('load', folder), open(store_path(folder), 'r', encoding='utf-8') as f:
+            store_data = json.load(f)
+        with timed('check', folder):
+            total, missing = check_store_refs(store_data, index)
+        reports.append({'store': folder, 'references': total, 'missing': missing})
+    return reports
+
+def print_report(reports, limit):
+    """طباعة الروابط المفقودة مجمعة بالمتجر"""
+    for report in reports:
+        missing = report['missing']
+        name = store_display_name(report['store'])
+        if not missing:
+            print(f"✅ {name}: {report['references']} رابط، كلها موجودة")
+            continue
+        print(f"❌ {name}: {len(missing)} رابط مفقود من {report['references']}")
+        for item in missing[:limit]:
+            hint = f"  ← هل تقصد {item['suggestion']}؟" if item['suggestion'] else ''
+            print(f"   • {item['field']}: {item['ref']}{hint}")
+        if len(missing) > limit:
+            print(f"   … و {len(missing) - limit} أخرى")
+
+def main(argv=None):
+    """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="التحقق من وجود كل ملفات /assets/ المستخدمة في store.json")
+    parser.add_argument('--stores', type=lambda text: text.split(','), default=None,
+                        help="متاجر محددة مفصولة بفواصل (الافتراضي: كل المتاجر)")
+    parser.add_argument('--limit', type=int, default=20, help="أقصى عدد روابط مفقودة يُطبع لكل متجر")
+    parser.add_argument('--json', metavar='PATH', help="كتابة التقرير الكامل بصيغة JSON")
+    parser.add_argument('--strict', action='store_true', help="إنهاء برمز 1 إن وُجد رابط مفقود")
+    add_timing_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with instrumented(args):
+        with timed('index'):
+            index = AssetIndex(ASSETS_DIR)
+        print(f"📁 ملفات الأصول: {len(index)}")
+        reports = check_stores(args.stores or discover_stores(), index)
+        print_report(reports, args.limit)
+
+    missing_count = sum(len(report['missing']) for report in reports)
+    print(f"\n🔗 الروابط: {sum(report['references'] for report in reports)}، المفقودة: {missing_count}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+        print(f"💾 JSON: {args.json}")
+    if args.strict and missing_count:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -1,31 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+"""فحص منتجات نواعم سطراً سطراً (اختصار لـ catalog_health.py)"""
 
-import json
-import sys
-import io
+from catalog_health import main
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-with open('public/assets/nawaem/store.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
-
-print('🔍 فحص منتجات نواعم (عينة):')
-print('=' * 80)
-
-unavailable = []
-for product in data['products']:
-    quantity = product.get('quantity', 0)
-    badge = product.get('badge', 'جديد')
-    if badge == 'غير متوفر':
-        status = '⚠️'
-        unavailable.append(product)
-    else:
-        status = '✅'
-    print(f'{status} {product["name"][:35]:35} | الكمية: {quantity:2} | الشارة: {badge}')
-
-print('=' * 80)
-if unavailable:
-    print(f'\n⚠️  المنتجات غير المتوفرة ({len(unavailable)}):')
-    for product in unavailable:
-        print(f'   • {product["name"]} - الكمية: {product.get("quantity", 0)}')
+if __name__ == '__main__':
+    main(['--stores', 'nawaem', '--products', '--workers', '1'])
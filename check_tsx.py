@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import subprocess
+import sys
+
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.stores import add_workers_argument
+from eishro_catalog.timing import add_timing_arguments, effective_workers, instrumented, timed
+from eishro_catalog.tsx_balance import (
+    Imbalance,
+    check_file,
+    check_source,
+    file_signature,
+    load_check_cache,
+    save_check_cache,
+    source_paths,
+    uses_jsx,
+)
+
+# أقل عدد ملفات يستحق تكلفة تشغيل مجمع العمليات
+PARALLEL_THRESHOLD = 16
+
+def check_one(path, blob=None):
+    """فحص ملف (أو نسخته في الـ index إن مُرر blob) مع تحويل أخطاء القراءة إلى خلل يُبلّغ عنه"""
+    try:
+        if blob is None:
+            return check_file(path)
+        source = subprocess.run(['git', 'cat-file', 'blob', blob], check=True, capture_output=True).stdout
+        return check_source(source.decode('utf-8'), uses_jsx(path))
+    except (OSError, UnicodeDecodeError, subprocess.CalledProcessError) as e:
+        return Imbalance(1, 1, f"تعذرت قراءة الملف: {e}", None)
+
+def check_files(paths, workers, blobs=None):
+    """{مسار: Imbalance أو None} لكل الملفات، بالتوازي إن كانت كثيرة"""
+    blobs = [blobs[path] for path in paths] if blobs is not None else [None] * len(paths)
+    if workers == 1 or len(paths) < PARALLEL_THRESHOLD:
+        return {path: check_one(path, blob) for path, blob in zip(paths, blobs)}
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(paths, pool.map(check_one, paths, blobs, chunksize=8)))
+
+def staged_blobs():
+    """{مسار: معرف blob} لملفات TS/TSX المضافة أو المعدلة في الـ index (لخطاف pre-commit)
+
+    المحتوى يُقرأ من الـ index لا من شجرة العمل، فيُفحص ما سيدخل الـ commit فعلاً.
+    """
+    output = subprocess.run(
+        ['git', 'diff', '--cached', '--name-only', '-z', '--diff-filter=ACMR', '--', '*.ts', '*.tsx'],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    paths = [path for path in output.split('\0') if path]
+    if not paths:
+        return {}
+    output = subprocess.run(
+        ['git', 'ls-files', '--stage', '-z', '--'] + paths,
+        check=True, capture_output=True, text=True,
+    ).stdout
+    blobs = {}
+    for entry in output.split('\0'):
+        if entry:
+            info, path = entry.split('\t', 1)
+            blobs[path] = info.split()[1]
+    return blobs
+
+def main(argv=None):
+    """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="فحص توازن الأقواس ووسوم JSX في ملفات TS/TSX")
+    parser.add_argument('paths', nargs='*', default=['src'], help="ملفات أو مجلدات (الافتراضي: src)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="إعادة فحص الملفات التي تغيرت منذ آخر تشغيل فقط")
+    parser.add_argument('--staged', action='store_true',
+                        help="فحص نسخ الملفات المضافة إلى git في الـ index (لخطاف pre-commit)")
+    add_workers_argument(parser)
+    add_timing_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with instrumented(args):
+        problems = run(args)
+    if problems:
+        sys.exit(1)
+
+def run(args):
+    """فحص الملفات وطباعة الخلل بصيغة مسار:سطر:عمود، وإرجاع عدد الملفات المعطوبة"""
+    blobs = staged_blobs() if args.staged else None
+    paths = sorted(blobs) if blobs is not None else source_paths(args.paths)
+    cache = load_check_cache() if args.incremental else None
+
+    with timed('scan'):
+        # في وضع --staged معرف الـ blob هو توقيع المحتوى
+        signatures = {
+            path: ['blob', blobs[path]] if blobs is not None else file_signature(path)
+            for path in paths
+        }
+        results = {}
+        pending = []
+        for path in paths:
+            entry = cache['files'].get(path) if cache is not None else None
+            if entry is not None and entry[0] == signatures[path]:
+                results[path] = Imbalance(*entry[1]) if entry[1] else None
+            else:
+                pending.append(path)
+
+    with timed('check'):
+        results.update(check_files(pending, effective_workers(args), blobs))
+
+    if cache is not None:
+        for path in pending:
+            cache['files'][path] = [signatures[path], list(results[path]) if results[path] else None]
+        save_check_cache(cache)
+
+    problems = 0
+    for path in paths:
+        problem = results[path]
+        if problem is None:
+            continue
+        problems += 1
+        component = f" [{problem.component}]" if problem.component else ''
+        print(f"❌ {path}:{problem.line}:{problem.column}{component} {problem.message}")
+
+    print(f"{'✅' if not problems else '⚠️ '} فُحص {len(pending)} ملفاً من {len(paths)}، ملفات فيها خلل: {problems}")
+    return problems
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import os
+
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.dedup import (
+    asset_url,
+    choose_canonical,
+    count_references,
+    find_duplicates,
+    link_duplicate,
+    rewrite_references,
+    wasted_bytes,
+)
+from eishro_catalog.publish import publish_store
+from eishro_catalog.stores import ASSETS_DIR, add_workers_argument, discover_stores, store_display_name, store_path
+
+def load_stores():
+    """كل ملفات store.json: {متجر: بياناته}"""
+    stores = {}
+    for folder in discover_stores():
+        with open(store_path(folder), 'r', encoding='utf-8') as f:
+            stores[folder] = json.load(f)
+    return stores
+
+def store_references(stores):
+    """عدد مرات استخدام كل رابط /assets/ في ملفات المتاجر"""
+    counts = {}
+    for store_data in stores.values():
+        count_references(store_data, counts)
+    return counts
+
+def format_size(size):
+    """حجم مقروء"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+def hardlink_groups(plan):
+    """استبدال النسخ الزائدة بروابط صلبة للنسخة الأساسية"""
+    linked = 0
+    for canonical, duplicates in plan:
+        for path in duplicates:
+            try:
+                linked += link_duplicate(canonical, path)
+            except OSError as e:
+                print(f"⚠️  تعذر ربط {path}: {e}")
+    print(f"🔗 عدد الملفات التي استُبدلت بروابط صلبة: {linked}")
+
+def rewrite_stores(plan, stores):
+    """توجيه روابط الصور في store.json إلى النسخة الأساسية ونشر المتاجر التي تغيرت"""
+    mapping = {}
+    for canonical, duplicates in plan:
+        target = asset_url(canonical, ASSETS_DIR)
+        if target is None:
+            continue
+        for path in duplicates:
+            url = asset_url(path, ASSETS_DIR)
+            if url is not None:
+                mapping[url] = target
+
+    for folder, store_data in stores.items():
+        updated, count = rewrite_references(store_data, mapping)
+        if count:
+            publish_store(folder, updated)
+            stores[folder] = updated
+            print(f"✏️  {store_display_name(folder)}: أُعيد توجيه {count} رابطاً")
+
+def main(argv=None):
+    """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="إيجاد الملفات المكررة في الأصول وإزالة تكرارها")
+    parser.add_argument('roots', nargs='*', default=[ASSETS_DIR, 'DATA_FILES'],
+                        help="المجلدات المفحوصة (الافتراضي: public/assets و DATA_FILES)")
+    parser.add_argument('--min-size', type=int, default=1, help="تجاهل الملفات الأصغر من هذا الحجم بالبايت")
+    parser.add_argument('--hardlink', action='store_true', help="استبدال النسخ الزائدة بروابط صلبة")
+    parser.add_argument('--rewrite', action='store_true',
+                        help="توجيه روابط الصور في store.json إلى النسخة الأساسية")
+    parser.add_argument('--report', metavar='PATH', help="كتابة المجموعات المكررة بصيغة JSON")
+    add_workers_argument(parser)
+    args = parser.parse_args(argv)
+
+    roots = [root for root in args.roots if os.path.isdir(root)]
+    print(f"🔍 فحص: {', '.join(roots)}")
+    groups = find_duplicates(roots, args.workers, args.min_size)
+    stores = load_stores()
+    references = store_references(stores)
+
+    plan = []
+    total_wasted = 0
+    for group in groups:
+        canonical = choose_canonical(group, ASSETS_DIR, references)
+        plan.append((canonical, [path for path in group if path != canonical]))
+        total_wasted += wasted_bytes(group)
+
+    print(f"📦 مجموعات مكررة: {len(groups)} ({sum(len(d) for _, d in plan)} نسخة زائدة)")
+    print(f"💾 مساحة مهدرة: {format_size(total_wasted)}")
+    for canonical, duplicates in sorted(plan, key=lambda item: -os.path.getsize(item[0]))[:10]:
+        print(f"   • {canonical} ({format_size(os.path.getsize(canonical))}) ← {len(duplicates)} نسخة")
+
+    if args.report:
+        report = [
+            {'canonical': canonical, 'duplicates': duplicates, 'size': os.path.getsize(canonical)}
+            for canonical, duplicates in plan
+        ]
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📝 التقرير: {args.report}")
+
+    if args.rewrite:
+        rewrite_stores(plan, stores)
+    if args.hardlink:
+        hardlink_groups(plan)
+
+if __name__ == '__main__':
+    main()
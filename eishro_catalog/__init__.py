@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""أدوات مشتركة لمعالجة كتالوجات المتاجر (store.json)
+
+الأسماء أدناه تُستورد عند أول استخدام فقط، حتى لا يدفع أمر سريع مثل
+`eishro verify` ثمن استيراد numpy الذي يحتاجه محرك الشارات.
+"""
+
+_BADGE_EXPORTS = (
+    'BADGE_COLORS',
+    'BADGE_FIELDS',
+    'LOW_STOCK_THRESHOLD',
+    'assign_badges',
+    'calculate_badge',
+    'calculate_badges',
+    'catalog_columns',
+    'get_badge_color',
+)
+
+__all__ = list(_BADGE_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _BADGE_EXPORTS:
+        from . import badges
+        return getattr(badges, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""التحقق من أن روابط /assets/... في store.json تشير إلى ملفات موجودة
+
+public/assets يُمسح مرة واحدة إلى مجموعة روابط في الذاكرة، ثم يُفحص كل رابط
+من كل متجر بعملية بحث في المجموعة بدل استدعاء os.path.exists لكل رابط.
+للروابط المفقودة يُقترح أقرب ملف موجود: نفس الاسم بحالة أحرف مختلفة، أو
+نفس الاسم في مجلد آخر (sherine و sheirine)، أو أقرب اسم في نفس المجلد.
+"""
+
+import difflib
+import os
+from urllib.parse import unquote
+
+ASSETS_PREFIX = '/assets/'
+
+
+class AssetIndex:
+    """فهرس ملفات مجلد الأصول في الذاكرة"""
+
+    def __init__(self, assets_dir):
+        self.urls = set()
+        self.lower = {}
+        self.by_name = {}
+        self.by_dir = {}
+        stack = ['']
+        while stack:
+            relative = stack.pop()
+            try:
+                entries = os.scandir(os.path.join(assets_dir, relative))
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = f'{relative}/{entry.name}' if relative else entry.name
+                    if entry.is_dir():
+                        stack.append(name)
+                        continue
+                    url = ASSETS_PREFIX + name
+                    self.urls.add(url)
+                    self.lower.setdefault(url.lower(), url)
+                    self.by_name.setdefault(entry.name.lower(), []).append(url)
+                    # نفس مفتاح suggest (بدون / في آخره) حتى لملفات جذر الأصول
+                    self.by_dir.setdefault(url.rpartition('/')[0], []).append(entry.name)
+
+    def __len__(self):
+        return len(self.urls)
+
+    def __contains__(self, url):
+        return url in self.urls
+
+    def suggest(self, url):
+        """أقرب ملف موجود لرابط مفقود، أو None"""
+        match = self.lower.get(url.lower())
+        if match is not None:
+            return match
+        directory, _, name = url.rpartition('/')
+        same_name = self.by_name.get(name.lower())
+        if same_name:
+            return min(same_name, key=lambda candidate: _distance(candidate, url))
+        close = difflib.get_close_matches(name, self.by_dir.get(directory, ()), n=1, cutoff=0.6)
+        if close:
+            return f'{directory}/{close[0]}'
+        close = difflib.get_close_matches(name.lower(), self.by_name, n=1, cutoff=0.75)
+        if close:
+            return min(self.by_name[close[0]], key=lambda candidate: _distance(candidate, url))
+        return None
+
+
+def _distance(candidate, url):
+    return -difflib.SequenceMatcher(None, candidate, url).ratio()
+
+
+def normalize_ref(value):
+    """الرابط بدون ?query و #fragment وبعد فك ترميز %XX"""
+    for separator in ('?', '#'):
+        value = value.split(separator, 1)[0]
+    return unquote(value)
+
+
+def _field_path(keys):
+    path = ''
+    for key in keys:
+        path += f'[{key}]' if isinstance(key, int) else (f'.{key}' if path else key)
+    return path
+
+
+def check_store_refs(store_data, index):
+    """(عدد الروابط، [{'field', 'ref', 'suggestion'}]) لمتجر واحد
+
+    المسار النصي للحقل والاقتراح يُحسبان للروابط المفقودة فقط، والاقتراح مرة
+    واحدة لكل رابط مهما تكرر.
+    """
+    urls = index.urls
+    missing = []
+    suggestions = {}
+    keys = []
+    total = 0
+
+    def check(ref, key):
+        nonlocal total
+        total += 1
+        if ref in urls:
+            return
+        url = normalize_ref(ref)
+        if url in urls:
+            return
+        if url not in suggestions:
+            suggestions[url] = index.suggest(url)
+        missing.append({'field': _field_path(keys + [key]), 'ref': ref, 'suggestion': suggestions[url]})
+
+    # النصوص تُفحص داخل الحلقة بدون استدعاء دالة، فأغلب الحقول لا تكلف شيئاً
+    def visit(items):
+        for key, item in items:
+            if type(item) is str:
+                if item.startswith(ASSETS_PREFIX):
+                    check(item, key)
+            elif type(item) is dict:
+                keys.append(key)
+                visit(item.items())
+                keys.pop()
+            elif type(item) is list:
+                keys.append(key)
+                visit(enumerate(item))
+                keys.pop()
+
+    visit(store_data.items())
+    return total, missing
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""محرك الشارات: حساب شارات كتالوج كامل دفعة واحدة على شكل أعمدة"""
+
+try:
+    import numpy as np
+except ImportError:  # numpy اختياري، ونعود للحساب العمودي بلغة بايثون
+    np = None
+
+BADGE_FIELDS = ('quantity', 'price', 'originalPrice', 'orders', 'likes', 'views')
+
+LOW_STOCK_THRESHOLD = 5
+
+BADGE_COLORS = {
+    'جديد': 'bg-teal-600 text-white',
+    'أكثر مبيعاً': 'bg-red-500 text-white',
+    'أكثر إعجاباً': 'bg-yellow-500 text-black',
+    'مميزة': 'bg-yellow-800 text-white',
+    'أكثر مشاهدة': 'bg-blue-900 text-white',
+    'أكثر طلباً': 'bg-orange-500 text-white',
+    'تخفيضات': 'bg-pink-600 text-white',
+    'غير متوفر': 'bg-orange-700 text-white',
+    'متوفر': 'bg-green-500 text-white'
+}
+
+DEFAULT_BADGE_COLOR = 'bg-gray-500 text-white'
+
+
+def get_badge_color(badge):
+    """الحصول على لون الشارة"""
+    return BADGE_COLORS.get(badge, DEFAULT_BADGE_COLOR)
+
+
+def catalog_columns(products):
+    """تحويل قائمة المنتجات إلى أعمدة بالحقول التي تعتمد عليها الشارة"""
+    return {
+        field: [product.get(field) or 0 for product in products]
+        for field in BADGE_FIELDS
+    }
+
+
+def _calculate_badges_numpy(columns, low_stock_threshold):
+    quantity = np.asarray(columns['quantity'], dtype=np.float64)
+    price = np.asarray(columns['price'], dtype=np.float64)
+    original_price = np.asarray(columns['originalPrice'], dtype=np.float64)
+    orders = np.asarray(columns['orders'], dtype=np.float64)
+    likes = np.asarray(columns['likes'], dtype=np.float64)
+    views = np.asarray(columns['views'], dtype=np.float64)
+
+    has_original = original_price > 0
+    safe_original = np.where(has_original, original_price, 1.0)
+    discount = np.where(has_original, (original_price - price) / safe_original * 100, 0.0)
+
+    # ترتيب الشروط هو نفس أولوية القواعد، ويفوز أول شرط صحيح
+    conditions = [
+        quantity <= 0,
+        quantity < low_stock_threshold,
+        (original_price > price) & (discount > 10),
+        (orders > 100) & (likes > 200),
+        orders > 100,
+        likes > 200,
+        orders > 50,
+        views > 400,
+    ]
+    choices = [
+        'غير متوفر',
+        'متوفر',
+        'تخفيضات',
+        'مميزة',
+        'أكثر مبيعاً',
+        'أكثر إعجاباً',
+        'أكثر طلباً',
+        'أكثر مشاهدة',
+    ]
+    return np.select(conditions, choices, default='جديد').tolist()
+
+
+def _calculate_badges_python(columns, low_stock_threshold):
+    badges = []
+    append = badges.append
+    rows = zip(
+        columns['quantity'],
+        columns['price'],
+        columns['originalPrice'],
+        columns['orders'],
+        columns['likes'],
+        columns['views'],
+    )
+    for quantity, price, original_price, orders, likes, views in rows:
+        if quantity <= 0:
+            append('غير متوفر')
+        elif quantity < low_stock_threshold:
+            append('متوفر')
+        elif original_price > 0 and original_price > price and (original_price - price) / original_price * 100 > 10:
+            append('تخفيضات')
+        elif orders > 100 and likes > 200:
+            append('مميزة')
+        elif orders > 100:
+            append('أكثر مبيعاً')
+        elif likes > 200:
+            append('أكثر إعجاباً')
+        elif orders > 50:
+            append('أكثر طلباً')
+        elif views > 400:
+            append('أكثر مشاهدة')
+        else:
+            append('جديد')
+    return badges
+
+
+def calculate_badges(columns, low_stock_threshold=LOW_STOCK_THRESHOLD):
+    """حساب شارات جميع المنتجات من أعمدة الإحصائيات في تمريرة واحدة"""
+    if not columns['quantity']:
+        return []
+    if np is not None:
+        return _calculate_badges_numpy(columns, low_stock_threshold)
+    return _calculate_badges_python(columns, low_stock_threshold)
+
+
+def calculate_badge(product, low_stock_threshold=LOW_STOCK_THRESHOLD):
+    """حساب الشارة لمنتج واحد"""
+    return calculate_badges(catalog_columns([product]), low_stock_threshold)[0]
+
+
+def assign_badges(products, with_color=True, low_stock_threshold=LOW_STOCK_THRESHOLD):
+    """تعيين الشارة (ولونها) لكل المنتجات، وإرجاع عدد المنتجات التي تغيرت شارتها"""
+    badges = calculate_badges(catalog_columns(products), low_stock_threshold)
+    updated_count = 0
+    for product, badge in zip(products, badges):
+        if product.get('badge') != badge:
+            updated_count += 1
+        product['badge'] = badge
+        if with_color:
+            product['badgeColor'] = get_badge_color(badge)
+    return updated_count
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""الأمر الموحد `eishro` لأدوات الكتالوج
+
+كل أمر فرعي يستورد وحدته عند تشغيله فقط، فلا يدفع `eishro verify` ثمن
+استيراد numpy أو matplotlib. الأوامر تعمل على مجلد المشروع الحالي
+(public/assets و dist/assets و src/data).
+"""
+
+import importlib
+import sys
+
+# الأمر: (الوحدة التي فيها main(argv)، الوصف)
+COMMANDS = {
+    'badges': ('fix_badges', "حساب الشارات لكل المتاجر ونشرها"),
+    'verify': ('verify_badges', "عرض ملخص الشارات لكل متجر"),
+    'health': ('catalog_health', "تقرير صحة الكتالوج (JSON و CSV وجدول)"),
+    'fill': ('update_stores', "تعبئة الإحصائيات الناقصة في store.json"),
+    'extract': ('generate_store_json', "استخراج المنتجات من ملفات TS وتحديث المتاجر"),
+    'publish': ('publish_stores', "نسخ store.json إلى dist وتحديث ملفات الأعمدة"),
+    'tenant': ('generate_tenant', "توليد متاجر كبيرة مع بذور SQL/CSV لاختبار التحمل"),
+    'tsx': ('check_tsx', "فحص توازن الأقواس ووسوم JSX في ملفات src (مع --staged لخطاف pre-commit)"),
+    'section': ('remove_section', "حذف قسم من ملف مصدر بمراسي نصية أو حتى إغلاق البناء (معاينة ثم --apply)"),
+    'assets': ('check_assets', "التحقق من وجود ملفات /assets/ المستخدمة في store.json مع اقتراحات"),
+    'images': ('build_image_variants', "إنشاء نسخ WebP/AVIF متجاوبة لصور المنتجات (يتطلب Pillow)"),
+    'dedup': ('dedup_assets', "إيجاد الأصول المكررة وربطها أو توجيه روابطها لنسخة واحدة"),
+    'watch': ('watch_badges', "مراقبة store.json وإعادة حساب الشارات عند تغيره"),
+    'diagrams': ('create_diagrams', "إنشاء مخططات المعمارية (يتطلب matplotlib)"),
+}
+
+
+def usage():
+    lines = ["الاستخدام: eishro <أمر> [خيارات]", "", "الأوامر:"]
+    lines += [f"  {name:<10} {description}" for name, (_, description) in COMMANDS.items()]
+    lines += ["", "eishro <أمر> --help لعرض خيارات أمر محدد"]
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """تشغيل أمر فرعي (argparse يُستورد داخل الأمر نفسه فقط)"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ('-h', '--help'):
+        from .console import use_utf8_stdout
+        use_utf8_stdout()
+        print(usage())
+        return 0 if argv else 2
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"eishro: أمر غير معروف '{command}'\n\n{usage()}", file=sys.stderr)
+        return 2
+    module_name = COMMANDS[command][0]
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name == module_name:
+            raise
+        print(f"eishro {command}: يتطلب الحزمة '{e.name}' (pip install {e.name})", file=sys.stderr)
+        return 1
+    sys.argv[0] = f'eishro {command}'
+    return module.main(rest)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
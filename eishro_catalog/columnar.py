@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""ملف أعمدة ثنائي مرافق لـ store.json يُقرأ عبر mmap بدل تحليل JSON
+
+تخطيط الملف:
+    MAGIC (8 بايت) | طول الترويسة uint32 | ترويسة JSON | حشو حتى مضاعف 8 | بيانات الأعمدة
+
+الترويسة تصف كل عمود (النوع، الإزاحة، الطول بالبايت) وقواميس النصوص،
+وبصمة store.json الذي رُمّز منه (source) ليعرف القارئ إن كان الملف قديماً.
+الأرقام float64 والأعلام uint8 والنصوص المتكررة رموز uint32 تشير إلى قاموس،
+وكل عمود يبدأ عند إزاحة من مضاعفات 8 ليُقرأ مباشرة كـ memoryview.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+
+SIDECAR_NAME = 'store.columns.bin'
+
+MAGIC = b'ESCOLS01'
+
+NUMERIC_COLUMNS = ('price', 'originalPrice', 'rating', 'reviews', 'views', 'likes', 'orders', 'quantity')
+FLAG_COLUMNS = ('inStock', 'isAvailable')
+STRING_COLUMNS = ('category', 'badge', 'badgeColor')
+LIST_COLUMNS = ('sizes', 'tags')
+
+# أعلام "<الحقل>.present": هل للحقل قيمة (ليس غائباً ولا None ولا '' ولا [])
+PRESENCE_COLUMNS = (
+    'id', 'name', 'price', 'category', 'images', 'quantity',
+    'rating', 'reviews', 'views', 'likes', 'orders', 'badge', 'badgeColor',
+)
+
+# رموز array/memoryview لكل نوع عمود
+_TYPECODES = {'f8': 'd', 'i8': 'q', 'u1': 'B', 'u4': 'I'}
+
+
+def _as_number(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return 0.0
+    return float(value)
+
+
+class _Dictionary:
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+
+    def code(self, value):
+        value = '' if value is None else str(value)
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _present(value):
+    return not (value is None or value == '' or value == [])
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """بصمة محتوى ملف (نفس publish.content_hash) بقراءة على دفعات"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _little_endian(arr):
+    if sys.byteorder != 'little':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+class ColumnBuilder:
+    """بناء الأعمدة منتجاً منتجاً، لتدفق منتجات لا يُحمّل في الذاكرة كاملاً
+
+    لا يُحفظ من كل منتج إلا قيم أعمدته، و encode تعيد نفس بايتات encode_columns.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.ids = array('q')
+        self.id_dictionary = None
+        self.numbers = {name: array('d') for name in NUMERIC_COLUMNS}
+        self.flags = {name: array('B') for name in FLAG_COLUMNS}
+        self.strings = {name: (_Dictionary(), array('I')) for name in STRING_COLUMNS}
+        self.lists = {name: (_Dictionary(), array('I'), array('I', [0])) for name in LIST_COLUMNS}
+        self.present = {name: array('B') for name in PRESENCE_COLUMNS}
+
+    def add(self, product):
+        self.count += 1
+        product_id = product.get('id')
+        if self.id_dictionary is None and isinstance(product_id, int) and not isinstance(product_id, bool):
+            self.ids.append(product_id)
+        else:
+            if self.id_dictionary is None:
+                # أول معرف غير صحيح: كل المعرفات تصبح رموزاً في قاموس
+                self.id_dictionary = _Dictionary()
+                self.ids = array('I', map(self.id_dictionary.code, self.ids))
+            self.ids.append(self.id_dictionary.code(product_id))
+
+        # القيم الناقصة تُخزن صفراً، كما يفعل catalog_columns في محرك الشارات
+        for name, column in self.numbers.items():
+            column.append(_as_number(product.get(name)))
+        for name, column in self.flags.items():
+            column.append(1 if product.get(name) else 0)
+        for name, (dictionary, codes) in self.strings.items():
+            codes.append(dictionary.code(product.get(name)))
+        for name, (dictionary, codes, offsets) in self.lists.items():
+            values = product.get(name) or []
+            if isinstance(values, list):
+                codes.extend(dictionary.code(v) for v in values if not isinstance(v, (dict, list)))
+            offsets.append(len(codes))
+        for name, column in self.present.items():
+            column.append(1 if _present(product.get(name)) else 0)
+
+    def encode(self, source=None):
+        """بايتات ملف الأعمدة (source: بصمة store.json)"""
+        columns = {}
+        dictionaries = {}
+        if self.id_dictionary is None:
+            columns['id'] = ('i8', self.ids)
+        else:
+            columns['id'] = ('u4', self.ids)
+            dictionaries['id'] = self.id_dictionary.values
+        for name, column in self.numbers.items():
+            columns[name] = ('f8', column)
+        for name, column in self.flags.items():
+            columns[name] = ('u1', column)
+        for name, (dictionary, codes) in self.strings.items():
+            columns[name] = ('u4', codes)
+            dictionaries[name] = dictionary.values
+        for name, (dictionary, codes, offsets) in self.lists.items():
+            columns[name] = ('u4', codes)
+            columns[name + '.offsets'] = ('u4', offsets)
+            dictionaries[name] = dictionary.values
+        for name, column in self.present.items():
+            columns[name + '.present'] = ('u1', column)
+
+        layout = {}
+        blobs = []
+        offset = 0
+        for name, (kind, arr) in columns.items():
+            data = _little_endian(arr)
+            layout[name] = {'type': kind, 'offset': offset, 'length': len(data)}
+            padding = -len(data) % 8
+            blobs.append(data + b'\0' * padding)
+            offset += len(data) + padding
+
+        header = json.dumps(
+            {'count': self.count, 'source': source, 'columns': layout, 'dictionaries': dictionaries},
+            ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+        prefix = MAGIC + struct.pack('<I', len(header)) + header
+        prefix += b'\0' * (-len(prefix) % 8)
+        return prefix + b''.join(blobs)
+
+
+def encode_columns(products, source=None):
+    """ترميز منتجات متجر إلى بايتات ملف الأعمدة (source: بصمة store.json)"""
+    builder = ColumnBuilder()
+    for product in products:
+        builder.add(product)
+    return builder.encode(source)
+
+
+class StoreColumns:
+    """أعمدة متجر محملة عبر mmap بدون نسخ
+
+    columns[name] يعيد memoryview مكتوب النوع (أرقام float64، أعلام uint8،
+    رموز uint32 للنصوص). strings(name) تفك رموز عمود نصي، و counts(name)
+    تعد قيمه، و lists(name) تفك عموداً متعدد القيم مثل sizes.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:8] != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path}: ليس ملف أعمدة صالحاً")
+        if sys.byteorder != 'little':
+            self._mmap.close()
+            raise ValueError("ملف الأعمدة يُقرأ بدون نسخ على الأجهزة little-endian فقط")
+        (header_length,) = struct.unpack_from('<I', self._mmap, 8)
+        header = json.loads(self._mmap[12:12 + header_length].decode('utf-8'))
+        base = 12 + header_length
+        base += -base % 8
+        self.count = header['count']
+        self.source = header.get('source')
+        self.dictionaries = header['dictionaries']
+        self.columns = {}
+        buffer = memoryview(self._mmap)
+        for name, spec in header['columns'].items():
+            start = base + spec['offset']
+            view = buffer[start:start + spec['length']]
+            self.columns[name] = view.cast(_TYPECODES[spec['type']])
+
+    def strings(self, name):
+        """فك رموز عمود نصي إلى قائمة نصوص"""
+        values = self.dictionaries[name]
+        return [values[code] for code in self.columns[name]]
+
+    def counts(self, name):
+        """{القيمة: عدد المنتجات} لعمود نصي بترتيب أول ظهور"""
+        values = self.dictionaries[name]
+        return {values[code]: count for code, count in Counter(self.columns[name]).items()}
+
+    def missing(self, name):
+        """عدد المنتجات التي لا قيمة لها في الحقل name (انظر PRESENCE_COLUMNS)"""
+        return self.count - sum(self.columns[name + '.present'])
+
+    def lists(self, name):
+        """فك عمود متعدد القيم إلى قائمة قوائم"""
+        values = self.dictionaries[name]
+        codes = self.columns[name]
+        offsets = self.columns[name + '.offsets']
+        return [
+            [values[code] for code in codes[offsets[i]:offsets[i + 1]]]
+            for i in range(self.count)
+        ]
+
+    def close(self):
+        for view in self.columns.values():
+            view.release()
+        self.columns = {}
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_columns(path):
+    """تحميل ملف الأعمدة عبر mmap"""
+    return StoreColumns(path)
+
+
+def load_fresh_columns(store_json_path, required=()):
+    """ملف الأعمدة المرافق لـ store.json إن رُمّز من محتواه الحالي، وإلا None
+
+    يُرجع None أيضاً إن لم يوجد الملف أو كان من إصدار بلا source أو بلا
+    أعمدة required، فيرجع المستدعي إلى قراءة store.json نفسه.
+    """
+    try:
+        columns = load_columns(os.path.join(os.path.dirname(store_json_path), SIDECAR_NAME))
+    except (OSError, ValueError):
+        return None
+    try:
+        fresh = (columns.source is not None
+                 and all(name in columns.columns for name in required)
+                 and columns.source == file_hash(store_json_path))
+    except OSError:
+        fresh = False
+    if not fresh:
+        columns.close()
+        return None
+    return columns
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""نسخ مضغوطة مسبقاً (.gz و .br) لملفات الكتالوج المنشورة
+
+الاستضافة الثابتة تخدم الملف المضغوط مباشرة بدل ضغطه عند كل طلب. الضغط
+بأعلى المستويات، و gzip بدون طابع زمني فيكون الناتج حتمياً. خطوة النشر
+(publish.write_artifact) تكتب نسخ كل ملف يتغير، و precompress_store تملأ
+الناقص لكل ملفات المتجر مع ذاكرة بصمات تتخطى ما لم يتغير. brotli اختياري:
+بدونه تُكتب .gz فقط.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+
+try:
+    import brotli
+except ImportError:  # brotli اختياري (pip install brotli)
+    brotli = None
+
+from .columnar import SIDECAR_NAME
+from .images import IMAGES_MANIFEST_NAME
+from .pages import MANIFEST_NAME, PAGES_DIR
+from .publish import PATCHES_DIR, VERSIONS_NAME, mirror_file, open_atomic, write_atomic
+
+PRECOMPRESS_CACHE_PATH = '.precompress_cache.json'
+
+CACHE_VERSION = 1
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# حجم الدفعة عند ضغط ملف كبير متدفقاً
+CHUNK_SIZE = 1 << 20
+
+# ملفات الكتالوج في مجلد كل متجر (الصفحات والفروقات في مجلداتها)
+ARTIFACT_NAMES = ('store.json', SIDECAR_NAME, MANIFEST_NAME, VERSIONS_NAME, IMAGES_MANIFEST_NAME)
+ARTIFACT_DIRS = (PAGES_DIR, PATCHES_DIR)
+
+
+def compressed_formats():
+    """الصيغ المتاحة في هذه البيئة"""
+    return ('gz', 'br') if brotli is not None else ('gz',)
+
+
+def compress_bytes(data, fmt):
+    """ضغط البايتات بصيغة 'gz' أو 'br'"""
+    if fmt == 'gz':
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if fmt == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    raise ValueError(f"صيغة ضغط غير معروفة: {fmt}")
+
+
+class _BrotliWriter:
+    def __init__(self, f):
+        self.f = f
+        self.compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def write(self, data):
+        self.f.write(self.compressor.process(data))
+
+    def close(self):
+        self.f.write(self.compressor.finish())
+
+
+def _compressing_writer(f, fmt):
+    if fmt == 'gz':
+        return gzip.GzipFile(filename='', mode='wb', fileobj=f, compresslevel=GZIP_LEVEL, mtime=0)
+    if fmt == 'br':
+        return _BrotliWriter(f)
+    raise ValueError(f"صيغة ضغط غير معروفة: {fmt}")
+
+
+def has_compressed(path):
+    """هل لملف كل نسخه المضغوطة بالصيغ المتاحة؟"""
+    return all(os.path.exists(f'{path}.{fmt}') for fmt in compressed_formats())
+
+
+def write_compressed(path, data=None):
+    """كتابة path.gz و path.br (بالصيغ المتاحة) لملف كتالوج تغير
+
+    data محتوى الملف إن كان في الذاكرة، وإلا يُضغط الملف متدفقاً على دفعات
+    (store.json الكبير). النسخة بصيغة لم تعد متاحة تُحذف.
+    """
+    formats = compressed_formats()
+    for fmt in formats:
+        target = f'{path}.{fmt}'
+        if data is not None:
+            write_atomic(target, compress_bytes(data, fmt))
+            continue
+        with open(path, 'rb') as src, open_atomic(target) as out:
+            writer = _compressing_writer(out, fmt)
+            for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+                writer.write(chunk)
+            writer.close()
+    for fmt in ('gz', 'br'):
+        if fmt not in formats:
+            _remove(f'{path}.{fmt}')
+
+
+def catalog_artifacts(store_dir):
+    """أسماء ملفات الكتالوج الموجودة في مجلد متجر، نسبةً للمجلد"""
+    names = [name for name in ARTIFACT_NAMES if os.path.isfile(os.path.join(store_dir, name))]
+    for directory in ARTIFACT_DIRS:
+        try:
+            entries = sorted(os.listdir(os.path.join(store_dir, directory)))
+        except FileNotFoundError:
+            continue
+        names += [f'{directory}/{entry}' for entry in entries if entry.endswith('.json')]
+    return names
+
+
+def load_precompress_cache(path=PRECOMPRESS_CACHE_PATH):
+    """{'version', 'stores': {متجر: {ملف: بصمة}}}"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {'version': CACHE_VERSION, 'stores': {}}
+    if cache.get('version') != CACHE_VERSION:
+        return {'version': CACHE_VERSION, 'stores': {}}
+    return cache
+
+
+def save_precompress_cache(cache, path=PRECOMPRESS_CACHE_PATH):
+    """حفظ ذاكرة البصمات بكتابة ذرية"""
+    write_atomic(path, json.dumps(cache, ensure_ascii=False, indent=2).encode('utf-8'))
+
+
+def compressed_siblings(store_dir):
+    """النسخ المضغوطة الموجودة في مجلد متجر، نسبةً للمجلد"""
+    names = [
+        f'{name}.{fmt}' for name in ARTIFACT_NAMES for fmt in ('gz', 'br')
+        if os.path.isfile(os.path.join(store_dir, f'{name}.{fmt}'))
+    ]
+    for directory in ARTIFACT_DIRS:
+        try:
+            entries = sorted(os.listdir(os.path.join(store_dir, directory)))
+        except FileNotFoundError:
+            continue
+        names += [f'{directory}/{entry}' for entry in entries if entry.endswith(('.gz', '.br'))]
+    return names
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def precompress_store(store_dir, known=None, mirror_dir=None):
+    """كتابة النسخ المضغوطة لكل ملفات كتالوج المتجر
+
+    known: بصمات آخر تشغيل {ملف: بصمة}. الملف يُتخطى إن لم تتغير بصمته
+    ونسخه المضغوطة موجودة. النسخ المضغوطة لملفات لم تعد موجودة تُحذف.
+    مع mirror_dir تُنسخ النسخ المضغوطة إليه (مجلد dist). تُرجع
+    (البصمات الحالية، عدد الملفات التي ضُغطت، البايتات قبل، البايتات بعد).
+    """
+    known = known or {}
+    formats = compressed_formats()
+    hashes = {}
+    compressed = 0
+    raw_size = packed_size = 0
+    for name in catalog_artifacts(store_dir):
+        path = os.path.join(store_dir, name)
+        with open(path, 'rb') as f:
+            data = f.read()
+        key = hashlib.blake2b(data, digest_size=16).hexdigest() + ':' + ','.join(formats)
+        hashes[name] = key
+        targets = [f'{name}.{fmt}' for fmt in formats]
+        if known.get(name) != key or not all(os.path.exists(os.path.join(store_dir, t)) for t in targets):
+            for fmt, target in zip(formats, targets):
+                write_atomic(os.path.join(store_dir, target), compress_bytes(data, fmt))
+            compressed += 1
+        raw_size += len(data)
+        packed_size += os.path.getsize(os.path.join(store_dir, targets[-1]))
+        if mirror_dir is not None:
+            for target in targets:
+                mirror_file(os.path.join(store_dir, target), os.path.join(mirror_dir, target))
+
+    # نسخ مضغوطة يتيمة (صفحة أو فرق حُذف) أو بصيغة لم تعد متاحة
+    current = {f'{name}.{fmt}' for name in hashes for fmt in formats}
+    for directory in (store_dir, mirror_dir) if mirror_dir is not None else (store_dir,):
+        for target in compressed_siblings(directory):
+            if target not in current:
+                _remove(os.path.join(directory, target))
+    return hashes, compressed, raw_size, packed_size
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""إعداد مخرجات الطرفية للنصوص العربية والرموز"""
+
+import io
+import sys
+
+
+def use_utf8_stdout():
+    """جعل stdout بترميز UTF-8 (طرفيات ويندوز تستخدم cp1252 افتراضياً)
+
+    تُستدعى من main وليس عند الاستيراد، وآمنة إن استُدعيت أكثر من مرة.
+    """
+    if (sys.stdout.encoding or '').lower().replace('-', '') == 'utf8':
+        return
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except AttributeError:  # stdout مستبدل بكائن لا يدعم reconfigure
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
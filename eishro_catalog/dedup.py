@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""إيجاد ملفات الوسائط المتطابقة بايتاً ببايت في public/assets و DATA_FILES
+
+لا يُفحص إلا الصور والخطوط والفيديو وما شابهها: ملفات الكتالوج المولّدة
+(store.json والأعمدة والصفحات والرقع والبيانات المضغوطة والنسخ المتجاوبة)
+تتطابق أحياناً بين المتاجر لكنها ليست نسخاً زائدة يجوز ربطها أو حذفها.
+الملفات تُجمع بالحجم أولاً فلا يُحسب إلا ما له نظير بنفس الحجم، والملفات
+المرتبطة أصلاً (نفس inode) تُحسب مرة واحدة. الحساب في خيوط متوازية لأن
+hashlib يحرر قفل GIL أثناء التجزئة، والملفات الكبيرة تُقرأ عبر mmap.
+"""
+
+import hashlib
+import mmap
+import os
+
+from .pages import PAGES_DIR
+from .publish import PATCHES_DIR
+
+# الملفات الأكبر من هذا تُقرأ عبر mmap بدل تحميلها كاملة
+MMAP_THRESHOLD = 1 << 20
+
+CHUNK_SIZE = 1 << 20
+
+# '_variants' هو images.VARIANTS_DIR (images يستورد هذه الوحدة فلا نستورده هنا)
+SKIP_DIRS = ('.git', 'node_modules', '__pycache__', '_variants', PAGES_DIR, PATCHES_DIR)
+
+MEDIA_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.webp', '.avif', '.gif', '.svg', '.ico', '.bmp',
+    '.mp4', '.webm', '.mov', '.mp3', '.ttf', '.otf', '.woff', '.woff2', '.pdf',
+)
+
+
+def iter_files(roots, extensions=MEDIA_EXTENSIONS):
+    """ملفات الوسائط العادية تحت الجذور (بدون الروابط الرمزية والمجلدات المولّدة)"""
+    for root in roots:
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(name for name in dirnames if name not in SKIP_DIRS)
+            for name in sorted(filenames):
+                if not name.lower().endswith(extensions):
+                    continue
+                path = os.path.join(directory, name)
+                if not os.path.islink(path):
+                    yield path
+
+
+def file_digest(path):
+    """بصمة blake2b لمحتوى الملف"""
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                digest.update(view)
+        else:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_duplicates(roots, workers=None, min_size=1):
+    """مجموعات الملفات المتطابقة: [[مسار، ...]، ...] مرتبة
+
+    كل مجموعة فيها ملفان مختلفان (inode) أو أكثر بنفس المحتوى، وتشمل
+    الروابط الصلبة الموجودة لأي منهما.
+    """
+    by_size = {}
+    inodes = {}
+    for path in iter_files(roots):
+        stat = os.stat(path)
+        if stat.st_size < min_size:
+            continue
+        key = (stat.st_dev, stat.st_ino)
+        if key in inodes:
+            inodes[key].append(path)
+            continue
+        inodes[key] = [path]
+        by_size.setdefault(stat.st_size, []).append(key)
+
+    # أحجام لا يتكرر فيها إلا inode واحد لا تحتاج تجزئة
+    candidates = [key for keys in by_size.values() if len(keys) > 1 for key in keys]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = pool.map(file_digest, [inodes[key][0] for key in candidates])
+        by_digest = {}
+        for key, digest in zip(candidates, digests):
+            by_digest.setdefault(digest, []).append(key)
+
+    return sorted(
+        sorted(path for key in keys for path in inodes[key])
+        for keys in by_digest.values() if len(keys) > 1
+    )
+
+
+def wasted_bytes(group):
+    """المساحة التي تشغلها النسخ الزائدة في مجموعة (الروابط الصلبة لا تُحسب)"""
+    inodes = {}
+    for path in group:
+        stat = os.stat(path)
+        inodes[(stat.st_dev, stat.st_ino)] = stat.st_size
+    return sum(inodes.values()) - max(inodes.values())
+
+
+def asset_url(path, assets_dir):
+    """رابط /assets/... لملف داخل مجلد الأصول، أو None إن كان خارجه"""
+    relative = os.path.relpath(path, assets_dir)
+    if relative.startswith(os.pardir + os.sep) or relative == os.pardir:
+        return None
+    return '/assets/' + relative.replace(os.sep, '/')
+
+
+def choose_canonical(group, assets_dir, references=None):
+    """النسخة التي تبقى: داخل public/assets إن أمكن، ثم الأكثر استخداماً، ثم الأقصر مساراً"""
+    references = references or {}
+
+    def rank(path):
+        url = asset_url(path, assets_dir)
+        return (url is None, -references.get(url, 0), len(path), path)
+
+    return min(group, key=rank)
+
+
+def link_duplicate(canonical, path):
+    """استبدال path برابط صلب إلى canonical بشكل ذري
+
+    تُرجع False إن كانا نفس الملف أصلاً.
+    """
+    if os.path.samefile(canonical, path):
+        return False
+    tmp_path = path + '.dedup.tmp'
+    os.link(canonical, tmp_path)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return True
+
+
+def rewrite_references(value, mapping):
+    """استبدال الروابط في بنية JSON بنسخها الأساسية، وإرجاع (القيمة، عدد الاستبدالات)"""
+    if isinstance(value, str):
+        target = mapping.get(value)
+        return (target, 1) if target is not None else (value, 0)
+    if isinstance(value, list):
+        count = 0
+        items = []
+        for item in value:
+            item, replaced = rewrite_references(item, mapping)
+            items.append(item)
+            count += replaced
+        return items, count
+    if isinstance(value, dict):
+        count = 0
+        result = {}
+        for key, item in value.items():
+            result[key], replaced = rewrite_references(item, mapping)
+            count += replaced
+        return result, count
+    return value, 0
+
+
+def count_references(value, counts):
+    """عدّ كل النصوص التي تبدأ بـ /assets/ في بنية JSON"""
+    if isinstance(value, str):
+        if value.startswith('/assets/'):
+            counts[value] = counts.get(value, 0) + 1
+    elif isinstance(value, list):
+        for item in value:
+            count_references(item, counts)
+    elif isinstance(value, dict):
+        for item in value.values():
+            count_references(item, counts)
+    return counts
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""تقرير صحة الكتالوج: كل الإحصائيات في تمريرة واحدة على منتجات كل متجر
+
+لكل متجر: توزيع الشارات، حالة المخزون، مدرج نسب التخفيض، وعدد المنتجات
+التي ينقصها كل حقل. التقرير يُكتب JSON (للوحات المتابعة) و CSV بصيغة
+طويلة (متجر، مقياس، مفتاح، قيمة). الإحصائيات تُقرأ من ملف الأعمدة المرافق
+إن كان مطابقاً لـ store.json الحالي، وإلا من store.json نفسه قراءة متدفقة.
+"""
+
+import csv
+import json
+import os
+
+from .badges import LOW_STOCK_THRESHOLD
+from .columnar import load_fresh_columns
+from .store_io import StoreReader
+
+# الحقول التي يعتمد عليها العرض والشارات في الواجهة
+REQUIRED_FIELDS = (
+    'id', 'name', 'price', 'category', 'images', 'quantity',
+    'rating', 'reviews', 'views', 'likes', 'orders', 'badge', 'badgeColor',
+)
+
+# حدود فئات نسب التخفيض (%): 1-10، 11-20، ...، وما فوق 50
+DISCOUNT_BUCKETS = (10, 20, 30, 50)
+
+
+def discount_bucket(percent):
+    """اسم فئة نسبة التخفيض"""
+    lower = 0
+    for upper in DISCOUNT_BUCKETS:
+        if percent <= upper:
+            return f'{lower + 1}-{upper}%'
+        lower = upper
+    return f'>{DISCOUNT_BUCKETS[-1]}%'
+
+
+def _number(value):
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0
+
+
+class StoreHealth:
+    """مجمّع إحصائيات متجر واحد، يُغذّى منتجاً منتجاً"""
+
+    def __init__(self, store, listing=False):
+        self.store = store
+        self.products = 0
+        self.badges = {}
+        self.stock = {'in_stock': 0, 'low_stock': 0, 'out_of_stock': 0}
+        self.discounts = {}
+        self.missing = {field: 0 for field in REQUIRED_FIELDS}
+        self.listing = [] if listing else None
+
+    def add(self, product):
+        self.products += 1
+
+        badge = product.get('badge') or 'غير محدد'
+        self.badges[badge] = self.badges.get(badge, 0) + 1
+
+        quantity = _number(product.get('quantity'))
+        if quantity <= 0:
+            self.stock['out_of_stock'] += 1
+        elif quantity < LOW_STOCK_THRESHOLD:
+            self.stock['low_stock'] += 1
+        else:
+            self.stock['in_stock'] += 1
+
+        price = _number(product.get('price'))
+        original_price = _number(product.get('originalPrice'))
+        if original_price > price and original_price > 0:
+            bucket = discount_bucket((original_price - price) / original_price * 100)
+            self.discounts[bucket] = self.discounts.get(bucket, 0) + 1
+
+        for field in REQUIRED_FIELDS:
+            value = product.get(field)
+            if value is None or value == '' or value == []:
+                self.missing[field] += 1
+
+        if self.listing is not None:
+            self.listing.append({
+                'id': product.get('id'),
+                'name': product.get('name'),
+                'quantity': quantity,
+                'badge': badge,
+            })
+
+    def add_columns(self, columns):
+        """مثل add لكل منتجات ملف الأعمدة دفعة واحدة (بدون قائمة المنتجات)"""
+        self.products += columns.count
+
+        for badge, count in columns.counts('badge').items():
+            badge = badge or 'غير محدد'
+            self.badges[badge] = self.badges.get(badge, 0) + count
+
+        for quantity in columns.columns['quantity']:
+            if quantity <= 0:
+                self.stock['out_of_stock'] += 1
+            elif quantity < LOW_STOCK_THRESHOLD:
+                self.stock['low_stock'] += 1
+            else:
+                self.stock['in_stock'] += 1
+
+        for price, original_price in zip(columns.columns['price'], columns.columns['originalPrice']):
+            if original_price > price and original_price > 0:
+                bucket = discount_bucket((original_price - price) / original_price * 100)
+                self.discounts[bucket] = self.discounts.get(bucket, 0) + 1
+
+        for field in REQUIRED_FIELDS:
+            self.missing[field] += columns.missing(field)
+
+    def to_dict(self):
+        report = {
+            'store': self.store,
+            'products': self.products,
+            'badges': dict(sorted(self.badges.items(), key=lambda item: -item[1])),
+            'stock': self.stock,
+            'discounts': {
+                bucket: self.discounts[bucket]
+                for bucket in [discount_bucket(upper) for upper in DISCOUNT_BUCKETS] + [discount_bucket(101)]
+                if bucket in self.discounts
+            },
+            'missing': {field: count for field, count in self.missing.items() if count},
+        }
+        if self.listing is not None:
+            report['listing'] = self.listing
+        return report
+
+
+def store_health(store, path, listing=False):
+    """تقرير متجر واحد من ملف أعمدته، أو بقراءة متدفقة لملفه
+
+    قائمة المنتجات (listing) تحتاج الأسماء فتُقرأ دائماً من store.json.
+    """
+    health = StoreHealth(store, listing)
+    if not listing:
+        columns = load_fresh_columns(path, [field + '.present' for field in REQUIRED_FIELDS])
+        if columns is not None:
+            with columns:
+                health.add_columns(columns)
+            return health.to_dict()
+    with StoreReader(path) as reader:
+        for product in reader.products():
+            health.add(product)
+    return health.to_dict()
+
+
+def combine_reports(reports):
+    """جمع تقارير المتاجر في إجمالي واحد"""
+    total = {'products': 0, 'badges': {}, 'stock': {}, 'discounts': {}, 'missing': {}}
+    for report in reports:
+        total['products'] += report['products']
+        for key in ('badges', 'stock', 'discounts', 'missing'):
+            for name, count in report[key].items():
+                total[key][name] = total[key].get(name, 0) + count
+    total['badges'] = dict(sorted(total['badges'].items(), key=lambda item: -item[1]))
+    return total
+
+
+def write_health_json(path, stores, total):
+    """كتابة التقرير الكامل بصيغة JSON"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'total': total, 'stores': stores}, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def health_rows(stores, total):
+    """صفوف (متجر، مقياس، مفتاح، قيمة) للتقرير، والإجمالي باسم '*'"""
+    for report in list(stores) + [dict(total, store='*')]:
+        yield report['store'], 'products', '', report['products']
+        for metric in ('badges', 'stock', 'discounts', 'missing'):
+            for key, value in report[metric].items():
+                yield report['store'], metric, key, value
+
+
+def write_health_csv(path, stores, total):
+    """كتابة التقرير بصيغة CSV طويلة"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['store', 'metric', 'key', 'value'])
+        writer.writerows(health_rows(stores, total))
+    os.replace(tmp_path, path)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""نسخ مصغرة متجاوبة (WebP و AVIF بعدة عروض) لصور المنتجات
+
+النسخ تُحفظ في public/assets/_variants/<بصمة الصورة>/<العرض>.<الصيغة>، فالمفتاح
+هو محتوى الصورة لا مسارها: الصورة التي لم تتغير لا يُعاد ترميزها أبداً،
+والصور المكررة بين المتاجر تُرمّز مرة واحدة. meta.json في نفس المجلد يحفظ
+الأبعاد والنسخ المنتجة فتُقرأ من الذاكرة بدون فتح الصورة. Pillow اختياري
+للترميز فقط (pip install pillow).
+"""
+
+import json
+import os
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow اختياري
+    Image = ImageOps = None
+
+from .dedup import file_digest
+
+VARIANTS_DIR = '_variants'
+IMAGES_MANIFEST_NAME = 'store.images.json'
+
+DEFAULT_WIDTHS = (160, 320, 640, 960)
+DEFAULT_FORMATS = ('webp', 'avif')
+DEFAULT_QUALITY = {'webp': 78, 'avif': 55}
+
+RASTER_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.avif', '.gif', '.bmp')
+
+META_NAME = 'meta.json'
+
+
+def supported_formats(formats=DEFAULT_FORMATS):
+    """الصيغ التي يستطيع Pillow المثبت كتابتها"""
+    if Image is None:
+        return ()
+    extensions = Image.registered_extensions()
+    return tuple(fmt for fmt in formats if f'.{fmt}' in extensions and extensions[f'.{fmt}'] in Image.SAVE)
+
+
+def store_image_refs(store_data):
+    """روابط الصور في حقلي images و image لكل منتج، بدون تكرار وبنفس الترتيب"""
+    refs = {}
+    for product in store_data.get('products') or []:
+        values = list(product.get('images') or [])
+        if product.get('image'):
+            values.append(product['image'])
+        for value in values:
+            if isinstance(value, str) and value.startswith('/assets/'):
+                refs[value] = None
+    return list(refs)
+
+
+def local_path(url, public_dir='public'):
+    """مسار ملف الصورة المحلي لرابط /assets/..."""
+    return os.path.join(public_dir, *url.lstrip('/').split('/'))
+
+
+def variant_dir(digest, assets_dir):
+    """مجلد نسخ صورة بحسب بصمتها"""
+    return os.path.join(assets_dir, VARIANTS_DIR, digest[:2], digest)
+
+
+def variant_url(digest, name):
+    return f'/assets/{VARIANTS_DIR}/{digest[:2]}/{digest}/{name}'
+
+
+def source_digest(path):
+    """بصمة محتوى الصورة المصدر (مفتاح الذاكرة)"""
+    return file_digest(path)[:32]
+
+
+def load_meta(digest, assets_dir, widths):
+    """بيانات النسخ المحفوظة إن كانت بنفس العروض، وإلا None
+
+    meta['formats'] هي الصيغ المرمّزة فعلاً لهذه الصورة؛ الصيغ الناقصة منها
+    تُرمّز وحدها لاحقاً (missing_formats).
+    """
+    try:
+        with open(os.path.join(variant_dir(digest, assets_dir), META_NAME), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get('widths') != list(widths):
+        return None
+    meta.setdefault('formats', sorted(meta.get('variants', {})))
+    return meta
+
+
+def missing_formats(meta, formats):
+    """الصيغ المطلوبة التي لم تُرمّز بعد لصورة (كلها إن لم توجد بيانات)"""
+    if meta is None:
+        return list(formats)
+    return [fmt for fmt in formats if fmt not in meta['formats']]
+
+
+def target_widths(width, widths):
+    """العروض الأصغر من الصورة (بدون تكبير)، أو عرضها نفسه إن كانت أصغر من الكل"""
+    smaller = [w for w in widths if w < width]
+    return smaller or [width]
+
+
+def encode_variants(source, digest, assets_dir, widths=DEFAULT_WIDTHS, formats=DEFAULT_FORMATS, quality=None,
+                    meta=None):
+    """ترميز نسخ صورة واحدة بالصيغ formats وكتابة meta.json (يعمل في عملية منفصلة)
+
+    مع meta (بيانات سابقة بنفس العروض) تُضاف الصيغ الجديدة إلى نسخها الموجودة.
+    """
+    from .publish import write_atomic
+
+    quality = dict(DEFAULT_QUALITY, **(quality or {}))
+    directory = variant_dir(digest, assets_dir)
+    os.makedirs(directory, exist_ok=True)
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'PA') else 'RGB')
+        width, height = image.size
+        variants = {fmt: [] for fmt in formats}
+        for target in target_widths(width, widths):
+            resized = image if target == width else image.resize(
+                (target, max(1, round(height * target / width))), Image.LANCZOS
+            )
+            for fmt in formats:
+                name = f'{target}.{fmt}'
+                tmp_path = os.path.join(directory, f'.{name}.tmp')
+                resized.save(tmp_path, format=fmt.upper(), quality=quality.get(fmt, 80))
+                os.replace(tmp_path, os.path.join(directory, name))
+                variants[fmt].append({'width': target, 'url': variant_url(digest, name)})
+    if meta is not None:
+        variants = dict(meta['variants'], **variants)
+    meta = {
+        'width': width, 'height': height, 'widths': list(widths),
+        'formats': sorted(variants), 'variants': variants,
+    }
+    write_atomic(os.path.join(directory, META_NAME), json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+    return meta
+
+
+def manifest_entry(meta, formats):
+    """مدخل صورة في store.images.json: الصيغ المطلوبة الموجودة لها فقط"""
+    available = [fmt for fmt in formats if fmt in meta['variants']]
+    return {
+        'width': meta['width'],
+        'height': meta['height'],
+        'formats': available,
+        'variants': {fmt: meta['variants'][fmt] for fmt in available},
+    }
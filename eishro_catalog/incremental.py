@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""ذاكرة بصمات مدخلات الشارات لإعادة الحساب التزايدية"""
+
+import hashlib
+import json
+import os
+
+from .badges import BADGE_FIELDS
+
+BADGE_CACHE_PATH = '.badge_cache.json'
+
+CACHE_VERSION = 2
+
+
+def empty_badge_cache():
+    """ذاكرة بصمات فارغة"""
+    return {'version': CACHE_VERSION, 'stores': {}}
+
+
+def load_badge_cache(path=BADGE_CACHE_PATH):
+    """تحميل ذاكرة البصمات من القرص (أو ذاكرة فارغة إن لم توجد)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return empty_badge_cache()
+    if cache.get('version') != CACHE_VERSION:
+        return empty_badge_cache()
+    return cache
+
+
+def save_badge_cache(cache, path=BADGE_CACHE_PATH):
+    """حفظ ذاكرة البصمات"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def product_fingerprint(product):
+    """بصمة قصيرة لمدخلات الشارة لمنتج واحد مع شارته الحالية
+
+    الشارة ضمن البصمة حتى يُعاد حساب منتج عُدّلت شارته يدوياً في store.json؛
+    المنتج الذي تغيرت شارته في هذا التشغيل يُعاد حسابه مرة أخرى في التالي فقط.
+    """
+    values = json.dumps([product.get(field) for field in BADGE_FIELDS + ('badge',)], ensure_ascii=False)
+    return hashlib.blake2b(values.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _store_entry(cache, store_key):
+    return cache['stores'].setdefault(store_key, {'file': None, 'products': {}})
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def store_file_unchanged(cache, store_key, path):
+    """هل الملف كما تركناه في التشغيل السابق؟ (لا حاجة لقراءته)"""
+    entry = cache['stores'].get(store_key)
+    if not entry or entry.get('file') is None:
+        return False
+    try:
+        return entry['file'] == _file_signature(path)
+    except OSError:
+        return False
+
+
+def remember_store_file(cache, store_key, path):
+    """تسجيل توقيع الملف بعد قراءته أو كتابته"""
+    _store_entry(cache, store_key)['file'] = _file_signature(path)
+
+
+class ChangedProducts:
+    """changed_products لمنتجات تمر على دفعات (store_io.stream_store)
+
+    select تعيد المنتجات التي تغيرت من كل دفعة، و finish تستبدل بصمات المتجر
+    في الذاكرة بالبصمات الجديدة بعد آخر دفعة.
+    """
+
+    def __init__(self, cache, store_key):
+        self.entry = _store_entry(cache, store_key)
+        self.fingerprints = {}
+        self.index = 0
+
+    def select(self, products):
+        old_fingerprints = self.entry['products']
+        changed = []
+        for product in products:
+            key = str(product.get('id', f'#{self.index}'))
+            self.index += 1
+            fingerprint = product_fingerprint(product)
+            self.fingerprints[key] = fingerprint
+            if old_fingerprints.get(key) != fingerprint:
+                changed.append(product)
+        return changed
+
+    def finish(self):
+        self.entry['products'] = self.fingerprints
+
+
+def changed_products(cache, store_key, products):
+    """إرجاع المنتجات التي تغيرت مدخلات شارتها، وتحديث البصمات في الذاكرة"""
+    tracker = ChangedProducts(cache, store_key)
+    changed = tracker.select(products)
+    tracker.finish()
+    return changed
+
+
+def forget_store(cache, store_key):
+    """حذف بصمات متجر (مثلاً بعد فشل معالجته) ليعاد حسابه بالكامل"""
+    cache['stores'].pop(store_key, None)
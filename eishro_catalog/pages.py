@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""تقسيم منتجات store.json إلى صفحات ثابتة الحجم مع ملف فهرس صغير
+
+store.manifest.json يحمل ترويسة المتجر (بدون المنتجات) وعدد المنتجات وقائمة
+الصفحات؛ فتعرض الواجهة أول شاشة بطلب صغير واحد ثم تجلب الصفحات عند الحاجة.
+اسم كل صفحة يحمل بصمة محتواها (store.pages/<رقم>.<بصمة>.json)، فيمكن تخزينها
+في المتصفح و CDN بلا انتهاء، والصفحات التي لم تتغير لا تُعاد كتابتها.
+
+حجم الصفحة يُحفظ في الفهرس نفسه، فكل نشر لاحق لمتجر له فهرس يعيد بناء
+صفحاته. الصفحة التي تخرج من الفهرس تُسجل في retired بوقت خروجها، وتبقى
+مهلة زمنية من ذلك الوقت حتى لا يحصل عميل حمّل الفهرس القديم على 404.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+PAGES_FORMAT = 1
+
+MANIFEST_NAME = 'store.manifest.json'
+PAGES_DIR = 'store.pages'
+
+DEFAULT_PAGE_SIZE = 48
+
+# أقل مدة تبقى فيها صفحة بعد خروجها من الفهرس قبل حذفها، بالثواني
+PAGES_GRACE_SECONDS = 3600
+
+
+def _encode(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def page_name(index, data):
+    """اسم ملف الصفحة نسبةً لمجلد المتجر"""
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    return f'{PAGES_DIR}/{index}.{digest}.json'
+
+
+class PageBuilder:
+    """تقسيم المنتجات إلى صفحات منتجاً منتجاً (لا يُحفظ إلا منتجات الصفحة الحالية)
+
+    add تعيد (اسم الصفحة، بايتاتها) عند اكتمال صفحة وإلا None، و flush تعيد
+    الصفحة الأخيرة الناقصة إن وُجدت، ثم manifest تعيد بايتات الفهرس.
+    """
+
+    def __init__(self, page_size=DEFAULT_PAGE_SIZE):
+        if page_size < 1:
+            raise ValueError("حجم الصفحة يجب أن يكون 1 على الأقل")
+        self.page_size = page_size
+        self.count = 0
+        self.chunk = []
+        self.entries = []
+
+    def add(self, product):
+        self.count += 1
+        self.chunk.append(product)
+        if len(self.chunk) == self.page_size:
+            return self.flush()
+        return None
+
+    def flush(self):
+        """الصفحة الحالية (اسمها، بايتاتها) حتى لو كانت ناقصة، أو None إن كانت فارغة"""
+        if not self.chunk:
+            return None
+        index = len(self.entries)
+        data = _encode({'page': index, 'products': self.chunk})
+        name = page_name(index, data)
+        self.entries.append({
+            'file': name,
+            'count': len(self.chunk),
+            'firstId': self.chunk[0].get('id'),
+            'lastId': self.chunk[-1].get('id'),
+        })
+        self.chunk = []
+        return name, data
+
+    def names(self):
+        """أسماء الصفحات التي أُعيدت حتى الآن"""
+        return [entry['file'] for entry in self.entries]
+
+    def manifest(self, store_data, retired=None):
+        """بايتات الفهرس؛ الترويسة من حقول store_data عدا products
+
+        retired: {اسم صفحة: وقت خروجها من الفهرس} (retire_pages).
+        """
+        manifest = {
+            'format': PAGES_FORMAT,
+            'store': {key: value for key, value in store_data.items() if key != 'products'},
+            'productCount': self.count,
+            'pageSize': self.page_size,
+            'pages': self.entries,
+        }
+        if retired:
+            manifest['retired'] = retired
+        return _encode(manifest)
+
+
+def build_pages(store_data, page_size=DEFAULT_PAGE_SIZE):
+    """ترميز الصفحات والفهرس: (بايتات الفهرس، [(اسم الصفحة، بايتاتها)])"""
+    builder = PageBuilder(page_size)
+    pages = [page for page in map(builder.add, store_data.get('products') or []) if page is not None]
+    last = builder.flush()
+    if last is not None:
+        pages.append(last)
+    return builder.manifest(store_data), pages
+
+
+def read_manifest(store_dir):
+    """فهرس الصفحات المنشور في مجلد المتجر، أو None إن لم يوجد"""
+    try:
+        with open(os.path.join(store_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('format') == PAGES_FORMAT else None
+
+
+def manifest_pages(manifest):
+    """أسماء ملفات الصفحات في فهرس"""
+    return [entry['file'] for entry in manifest.get('pages', [])] if manifest else []
+
+
+def page_files(store_dir):
+    """ملفات الصفحات الموجودة في مجلد متجر، نسبةً للمجلد"""
+    try:
+        names = os.listdir(os.path.join(store_dir, PAGES_DIR))
+    except FileNotFoundError:
+        return []
+    return [f'{PAGES_DIR}/{name}' for name in sorted(names) if name.endswith('.json')]
+
+
+def retire_pages(store_dirs, previous, current, grace=PAGES_GRACE_SECONDS, now=None):
+    """الصفحات المتقاعدة للفهرس الجديد والصفحات التي انتهت مهلتها
+
+    previous الفهرس المنشور قبل هذا النشر و current صفحات الفهرس الجديد. كل
+    صفحة خرجت من previous، وكل ملف صفحة في store_dirs لا يعرفه أي فهرس،
+    يُسجل بوقت هذا النشر ما لم يكن مسجلاً، والمهلة grace تُحسب من ذلك الوقت
+    لا من تاريخ كتابة الملف. تُرجع ({صفحة: وقت خروجها}، [صفحات يُحذف ملفها]).
+    """
+    now = int(time.time() if now is None else now)
+    current = set(current)
+    retired = dict((previous or {}).get('retired') or {})
+    candidates = manifest_pages(previous) + [name for store_dir in store_dirs for name in page_files(store_dir)]
+    for name in candidates:
+        if name not in current:
+            retired.setdefault(name, now)
+    expired = []
+    for name, since in list(retired.items()):
+        if name in current or since + grace <= now:
+            del retired[name]
+            if name not in current:
+                expired.append(name)
+    return retired, sorted(expired)
@@ -0,0 +1,471 @@
+# -*- coding: utf-8 -*-
+"""نشر store.json: ترميز مرة واحدة وكتابة ذرية إلى public و dist"""
+
+import filecmp
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+from .columnar import SIDECAR_NAME, ColumnBuilder, encode_columns, file_hash
+from .pages import MANIFEST_NAME, PageBuilder, read_manifest, retire_pages
+from .store_diff import PATCH_FORMAT, ProductChanges, diff_stores
+from .store_io import StoreReader, rewrite_store
+from .stores import dist_store_path, store_path
+from .timing import timed
+
+try:
+    import fcntl
+except ImportError:  # ويندوز: لا يوجد reflink
+    fcntl = None
+
+# ioctl(FICLONE) على لينكس (btrfs و xfs وغيرها): نسخة copy-on-write فورية
+FICLONE = 0x40049409
+
+VERSIONS_NAME = 'store.versions.json'
+PATCHES_DIR = 'store.patches'
+
+# امتدادات النسخ المضغوطة مسبقاً (compress.py): تُحذف عند تغير أصلها وتعيد
+# خطوة النشر كتابتها لملفات الكتالوج
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+# عدد الفروقات المحفوظة لكل متجر؛ العميل الأقدم منها يعيد تحميل store.json كاملاً
+MAX_PATCHES = 50
+
+
+def encode_store(store_data):
+    """ترميز بيانات المتجر بنفس تنسيق الملفات الحالية (indent=2)"""
+    return json.dumps(store_data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _temp_path(path):
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    os.close(fd)
+    return tmp_path
+
+
+def _file_mode(path):
+    try:
+        return os.stat(path).st_mode & 0o777
+    except OSError:
+        return 0o644
+
+
+def discard_compressed(path):
+    """حذف path.gz و path.br إن وُجدا، حتى لا تخدم الاستضافة نسخة مضغوطة قديمة
+
+    ملفات الكتالوج تُكتب عبر write_artifact التي تعيد كتابة نسخها بعد ذلك.
+    """
+    for suffix in COMPRESSED_SUFFIXES:
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def same_content(path, data):
+    """هل يحتوي الملف على نفس البايتات؟ (مقارنة الحجم أولاً لتفادي القراءة)"""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+@contextmanager
+def open_atomic(path, mode='wb', unchanged=None, **kwargs):
+    """فتح ملف مؤقت للكتابة المتدفقة يحل محل path ذرياً عند النجاح فقط
+
+    إن حدث استثناء داخل الكتلة يُحذف الملف المؤقت ويبقى path كما هو. إن
+    أعادت unchanged() بعد الكتابة True (المحتوى مطابق لما على القرص) يُحذف
+    الملف المؤقت أيضاً. عند الاستبدال تُحذف نسخ path المضغوطة القديمة.
+    """
+    tmp_path = _temp_path(path)
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            same = unchanged is not None and unchanged()
+            if not same:
+                f.flush()
+                os.fsync(f.fileno())
+        if same:
+            os.remove(tmp_path)
+            return
+        # mkstemp ينشئ الملف بصلاحيات 0600، والخادم يحتاج قراءته
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    discard_compressed(path)
+
+
+def write_atomic(path, data, skip_unchanged=True):
+    """كتابة البايتات في ملف مؤقت ثم إعادة تسميته، فلا يرى القارئ ملفاً نصف مكتوب
+
+    إن كان المحتوى على القرص مطابقاً لا يُكتب شيء (فلا يتغير mtime ولا تُبطل
+    ذاكرات Vite و CDN). تُرجع True إذا كُتب الملف فعلاً.
+    """
+    if skip_unchanged and same_content(path, data):
+        return False
+    with open_atomic(path) as f:
+        f.write(data)
+    return True
+
+
+def _reflink(src, dst):
+    if fcntl is None:
+        raise OSError("reflink غير مدعوم")
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+
+def _same_file(src, dst):
+    try:
+        return os.path.samefile(src, dst) or filecmp.cmp(src, dst, shallow=False)
+    except OSError:
+        return False
+
+
+def mirror_file(src, dst, skip_unchanged=True):
+    """نسخ ملف منشور إلى مسار آخر بشكل ذري: reflink ثم hardlink ثم نسخ عادي
+
+    الرابط الصلب آمن هنا لأن كل كتابة لاحقة على src تتم بإعادة التسمية
+    (write_atomic) فتحصل على inode جديد ولا تغيّر النسخة المرتبطة.
+    تُرجع طريقة النسخ، أو None إذا كانت النسخة مطابقة أصلاً.
+    """
+    if skip_unchanged and _same_file(src, dst):
+        return None
+    tmp_path = _temp_path(dst)
+    try:
+        try:
+            _reflink(src, tmp_path)
+            shutil.copymode(src, tmp_path)
+            method = 'reflink'
+        except OSError:
+            os.remove(tmp_path)
+            try:
+                os.link(src, tmp_path)
+                method = 'hardlink'
+            except OSError:
+                shutil.copyfile(src, tmp_path)
+                shutil.copymode(src, tmp_path)
+                method = 'copy'
+        os.replace(tmp_path, dst)
+        # إن كان dst رابطاً صلباً لنفس الملف أصلاً فإن rename لا يفعل شيئاً
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    discard_compressed(dst)
+    return method
+
+
+def _compress_artifact(path, data=None, written=True):
+    # النسخ المضغوطة تُكتب إن تغير الملف أو نقصت إحداها، وإلا تبقى كما هي
+    from .compress import has_compressed, write_compressed
+
+    if written or not has_compressed(path):
+        write_compressed(path, data)
+
+
+def write_artifact(path, data, skip_unchanged=True):
+    """write_atomic لملف كتالوج منشور مع كتابة نسخه المضغوطة .gz و .br"""
+    written = write_atomic(path, data, skip_unchanged)
+    _compress_artifact(path, data, written)
+    return written
+
+
+def mirror_artifact(src, dst):
+    """mirror_file لملف كتالوج مع نسخه المضغوطة (وحذف ما ليس له مقابل في src)"""
+    method = mirror_file(src, dst)
+    for suffix in COMPRESSED_SUFFIXES:
+        if os.path.exists(src + suffix):
+            mirror_file(src + suffix, dst + suffix)
+        elif os.path.exists(dst + suffix):
+            os.remove(dst + suffix)
+    return method
+
+
+def sidecar_path(path):
+    """مسار ملف الأعمدة المرافق لملف store.json"""
+    return os.path.join(os.path.dirname(path), SIDECAR_NAME)
+
+
+def publish_columns(folder, products):
+    """كتابة ملف الأعمدة المرافق في public ونسخه إلى dist
+
+    يُستدعى بعد كتابة store.json، فتُحفظ بصمته في الملف ليعرف القراء إن
+    تغير store.json بعده (columnar.load_fresh_columns).
+    """
+    source = store_path(folder)
+    with timed('encode'):
+        data = encode_columns(products, file_hash(source) if os.path.exists(source) else None)
+    return _publish_sidecar(folder, data)
+
+
+def _publish_sidecar(folder, data):
+    path = sidecar_path(store_path(folder))
+    with timed('write'):
+        written = write_artifact(path, data)
+        mirrored = mirror_artifact(path, sidecar_path(dist_store_path(folder)))
+    return written or mirrored is not None
+
+
+class _PagePublisher:
+    """كتابة صفحات متجر في public و dist ثم الفهرس، وحذف الصفحات المتقاعدة بعده"""
+
+    def __init__(self, folder, page_size=None):
+        self.store_dir = os.path.dirname(store_path(folder))
+        self.dist_dir = os.path.dirname(dist_store_path(folder))
+        self.previous = read_manifest(self.store_dir)
+        self.page_size = page_size or (self.previous or {}).get('pageSize')
+        self.changed = 0
+
+    def write(self, name, data):
+        path = os.path.join(self.store_dir, name)
+        written = write_artifact(path, data)
+        mirrored = mirror_artifact(path, os.path.join(self.dist_dir, name))
+        self.changed += written or mirrored is not None
+
+    def finish(self, builder, store_data):
+        """كتابة الصفحة الأخيرة من builder ثم الفهرس، ثم حذف الصفحات التي انتهت مهلتها
+
+        الصفحات التي خرجت من الفهرس تُسجل في retired داخل الفهرس الجديد
+        (retire_pages)، فتُحسب مهلتها من وقت خروجها لا من تاريخ كتابة ملفها.
+        """
+        last = builder.flush()
+        if last is not None:
+            self.write(*last)
+        directories = (self.store_dir, self.dist_dir)
+        retired, expired = retire_pages(directories, self.previous, builder.names())
+        self.write(MANIFEST_NAME, builder.manifest(store_data, retired))
+        for directory in directories:
+            for name in expired:
+                path = os.path.join(directory, name)
+                if os.path.exists(path):
+                    os.remove(path)
+                    self.changed += 1
+                discard_compressed(path)
+        return self.changed
+
+
+def publish_pages(folder, store_data, page_size=None):
+    """كتابة صفحات المنتجات وفهرسها في public ونسخها إلى dist
+
+    بدون page_size يُستخدم حجم الصفحة المحفوظ في الفهرس المنشور، وإن لم
+    يوجد فهرس لا يُكتب شيء. الفهرس يُكتب بعد الصفحات، وتُحذف بعده فقط
+    الصفحات التي خرجت من الفهرس منذ أكثر من مهلة الحذف، فلا يشير فهرس
+    منشور حديثاً إلى صفحة غير موجودة. تُرجع عدد الملفات التي تغيرت.
+    """
+    pages = _PagePublisher(folder, page_size)
+    if not pages.page_size:
+        return 0
+    builder = PageBuilder(pages.page_size)
+    with timed('encode'):
+        encoded = [page for page in map(builder.add, store_data.get('products') or []) if page is not None]
+    with timed('write'):
+        for name, data in encoded:
+            pages.write(name, data)
+        return pages.finish(builder, store_data)
+
+
+def _publish_derived(folder, store_data, page_size=None):
+    """نسخة dist وملف الأعمدة والصفحات لمتجر كُتب store.json له في public"""
+    with timed('write'):
+        mirrored = mirror_artifact(store_path(folder), dist_store_path(folder))
+    publish_columns(folder, store_data.get('products', []))
+    publish_pages(folder, store_data, page_size)
+    return mirrored is not None
+
+
+def publish_store(folder, store_data, page_size=None):
+    """نشر متجر: ترميز واحد، كتابة ذرية في public مع فرق النسخة، ثم نسخة dist وملف الأعمدة
+
+    صفحات المنتجات وفهرسها تُنشر مع page_size، أو بحجم الفهرس الموجود إن
+    كان المتجر مقسماً إلى صفحات من قبل. تُرجع True إذا تغير store.json في
+    أي من المجلدين.
+    """
+    written = write_store(folder, store_data)
+    mirrored = _publish_derived(folder, store_data, page_size)
+    return written or mirrored
+
+
+def publish_stream(folder, transform, page_size=None, batch_size=None):
+    """نشر متجر بتمرير منتجاته متدفقة عبر transform (store_io.stream_store)
+
+    منتج واحد في الذاكرة في كل مرة (أو دفعة من batch_size منتج، فتستقبل
+    transform قائمة وتعيد قائمة بنفس الطول): بصمة store.json الجديد تُحسب
+    أثناء كتابته، والفرق وملف الأعمدة والصفحات تُبنى من نفس تدفق المنتجات.
+    إن لم يتغير store.json (ولم يُطلب page_size) لا يُكتب إلا نسخة dist عند الحاجة.
+    تُرجع (عدد المنتجات، هل تغير store.json في أي من المجلدين).
+    """
+    path = store_path(folder)
+    changes = ProductChanges()
+    columns = ColumnBuilder()
+    pages = _PagePublisher(folder, page_size)
+    page_builder = PageBuilder(pages.page_size) if pages.page_size else None
+
+    def publish(products):
+        snapshots = list(map(changes.snapshot, products))
+        products = transform(products) if batch_size else [transform(products[0])]
+        for before, product in zip(snapshots, products):
+            changes.add(before, product)
+            if product is not None:
+                columns.add(product)
+                page = page_builder.add(product) if page_builder is not None else None
+                if page is not None:
+                    pages.write(*page)
+        return products
+
+    with StoreReader(path) as reader:
+        count, old_hash, new_hash = rewrite_store(reader, publish, path, batch_size or 1)
+    written = new_hash != old_hash
+    with timed('compress'):
+        _compress_artifact(path, written=written)
+    with timed('write'):
+        mirrored = mirror_artifact(path, dist_store_path(folder)) is not None
+    if not written and page_size is None:
+        return count, mirrored
+
+    if written:
+        patch = changes.products()
+        if patch is not None:
+            patch = {'products': patch} if patch else {}
+        _record_patch(folder, old_hash, new_hash, patch)
+    with timed('encode'):
+        data = columns.encode(new_hash)
+    _publish_sidecar(folder, data)
+    if page_builder is not None:
+        with timed('write'):
+            pages.finish(page_builder, reader.header)
+    return count, written or mirrored
+
+
+def content_hash(data):
+    """بصمة محتوى store.json كما يراه العميل"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _read_bytes(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _encode_json(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def load_versions(folder):
+    """سجل نسخ المتجر: {'format', 'version', 'hash', 'patches'}"""
+    path = os.path.join(os.path.dirname(store_path(folder)), VERSIONS_NAME)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            versions = json.load(f)
+    except (OSError, ValueError):
+        return {'format': PATCH_FORMAT, 'version': 0, 'hash': None, 'patches': []}
+    if versions.get('format') != PATCH_FORMAT:
+        return {'format': PATCH_FORMAT, 'version': versions.get('version', 0), 'hash': None, 'patches': []}
+    return versions
+
+
+def _publish_file(folder, name, data):
+    path = os.path.join(os.path.dirname(store_path(folder)), name)
+    write_artifact(path, data, skip_unchanged=False)
+    mirror_artifact(path, os.path.join(os.path.dirname(dist_store_path(folder)), name))
+
+
+def _remove_patch(folder, version):
+    name = os.path.join(PATCHES_DIR, f'{version}.json')
+    for path in (store_path(folder), dist_store_path(folder)):
+        try:
+            os.remove(os.path.join(os.path.dirname(path), name))
+        except FileNotFoundError:
+            pass
+        discard_compressed(os.path.join(os.path.dirname(path), name))
+
+
+def record_revision(folder, old_data, data, store_data):
+    """تسجيل نسخة جديدة من store.json مع فرقها عن السابقة في public و dist
+
+    الفرق يُكتب في store.patches/<النسخة>.json ويُحدّث store.versions.json.
+    إن لم يطابق الملف القديم بصمة آخر نسخة مسجلة (عدّله سكربت لا يسجل
+    النسخ) تُحذف الفروقات السابقة لأن سلسلتها انقطعت. تُرجع رقم النسخة.
+    """
+    patch = None
+    if old_data is not None:
+        with timed('diff'):
+            try:
+                patch = diff_stores(json.loads(old_data), store_data)
+            except ValueError:
+                patch = None
+    base_hash = content_hash(old_data) if old_data is not None else None
+    return _record_patch(folder, base_hash, content_hash(data), patch)
+
+
+def _record_patch(folder, base_hash, new_hash, patch):
+    # patch: فرق diff_stores بين النسختين، أو None إن تعذر حسابه
+    versions = load_versions(folder)
+    if versions['hash'] != base_hash:
+        for version in versions['patches']:
+            _remove_patch(folder, version)
+        versions['patches'] = []
+        if base_hash is not None and versions['hash'] is not None:
+            versions['version'] += 1
+    base_version = versions['version']
+    version = base_version + 1
+
+    if patch is not None:
+        patch = dict({
+            'format': PATCH_FORMAT,
+            'version': version,
+            'baseVersion': base_version,
+            'baseHash': base_hash,
+            'hash': new_hash,
+        }, **patch)
+        with timed('write'):
+            _publish_file(folder, os.path.join(PATCHES_DIR, f'{version}.json'), _encode_json(patch))
+        versions['patches'].append(version)
+
+    for expired in versions['patches'][:-MAX_PATCHES]:
+        _remove_patch(folder, expired)
+    versions.update(
+        format=PATCH_FORMAT, version=version, hash=new_hash,
+        patches=versions['patches'][-MAX_PATCHES:],
+    )
+    with timed('write'):
+        _publish_file(folder, VERSIONS_NAME, _encode_json(versions))
+    return version
+
+
+def write_store(folder, store_data, data=None):
+    """كتابة store.json في public مع نسخه المضغوطة، وتسجيل نسخته وفرقه إن تغير المحتوى
+
+    تُرجع True إذا كُتب الملف فعلاً.
+    """
+    path = store_path(folder)
+    if data is None:
+        with timed('encode'):
+            data = encode_store(store_data)
+    with timed('write'):
+        old_data = _read_bytes(path)
+        written = old_data != data
+        if written:
+            write_atomic(path, data, skip_unchanged=False)
+    with timed('compress'):
+        _compress_artifact(path, data, written)
+    if written:
+        record_revision(folder, old_data, data, store_data)
+    return written
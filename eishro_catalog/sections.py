@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""حذف أقسام من ملفات المصدر بمراسي نصية بدل أرقام أسطر ثابتة
+
+بالمراسي يُمرَّر الملف سطراً سطراً: الأسطر خارج القسم تُكتب مباشرة إلى
+الملف المؤقت ولا يُحفظ في الذاكرة إلا سياق المعاينة. بوضع البناء (node)
+يُحدَّد نهاية القسم بمقطّع tsx_balance: من سطر المرساة حتى يُغلق كل ما فُتح
+فيه من أقواس ووسوم JSX.
+"""
+
+import io
+import re
+from collections import deque
+
+from .tsx_balance import construct_end
+
+DIFF_CONTEXT = 3
+
+# أسطر تعليق فقط (// أو /* */ أو {/* */} في JSX) تسبق البناء المقصود
+_COMMENT_LINE = re.compile(r'^\s*(?://.*|/\*.*?\*/|\{\s*/\*.*?\*/\s*\})\s*$')
+
+
+class SectionError(Exception):
+    """مرساة لم توجد أو قسم لم يكتمل"""
+
+
+def anchor_matcher(pattern, regex=False):
+    """دالة تفحص هل يحتوي السطر على المرساة (نص حرفي أو تعبير نمطي)"""
+    if regex:
+        return re.compile(pattern).search
+    return lambda line: pattern in line
+
+
+def anchor_events(lines, is_start, is_end, end_exclusive=False, all_sections=False):
+    """('keep' أو 'remove'، رقم السطر، السطر) لكل سطر، بتمريرة واحدة
+
+    القسم يبدأ بسطر المرساة الأولى وينتهي بأول سطر بعده فيه مرساة النهاية
+    (شاملاً إلا مع end_exclusive).
+    """
+    inside = False
+    done = False
+    start_number = None
+    for number, line in enumerate(lines, start=1):
+        if not inside:
+            if not done and is_start(line):
+                inside = True
+                start_number = number
+                yield 'remove', number, line
+                continue
+            yield 'keep', number, line
+            continue
+        if is_end(line):
+            inside = False
+            done = not all_sections
+            if end_exclusive:
+                # سطر النهاية قد يكون بداية قسم آخر مع all_sections
+                if not done and is_start(line):
+                    inside = True
+                    start_number = number
+                    yield 'remove', number, line
+                    continue
+                yield 'keep', number, line
+            else:
+                yield 'remove', number, line
+            continue
+        yield 'remove', number, line
+    if inside:
+        raise SectionError(f"القسم الذي يبدأ في السطر {start_number} لم تُوجد نهايته")
+    if start_number is None:
+        raise SectionError("لم تُوجد مرساة البداية")
+
+
+def node_ranges(source, is_start, all_sections=False, jsx=True):
+    """[(أول سطر، آخر سطر)] للبناء الذي يبدأ عند كل مرساة
+
+    أسطر التعليق التي عليها المرساة تُحذف مع البناء الذي يليها. jsx كما في
+    tsx_balance.check_source (False لملفات .ts و .js).
+    """
+    ranges = []
+    offsets = []
+    offset = 0
+    lines = source_lines(source)
+    for line in lines:
+        offsets.append(offset)
+        offset += len(line)
+
+    index = 0
+    while index < len(lines):
+        if not is_start(lines[index]):
+            index += 1
+            continue
+        first = index
+        while index < len(lines) and _COMMENT_LINE.match(lines[index]):
+            index += 1
+        if index == len(lines):
+            raise SectionError(f"لا يوجد بناء بعد المرساة في السطر {first + 1}")
+        problem, end = construct_end(source, offsets[index], jsx)
+        if problem is not None:
+            raise SectionError(f"البناء الذي يبدأ في السطر {index + 1} غير متوازن: "
+                               f"{problem.line}:{problem.column} {problem.message}")
+        last = index
+        while last + 1 < len(lines) and offsets[last + 1] < end:
+            last += 1
+        ranges.append((first + 1, last + 1))
+        index = last + 1
+        if not all_sections:
+            break
+    if not ranges:
+        raise SectionError("لم تُوجد مرساة البداية")
+    return ranges
+
+
+def source_lines(source):
+    """أسطر نص بنفس تقسيم قراءة الملف بـ newline='' (مع نهاياتها كما هي)"""
+    return list(io.StringIO(source, newline=''))
+
+
+def range_events(lines, ranges):
+    """أحداث keep/remove لأسطر حسب نطاقات (شاملة) مرتبة"""
+    ranges = deque(ranges)
+    for number, line in enumerate(lines, start=1):
+        while ranges and number > ranges[0][1]:
+            ranges.popleft()
+        removed = bool(ranges) and ranges[0][0] <= number
+        yield ('remove' if removed else 'keep'), number, line
+
+
+class UnifiedDiff:
+    """معاينة الحذف بصيغة unified diff، تُبنى أثناء تمرير الأسطر"""
+
+    def __init__(self, path, context=DIFF_CONTEXT):
+        self.path = path
+        self.context = context
+        self.before = deque(maxlen=context)
+        self.hunks = []
+        self.hunk = None
+        self.after = 0
+        self.removed = 0
+
+    def keep(self, number, line):
+        if self.hunk is not None:
+            if self.after < self.context:
+                self.hunk['lines'].append(' ' + line)
+                self.hunk['old_count'] += 1
+                self.after += 1
+                return
+            self._close()
+        self.before.append((number, line))
+
+    def remove(self, number, line):
+        if self.hunk is None:
+            first = self.before[0][0] if self.before else number
+            self.hunk = {'old_start': first, 'new_start': first - self.removed,
+                         'old_count': 0, 'lines': []}
+            for _, context_line in self.before:
+                self.hunk['lines'].append(' ' + context_line)
+                self.hunk['old_count'] += 1
+            self.before.clear()
+        elif self.after:
+            self.after = 0
+        self.hunk['lines'].append('-' + line)
+        self.hunk['old_count'] += 1
+        self.removed += 1
+
+    def _close(self):
+        self.hunks.append(self.hunk)
+        self.hunk = None
+        self.after = 0
+
+    def text(self):
+        if self.hunk is not None:
+            self._close()
+        if not self.hunks:
+            return ''
+        parts = [f'--- a/{self.path}\n', f'+++ b/{self.path}\n']
+        for hunk in self.hunks:
+            new_count = hunk['old_count'] - sum(1 for line in hunk['lines'] if line[0] == '-')
+            parts.append(f"@@ -{hunk['old_start']},{hunk['old_count']} +{hunk['new_start']},{new_count} @@\n")
+            parts += [line if line.endswith('\n') else line + '\n\\ No newline at end of file\n'
+                      for line in hunk['lines']]
+        return ''.join(parts)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""تصدير متاجر ومنتجات store.json كبذور SQL و CSV لجداول الخادم
+
+الأعمدة تطابق نماذج backend/src/models (Store و Product) على PostgreSQL:
+جدول products بأسماء camelCase (underscored: false)، وجدول stores
+بأعمدة merchant_id و is_active و created_at المعرفة بـ field. الكتابة
+متدفقة: المنتجات تُكتب على دفعات INSERT ولا تُجمع في الذاكرة.
+"""
+
+import csv
+import json
+
+from .badges import calculate_badge
+
+PRODUCT_COLUMNS = (
+    'id', 'name', 'description', 'price', 'originalPrice', 'discountPercent',
+    'category', 'image', 'images', 'storeId', 'inStock', 'quantity', 'sku',
+    'rating', 'reviewCount', 'views', 'likes', 'orders', 'badge', 'tags',
+    'createdAt', 'updatedAt',
+)
+
+STORE_COLUMNS = (
+    'id', 'merchant_id', 'name', 'slug', 'category', 'description', 'logo',
+    'is_active', 'rating', 'created_at', 'updated_at',
+)
+
+# أقصى قيمة لعمود INTEGER (المعرفات في الجداول)
+MAX_INTEGER_ID = 2 ** 31 - 1
+
+INSERT_BATCH = 1000
+
+
+def sql_literal(value):
+    """تمثيل قيمة بايثون كقيمة SQL حرفية لـ PostgreSQL"""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value, ensure_ascii=False)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _csv_value(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return '' if value is None else value
+
+
+def product_row(product, timestamp):
+    """صف جدول products لمنتج من store.json"""
+    price = product.get('price') or 0
+    original_price = product.get('originalPrice')
+    discount = None
+    if original_price and original_price > price:
+        discount = round((original_price - price) / original_price * 100, 2)
+    images = product.get('images') or []
+    return {
+        'id': product['id'],
+        'name': product.get('name') or '',
+        'description': product.get('description'),
+        'price': price,
+        'originalPrice': original_price,
+        'discountPercent': discount,
+        'category': product.get('category') or '',
+        'image': images[0] if images else '',
+        'images': images,
+        'storeId': product.get('storeId'),
+        'inStock': bool(product.get('inStock', True)),
+        'quantity': product.get('quantity') or 0,
+        'sku': f"SKU-{product.get('storeId')}-{product['id']}",
+        'rating': product.get('rating'),
+        'reviewCount': product.get('reviews') or 0,
+        'views': product.get('views') or 0,
+        'likes': product.get('likes') or 0,
+        'orders': product.get('orders') or 0,
+        'badge': product.get('badge') or calculate_badge(product),
+        'tags': product.get('tags') or [],
+        'createdAt': timestamp,
+        'updatedAt': timestamp,
+    }
+
+
+def store_row(store, merchant_id, timestamp):
+    """صف جدول stores من ترويسة store.json"""
+    categories = store.get('categories') or []
+    return {
+        'id': store.get('storeId') or store.get('id'),
+        'merchant_id': merchant_id,
+        'name': store.get('name') or store.get('nameAr') or store.get('slug'),
+        'slug': store.get('slug'),
+        'category': categories[0] if categories else 'عام',
+        'description': store.get('description'),
+        'logo': store.get('logo'),
+        'is_active': store.get('status', 'active') == 'active',
+        'rating': None,
+        'created_at': timestamp,
+        'updated_at': timestamp,
+    }
+
+
+class SeedWriter:
+    """كاتب بذور متدفق: ملف SQL وملفا CSV (stores و products)، كلها اختيارية"""
+
+    def __init__(self, sql_file=None, stores_csv=None, products_csv=None, batch_size=INSERT_BATCH):
+        self.sql = sql_file
+        self.batch_size = batch_size
+        self.batch = []
+        self.stores = csv.writer(stores_csv) if stores_csv else None
+        self.products = csv.writer(products_csv) if products_csv else None
+        if self.stores:
+            self.stores.writerow(STORE_COLUMNS)
+        if self.products:
+            self.products.writerow(PRODUCT_COLUMNS)
+        if self.sql:
+            self.sql.write('-- بذور متاجر ومنتجات مولدة (PostgreSQL)\nBEGIN;\n\n')
+
+    def _insert(self, table, columns, rows):
+        self.sql.write(f'INSERT INTO "{table}" (' + ', '.join(f'"{c}"' for c in columns) + ') VALUES\n')
+        self.sql.write(',\n'.join(
+            '(' + ', '.join(sql_literal(row[c]) for c in columns) + ')' for row in rows
+        ))
+        self.sql.write(';\n\n')
+
+    def add_store(self, row):
+        if self.sql:
+            self._insert('stores', STORE_COLUMNS, [row])
+        if self.stores:
+            self.stores.writerow([_csv_value(row[c]) for c in STORE_COLUMNS])
+
+    def add_product(self, row):
+        if row['id'] > MAX_INTEGER_ID:
+            raise ValueError(f"معرف المنتج {row['id']} أكبر من حد عمود INTEGER")
+        if self.products:
+            self.products.writerow([_csv_value(row[c]) for c in PRODUCT_COLUMNS])
+        if self.sql:
+            self.batch.append(row)
+            if len(self.batch) >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        if self.sql and self.batch:
+            self._insert('products', PRODUCT_COLUMNS, self.batch)
+            self.batch = []
+
+    def close(self):
+        """كتابة الدفعة الأخيرة وتحديث متسلسلات المعرفات"""
+        self.flush()
+        if self.sql:
+            for table in ('stores', 'products'):
+                self.sql.write(
+                    f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), "
+                    f'(SELECT MAX("id") FROM "{table}"));\n'
+                )
+            self.sql.write('\nCOMMIT;\n')
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""توليد حتمي للإحصائيات الناقصة (rating و views و ...) من بذرة
+
+كل قيمة دالة في (البذرة، المتجر، الحقل، معرّف المنتج) عبر خلط splitmix64،
+فلا تعتمد على ترتيب المنتجات ولا على عددها، ونفس البذرة تعطي نفس الملف
+بايتاً ببايت. مع numpy تُولَّد قيم المتجر كله لكل حقل في استدعاء واحد، وبدونها
+تُحسب نفس القيم بالضبط منتجاً منتجاً.
+"""
+
+import hashlib
+import json
+
+try:
+    import numpy as np
+except ImportError:  # numpy اختياري، والنتيجة مطابقة بدونها
+    np = None
+
+# نفس المجالات التي كانت في update_stores (شاملة للحدين)
+DEFAULT_DISTRIBUTIONS = {
+    'rating': {'min': 4.0, 'max': 5.0, 'decimals': 1},
+    'reviews': {'min': 10, 'max': 100},
+    'views': {'min': 50, 'max': 450},
+    'likes': {'min': 10, 'max': 300},
+    'orders': {'min': 5, 'max': 150},
+    'quantity': {'min': 5, 'max': 50},
+}
+
+DEFAULT_SEED = 0
+
+_MASK = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+
+def load_distributions(path=None):
+    """تحميل ملف التوزيعات: {"default": {...}, "stores": {"nawaem": {...}}}"""
+    config = {'default': DEFAULT_DISTRIBUTIONS, 'stores': {}}
+    if path is None:
+        return config
+    with open(path, 'r', encoding='utf-8') as f:
+        loaded = json.load(f)
+    config['default'] = dict(DEFAULT_DISTRIBUTIONS, **loaded.get('default', {}))
+    config['stores'] = loaded.get('stores', {})
+    return config
+
+
+def store_distributions(config, store):
+    """توزيعات متجر: الافتراضية مع ما يخص المتجر فوقها"""
+    return dict(config['default'], **config['stores'].get(store, {}))
+
+
+def _splitmix64(z):
+    z = (z + _GOLDEN) & _MASK
+    z = ((z ^ (z >> 30)) * _MIX1) & _MASK
+    z = ((z ^ (z >> 27)) * _MIX2) & _MASK
+    return z ^ (z >> 31)
+
+
+def _splitmix64_array(z):
+    # حسابات uint64 في numpy تلتف عند 2^64 كما في _splitmix64
+    z = z + np.uint64(_GOLDEN)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(_MIX1)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(_MIX2)
+    return z ^ (z >> np.uint64(31))
+
+
+def stream_seed(seed, store, field):
+    """بذرة 64 بت مستقلة لكل (بذرة، متجر، حقل)"""
+    digest = hashlib.blake2b(f'{seed}:{store}:{field}'.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def product_key(product):
+    """مفتاح 64 بت ثابت للمنتج: معرّفه الرقمي، أو بصمة معرّفه/اسمه"""
+    product_id = product.get('id')
+    if isinstance(product_id, int) and not isinstance(product_id, bool):
+        return product_id & _MASK
+    text = str(product_id if product_id is not None else product.get('name'))
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _steps(spec):
+    scale = 10 ** spec.get('decimals', 0)
+    low = round(spec['min'] * scale)
+    return low, round(spec['max'] * scale) - low + 1, scale
+
+
+def draw_value(key, seed_bits, spec):
+    """قيمة واحدة (نفس ناتج draw_values لنفس المفتاح)"""
+    low, count, scale = _steps(spec)
+    z = _splitmix64(_splitmix64(key) ^ seed_bits)
+    step = int((z >> 11) * 2.0 ** -53 * count)
+    return (low + step) / scale if 'decimals' in spec else low + step
+
+
+def draw_values(keys, seed_bits, spec):
+    """قيم لعدة منتجات دفعة واحدة"""
+    if np is None or not keys:
+        return [draw_value(key, seed_bits, spec) for key in keys]
+    low, count, scale = _steps(spec)
+    z = _splitmix64_array(_splitmix64_array(np.array(keys, dtype=np.uint64)) ^ np.uint64(seed_bits))
+    steps = np.floor((z >> np.uint64(11)).astype(np.float64) * 2.0 ** -53 * count).astype(np.int64)
+    if 'decimals' in spec:
+        return ((low + steps) / scale).tolist()
+    return (low + steps).tolist()
+
+
+def _missing(product, field):
+    return field not in product or product[field] is None
+
+
+def fill_product_stats(product, distributions, seed=DEFAULT_SEED, store=''):
+    """تعبئة الإحصائيات الناقصة لمنتج واحد، وإرجاع عدد الحقول المعبأة"""
+    filled = 0
+    key = None
+    for field, spec in distributions.items():
+        if not _missing(product, field):
+            continue
+        if field == 'quantity' and not product.get('inStock'):
+            product[field] = 0
+        else:
+            key = product_key(product) if key is None else key
+            product[field] = draw_value(key, stream_seed(seed, store, field), spec)
+        filled += 1
+    return filled
+
+
+def synthesize_stats(products, distributions, seed=DEFAULT_SEED, store=''):
+    """تعبئة الإحصائيات الناقصة لكل منتجات متجر، حقلاً حقلاً بشكل عمودي
+
+    النتيجة مطابقة لاستدعاء fill_product_stats على كل منتج. تُرجع عدد
+    الحقول المعبأة.
+    """
+    filled = 0
+    keys = {}
+    for field, spec in distributions.items():
+        targets = []
+        for index, product in enumerate(products):
+            if not _missing(product, field):
+                continue
+            if field == 'quantity' and not product.get('inStock'):
+                product[field] = 0
+                filled += 1
+            else:
+                targets.append(index)
+        if not targets:
+            continue
+        for index in targets:
+            if index not in keys:
+                keys[index] = product_key(products[index])
+        values = draw_values([keys[index] for index in targets], stream_seed(seed, store, field), spec)
+        for index, value in zip(targets, values):
+            products[index][field] = value
+        filled += len(targets)
+    return filled
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""فروقات بنيوية بين نسختين من store.json تُشحن كتحديثات صغيرة
+
+المنتجات تُطابق بالمعرّف id عبر قاموس (زمن خطي)، والنتيجة تحتوي فقط:
+المنتجات المضافة، ومعرفات المحذوفة، والحقول التي تغيرت في كل منتج.
+apply_patch تعيد بناء النسخة الجديدة بنفس ترتيب المفاتيح والمنتجات، فيكون
+ترميزها مطابقاً بايتاً ببايت لملف store.json الجديد.
+"""
+
+import json
+
+PATCH_FORMAT = 1
+
+_NESTED = (dict, list)
+
+
+def _same(old, new):
+    # 1 و 1.0 و True متساوية في بايثون لكن ترميزها في JSON مختلف، وكذلك
+    # قاموسان بترتيب مفاتيح مختلف: مقارنة C السريعة أولاً ثم الأنواع والترتيب
+    return old == new and _same_shape(old, new)
+
+
+def _same_shape(old, new):
+    # لقيمتين متساويتين (==): نفس الأنواع وترتيب المفاتيح على كل المستويات
+    kind = type(old)
+    if kind is not type(new):
+        return False
+    if kind is dict:
+        if list(old) != list(new):
+            return False
+        old, new = list(old.values()), list(new.values())
+    elif kind is not list:
+        return True
+    types = list(map(type, old))
+    if types != list(map(type, new)):
+        return False
+    if dict not in types and list not in types:
+        return True
+    for value, other, value_type in zip(old, new, types):
+        if value_type in _NESTED and not _same_shape(value, other):
+            return False
+    return True
+
+
+def _product_ids(products):
+    """معرفات المنتجات، أو None إن كان فيها منتج بلا id أو معرف مكرر"""
+    ids = [product.get('id') if isinstance(product, dict) else None for product in products]
+    if None in ids or len(set(ids)) != len(ids):
+        return None
+    return ids
+
+
+def _header(store):
+    # حقول المتجر مع إبقاء مكان products في الترتيب
+    return {key: (None if key == 'products' else value) for key, value in store.items()}
+
+
+def diff_fields(old, new):
+    """الفرق بين قاموسين: {'set': {...}, 'unset': [...]} أو None إن تطابقا
+
+    إن تغير ترتيب المفاتيح بما لا يمكن إعادة بنائه بالإضافة في النهاية
+    يُعاد {'replace': new}.
+    """
+    changes = {}
+    set_fields = {key: value for key, value in new.items() if key not in old or not _same(old[key], value)}
+    unset_fields = [key for key in old if key not in new]
+    if set_fields:
+        changes['set'] = set_fields
+    if unset_fields:
+        changes['unset'] = unset_fields
+    rebuilt = [key for key in old if key in new] + [key for key in new if key not in old]
+    if rebuilt != list(new):
+        return {'replace': new}
+    return changes or None
+
+
+def _positions(kept, new_keys, added_keys):
+    # مواضع المضاف في القائمة الجديدة إن كان باقي الترتيب كما هو، وإلا None
+    added_set = set(added_keys)
+    if [key for key in new_keys if key not in added_set] != kept:
+        return None
+    return [index for index, key in enumerate(new_keys) if key in added_set]
+
+
+def diff_products(old_products, new_products):
+    """فرق قائمتي منتجات بالمعرّف
+
+    المضاف يُلحق في النهاية، أو في مواضعه positions إن لم يتغير ترتيب الباقي؛
+    وإعادة الترتيب الفعلية فقط تُرسل كقائمة المعرفات order كاملة.
+    إن وُجد منتج بلا id أو معرف مكرر لا يمكن المطابقة، فتُرسل القائمة كاملة.
+    """
+    old_ids = _product_ids(old_products)
+    new_keys = _product_ids(new_products)
+    if old_ids is None or new_keys is None:
+        return {} if _same(old_products, new_products) else {'replace': new_products}
+    old_index = dict(zip(old_ids, old_products))
+    added = []
+    changed = []
+    for key, product in zip(new_keys, new_products):
+        old_product = old_index.get(key)
+        if old_product is None:
+            added.append(product)
+            continue
+        if old_product is product or _same(old_product, product):
+            continue
+        fields = diff_fields(old_product, product)
+        if fields is not None:
+            fields['id'] = key
+            changed.append(fields)
+
+    new_key_set = set(new_keys)
+    removed = [key for key in old_index if key not in new_key_set]
+
+    result = {}
+    if added:
+        result['added'] = added
+    if removed:
+        result['removed'] = removed
+    if changed:
+        result['changed'] = changed
+    # الترتيب الافتراضي بعد التطبيق: القديم بدون المحذوف ثم المضاف
+    removed_set = set(removed)
+    kept = [key for key in old_index if key not in removed_set]
+    added_keys = [product['id'] for product in added]
+    if kept + added_keys != new_keys:
+        positions = _positions(kept, new_keys, added_keys)
+        if positions is None:
+            result['order'] = new_keys
+        else:
+            result['positions'] = positions
+    return result
+
+
+class ProductChanges:
+    """فرق المنتجات لتحويل متدفق يمر على منتجات store.json بالترتيب
+
+    لكل منتج يُعطى add نصه قبل التحويل (snapshot) وناتج التحويل، أو None إن
+    حُذف. لا يُحفظ إلا ما تغير، و products() تطابق diff_products على القائمتين
+    كاملتين. إن غيّر التحويل معرّف منتج أو وُجد منتج بلا id أو معرف مكرر
+    تعيد None، لأن diff_products ترسل القائمة كاملة في هذه الحالة.
+    """
+
+    def __init__(self):
+        self.ids = set()
+        self.removed = []
+        self.changed = []
+        self.valid = True
+
+    @staticmethod
+    def snapshot(product):
+        return json.dumps(product, ensure_ascii=False, separators=(',', ':'))
+
+    def add(self, snapshot, product):
+        if not self.valid:
+            return
+        # نفس الترميز يعني نفس الأنواع وترتيب المفاتيح (_same) بدون فك النص القديم
+        old = None if product is not None and self.snapshot(product) == snapshot else json.loads(snapshot)
+        current = product if old is None else old
+        key = current.get('id') if isinstance(current, dict) else None
+        if key is None or key in self.ids or (
+                product is not None and not (isinstance(product, dict) and product.get('id') == key)):
+            self.valid = False
+            return
+        self.ids.add(key)
+        if old is None:
+            return
+        if product is None:
+            self.removed.append(key)
+            return
+        fields = diff_fields(old, product)
+        if fields is not None:
+            fields['id'] = key
+            self.changed.append(fields)
+
+    def products(self):
+        """فرق المنتجات بصيغة diff_products، أو None إن تعذرت المطابقة بالمعرّف"""
+        if not self.valid:
+            return None
+        result = {}
+        if self.removed:
+            result['removed'] = self.removed
+        if self.changed:
+            result['changed'] = self.changed
+        return result
+
+
+def diff_stores(old_store, new_store):
+    """فرق نسختين كاملتين من store.json (حقول المتجر والمنتجات)"""
+    patch = {}
+    header = diff_fields(_header(old_store), _header(new_store))
+    if header is not None:
+        patch['store'] = header
+    products = diff_products(old_store.get('products') or [], new_store.get('products') or [])
+    if products:
+        patch['products'] = products
+    return patch
+
+
+def _apply_fields(old, changes):
+    if 'replace' in changes:
+        return dict(changes['replace'])
+    unset = set(changes.get('unset', ()))
+    updated = {key: value for key, value in old.items() if key not in unset}
+    updated.update(changes.get('set', {}))
+    return updated
+
+
+def apply_patch(old_store, patch):
+    """تطبيق فرق على نسخة قديمة وإرجاع النسخة الجديدة (بدون تعديل القديمة)"""
+    products_patch = patch.get('products', {})
+    old_products = old_store.get('products') or []
+    if 'replace' in products_patch:
+        products = products_patch['replace']
+    elif products_patch:
+        by_key = {product['id']: product for product in old_products}
+        order = [product['id'] for product in old_products]
+        for key in products_patch.get('removed', ()):
+            del by_key[key]
+        for changes in products_patch.get('changed', ()):
+            by_key[changes['id']] = _apply_fields(by_key[changes['id']], changes)
+        added_keys = [product['id'] for product in products_patch.get('added', ())]
+        by_key.update(zip(added_keys, products_patch.get('added', ())))
+        if 'order' in products_patch:
+            order = products_patch['order']
+        else:
+            removed = set(products_patch.get('removed', ()))
+            order = [key for key in order if key not in removed]
+            if 'positions' in products_patch:
+                for index, key in zip(products_patch['positions'], added_keys):
+                    order.insert(index, key)
+            else:
+                order += added_keys
+        products = [by_key[key] for key in order]
+    else:
+        products = old_products
+
+    new_store = _apply_fields(_header(old_store), patch['store']) if 'store' in patch else _header(old_store)
+    if 'products' in new_store:
+        new_store['products'] = products
+    return new_store
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""قراءة وكتابة store.json بشكل متدفق: منتج واحد في الذاكرة في كل مرة"""
+
+import hashlib
+import json
+import os
+import re
+
+from .columnar import file_hash
+
+CHUNK_SIZE = 1 << 16
+
+# عدد المنتجات في كل دفعة حين تعمل transform على دفعات (محرك الشارات العمودي)
+BATCH_SIZE = 4096
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+
+class _JsonBuffer:
+    """نافذة منزلقة فوق ملف نصي مع تحليل قيم JSON منها واحدة تلو الأخرى"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, at_least=0):
+        if self.eof:
+            return False
+        more = self.f.read(max(self.chunk_size, at_least))
+        if not more:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + more
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"store.json غير صالح: متوقع '{char}' ووجد '{found or 'نهاية الملف'}'")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # القيمة مقطوعة عند نهاية النافذة: نضاعف القراءة ونعيد المحاولة
+                if self._fill(len(self.buf)):
+                    continue
+                raise
+            # الأرقام والثوابت قد تكون مقطوعة عند حد النافذة بلا خطأ
+            if end == len(self.buf) and self._fill(len(self.buf)):
+                continue
+            self.pos = end
+            return obj
+
+
+class StoreReader:
+    """قارئ متدفق لملف store.json
+
+    header يحتوي حقول المتجر بنفس ترتيبها في الملف، ومكان المنتجات فيه
+    محجوز بالمفتاح 'products'. الحقول التي تأتي بعد مصفوفة المنتجات تضاف إلى
+    header عند انتهاء المرور على products().
+    """
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.header = {}
+        self._file = open(path, 'r', encoding='utf-8')
+        self._json = _JsonBuffer(self._file, chunk_size)
+        self._consumed = False
+        self._json.expect('{')
+        self._has_products = self._read_fields(stop_at_products=True)
+
+    def _read_fields(self, stop_at_products):
+        while True:
+            char = self._json.peek()
+            if char == '}':
+                self._json.pos += 1
+                return False
+            if char == ',':
+                self._json.pos += 1
+                continue
+            key = self._json.value()
+            self._json.expect(':')
+            if key == 'products' and stop_at_products and self._json.peek() == '[':
+                self.header['products'] = None
+                self._json.pos += 1
+                return True
+            self.header[key] = self._json.value()
+
+    def products(self):
+        """توليد المنتجات واحداً تلو الآخر"""
+        if self._consumed:
+            raise RuntimeError("تمت قراءة المنتجات مسبقاً")
+        self._consumed = True
+        try:
+            if self._has_products:
+                while True:
+                    char = self._json.peek()
+                    if char == ']':
+                        self._json.pos += 1
+                        break
+                    if char == ',':
+                        self._json.pos += 1
+                        continue
+                    yield self._json.value()
+                self._read_fields(stop_at_products=False)
+        finally:
+            self.close()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _encode(value, level):
+    text = json.dumps(value, ensure_ascii=False, indent=2)
+    return text.replace('\n', '\n' + '  ' * level)
+
+
+def write_store_stream(f, header, products):
+    """كتابة store.json متدفقاً بنفس تنسيق json.dump(indent=2)
+
+    products تُستهلك منتجاً منتجاً. إن كان header من StoreReader فالحقول
+    التالية للمنتجات تُقرأ منه بعد استهلاك products.
+    """
+    keys = list(header)
+    if 'products' not in keys:
+        keys.append('products')
+    split = keys.index('products')
+
+    f.write('{')
+    first = True
+    for key in keys[:split]:
+        f.write(('\n' if first else ',\n') + '  ' + _encode(key, 1) + ': ' + _encode(header[key], 1))
+        first = False
+
+    f.write(('\n' if first else ',\n') + '  "products": [')
+    count = 0
+    for product in products:
+        f.write((',\n' if count else '\n') + '    ' + _encode(product, 2))
+        count += 1
+    f.write('\n  ]' if count else ']')
+
+    for key in list(header)[split + 1:]:
+        f.write(',\n  ' + _encode(key, 1) + ': ' + _encode(header[key], 1))
+    f.write('\n}')
+    return count
+
+
+class _HashingWriter:
+    """كتابة نص UTF-8 في ملف ثنائي مع بصمة blake2b لكل ما كُتب (مثل columnar.file_hash)"""
+
+    def __init__(self, f):
+        self.f = f
+        self.digest = hashlib.blake2b(digest_size=16)
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self.digest.update(data)
+        self.f.write(data)
+
+    def hexdigest(self):
+        return self.digest.hexdigest()
+
+
+def batches(items, size=BATCH_SIZE):
+    """تقسيم تدفق إلى قوائم بطول size (الأخيرة قد تكون أقصر)"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def stream_store(src_path, transform, dst_path=None, batch_size=None):
+    """تمرير منتجات store.json عبر transform وكتابتها بشكل ذري (publish.open_atomic)
+
+    transform تستقبل منتجاً وتعيده (أو تعيد None لحذفه)، ومع batch_size
+    تستقبل قائمة منتجات وتعيد قائمة بنفس الطول. عند عدم تحديد dst_path
+    يُستبدل الملف الأصلي. تُرجع (عدد المنتجات المكتوبة، هل تغير الملف).
+    """
+    with StoreReader(src_path) as reader:
+        count, old_hash, new_hash = rewrite_store(reader, transform, dst_path or src_path, batch_size)
+    return count, new_hash != old_hash
+
+
+def rewrite_store(reader, transform, dst_path, batch_size=None):
+    """كتابة منتجات reader بعد transform في dst_path بشكل ذري (انظر stream_store)
+
+    بصمة الناتج تُحسب أثناء الكتابة، فإن طابقت بصمة الملف الموجود لا
+    يُستبدل. بعد العودة يحتوي reader.header كل حقول المتجر. تُرجع
+    (عدد المنتجات المكتوبة، بصمة الملف السابق أو None، بصمة الناتج).
+    """
+    from .publish import open_atomic
+
+    old_hash = file_hash(dst_path) if os.path.exists(dst_path) else None
+    if batch_size:
+        transformed = (p for batch in batches(reader.products(), batch_size) for p in transform(batch))
+    else:
+        transformed = map(transform, reader.products())
+    transformed = (p for p in transformed if p is not None)
+    with open_atomic(dst_path, 'wb', unchanged=lambda: writer.hexdigest() == old_hash) as f:
+        writer = _HashingWriter(f)
+        count = write_store_stream(writer, reader.header, transformed)
+    return count, old_hash, writer.hexdigest()
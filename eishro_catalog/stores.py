@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""اكتشاف مجلدات المتاجر وتشغيل المهام عليها بالتوازي"""
+
+import io
+import os
+from collections import namedtuple
+from contextlib import redirect_stdout
+
+from .timing import collect_timings
+
+ASSETS_DIR = 'public/assets'
+DIST_ASSETS_DIR = 'dist/assets'
+
+STORE_NAMES = {
+    'nawaem': 'نواعم',
+    'sheirine': 'شيرين',
+    'delta-store': 'دلتا ستور',
+    'pretty': 'بريتي',
+    'magna-beauty': 'ماغنا بيوتي',
+    'indeesh': 'انديش',
+}
+
+StoreResult = namedtuple('StoreResult', ['folder', 'value', 'error', 'output', 'timings'], defaults=((),))
+
+
+def discover_stores(assets_dir=ASSETS_DIR):
+    """إيجاد كل المجلدات التي تحتوي store.json، مرتبة أبجدياً"""
+    try:
+        entries = os.listdir(assets_dir)
+    except FileNotFoundError:
+        return []
+    return sorted(
+        entry for entry in entries
+        if os.path.isfile(os.path.join(assets_dir, entry, 'store.json'))
+    )
+
+
+def store_path(folder, assets_dir=ASSETS_DIR):
+    """مسار store.json لمتجر"""
+    return f"{assets_dir}/{folder}/store.json"
+
+
+def dist_store_path(folder):
+    """مسار نسخة dist من store.json لمتجر"""
+    return store_path(folder, DIST_ASSETS_DIR)
+
+
+def store_display_name(folder):
+    """الاسم المعروض للمتجر (أو اسم المجلد إن لم يكن معروفاً)"""
+    return STORE_NAMES.get(folder, folder)
+
+
+def _run_isolated(job, folder, args):
+    buffer = io.StringIO()
+    with redirect_stdout(buffer), collect_timings(folder) as timings:
+        try:
+            value, error = job(folder, *args), None
+        except Exception as e:
+            value, error = None, f"{type(e).__name__}: {e}"
+    return StoreResult(folder, value, error, buffer.getvalue(), timings)
+
+
+def run_per_store(job, tasks, workers=None):
+    """تشغيل job(folder, *args) لكل مهمة في مجمع عمليات
+
+    كل مهمة إما اسم مجلد أو tuple أوله اسم المجلد. النتائج تعود بنفس ترتيب
+    المهام، وفشل متجر لا يوقف البقية، ومخرجات الطباعة تُجمع لكل متجر لتُعرض
+    بالترتيب بدل أن تتداخل.
+    """
+    tasks = [task if isinstance(task, tuple) else (task,) for task in tasks]
+    if workers == 1 or len(tasks) <= 1:
+        return [_run_isolated(job, task[0], task[1:]) for task in tasks]
+    # استيراد متأخر: multiprocessing مكلف ولا حاجة له في التشغيل التسلسلي
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_isolated, job, task[0], task[1:]) for task in tasks]
+        results = []
+        for task, future in zip(tasks, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:  # مثل انهيار العملية نفسها
+                results.append(StoreResult(task[0], None, f"{type(e).__name__}: {e}", ''))
+        return results
+
+
+def add_workers_argument(parser):
+    """إضافة خيار --workers لعدد العمليات المتوازية"""
+    parser.add_argument('--workers', type=int, default=None,
+                        help="عدد العمليات المتوازية (الافتراضي: عدد الأنوية، 1 للتشغيل التسلسلي)")
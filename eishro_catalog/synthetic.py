@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""توليد متاجر تجريبية حتمية بنفس مخطط store.json لقياس الأداء
+
+نفس البذرة تعطي نفس المنتجات بالضبط، فتبقى نتائج القياس قابلة للمقارنة
+بين الإصدارات. المنتجات تُولَّد واحداً تلو الآخر حتى لا تُحمَّل كلها في
+الذاكرة عند الكتابة المتدفقة.
+"""
+
+import json
+import os
+import random
+
+CATEGORIES = (
+    'فساتين سهرة', 'فساتين يومية', 'عبايات فاخرة', 'حجاب حريري',
+    'حقائب جلدية', 'ملابس أطفال', 'عطور', 'مكياج', 'إكسسوارات', 'أحذية',
+)
+
+NAME_WORDS = (
+    'فستان', 'عباية', 'حقيبة', 'عطر', 'طقم', 'حذاء', 'وشاح', 'ساعة',
+    'ذهبي', 'راقي', 'أنيق', 'فاخر', 'كلاسيكي', 'عصري', 'ناعم', 'مطرز',
+)
+
+SIZES = ('XS', 'S', 'M', 'L', 'XL', 'XXL')
+
+COLORS = (
+    ('ذهبي', '#F59E0B'), ('فضي', '#9CA3AF'), ('وردي', '#F472B6'),
+    ('أسود', '#000000'), ('أبيض', '#FFFFFF'), ('أزرق', '#3B82F6'),
+    ('أحمر', '#EF4444'), ('أخضر', '#10B981'),
+)
+
+
+def synthetic_product(rng, product_id, store_id, folder, image_pool=None):
+    """منتج واحد بنفس حقول منتجات store.json الحقيقية
+
+    إن مُرر image_pool (مسارات صور موجودة) تُختار الصور منه بدل مسارات وهمية.
+    """
+    price = rng.randrange(20, 1500, 5)
+    # ثلث المنتجات تقريباً بتخفيض، ليغطي القياس كل فروع الشارات
+    original_price = price + rng.randrange(5, price // 2 + 10, 5) if rng.random() < 0.35 else price
+    sizes = sorted(rng.sample(SIZES, rng.randint(1, len(SIZES))), key=SIZES.index)
+    quantity = 0 if rng.random() < 0.05 else rng.randint(1, 60)
+    return {
+        'id': product_id,
+        'storeId': store_id,
+        'name': ' '.join(rng.sample(NAME_WORDS, 3)),
+        'description': ' '.join(rng.choices(NAME_WORDS, k=12)),
+        'price': price,
+        'originalPrice': original_price,
+        'sizes': sizes,
+        'availableSizes': [s for s in sizes if rng.random() < 0.8],
+        'colors': [{'name': name, 'value': value} for name, value in rng.sample(COLORS, rng.randint(1, 4))],
+        'category': rng.choice(CATEGORIES),
+        'inStock': quantity > 0,
+        'isAvailable': quantity > 0,
+        'images': (
+            rng.sample(image_pool, min(len(image_pool), rng.randint(1, 4))) if image_pool
+            else [f'/assets/{folder}/product{product_id}-{i}.jpg' for i in range(rng.randint(1, 4))]
+        ),
+        'rating': round(rng.uniform(3.0, 5.0), 1),
+        'reviews': rng.randint(0, 300),
+        'views': rng.randint(0, 1000),
+        'likes': rng.randint(0, 400),
+        'orders': rng.randint(0, 120),
+        'quantity': quantity,
+    }
+
+
+def iter_synthetic_products(count, seed=0, store_id=900, folder='synthetic', image_pool=None, first_id=None):
+    """توليد count منتجاً حتمياً بمعرفات متتالية من first_id (الافتراضي store_id * 10^6 + 1)"""
+    rng = random.Random(f'{seed}:{store_id}')
+    if first_id is None:
+        first_id = store_id * 1000000 + 1
+    for product_id in range(first_id, first_id + count):
+        yield synthetic_product(rng, product_id, store_id, folder, image_pool)
+
+
+def existing_images(assets_dir, extensions=('.jpg', '.jpeg', '.png', '.webp')):
+    """مسارات الصور الموجودة في مجلدات المتاجر بصيغة /assets/<متجر>/<ملف>، مرتبة"""
+    images = []
+    for folder in sorted(os.listdir(assets_dir)):
+        path = os.path.join(assets_dir, folder)
+        if not os.path.isdir(path):
+            continue
+        for name in sorted(os.listdir(path)):
+            if name.lower().endswith(extensions):
+                images.append(f'/assets/{folder}/{name}')
+    return images
+
+
+def synthetic_store_header(store_id=900, folder='synthetic'):
+    """حقول المتجر بدون المنتجات، بنفس ترتيب ملفات store.json"""
+    return {
+        'id': store_id,
+        'storeId': store_id,
+        'slug': folder,
+        'name': f'متجر تجريبي {store_id}',
+        'subdomain': folder,
+        'storeSlug': folder,
+        'nameAr': f'متجر تجريبي {store_id}',
+        'nameEn': f'Synthetic {store_id}',
+        'description': 'متجر مولّد لقياس الأداء',
+        'icon': '🧪',
+        'color': 'from-gray-400 to-gray-600',
+        'logo': f'/assets/stores/{folder}.webp',
+        'categories': list(CATEGORIES),
+        'products': None,
+        'sliderImages': [],
+        'status': 'active',
+        'createdAt': '2025-01-01T00:00:00.000Z',
+    }
+
+
+def synthetic_store(count, seed=0, store_id=900, folder='synthetic'):
+    """متجر تجريبي كامل في الذاكرة"""
+    store = synthetic_store_header(store_id, folder)
+    store['products'] = list(iter_synthetic_products(count, seed, store_id, folder))
+    return store
+
+
+def write_ts_module(f, products, export_name='allStoreProducts'):
+    """كتابة المنتجات كملف بيانات TS بنفس شكل src/data/allStoreProducts.ts"""
+    f.write(f'export const {export_name} = [\n')
+    for product in products:
+        f.write('  {\n')
+        for key, value in product.items():
+            f.write(f'    {key}: {json.dumps(value, ensure_ascii=False)},\n')
+        f.write('  },\n')
+    f.write('];\n')
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""توقيت مراحل معالجة كل متجر (تحميل، تحويل، ترميز، كتابة) وتقرير JSON
+
+السكربتات تحيط كل مرحلة بـ timed('load') وما شابه، و run_per_store يجمع
+القياسات لكل متجر حتى من العمليات المتوازية ويعيدها مع StoreResult.
+"""
+
+import cProfile
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+_records = []
+_current_store = None
+
+
+@contextmanager
+def timed(stage, store=None):
+    """قياس زمن مرحلة للمتجر الحالي (أو المتجر المحدد)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _records.append({
+            'store': store if store is not None else _current_store,
+            'stage': stage,
+            'seconds': round(time.perf_counter() - start, 6),
+        })
+
+
+@contextmanager
+def collect_timings(store):
+    """جمع قياسات متجر واحد في قائمة تُعاد عند الخروج"""
+    global _current_store
+    previous_store = _current_store
+    mark = len(_records)
+    collected = []
+    _current_store = store
+    try:
+        yield collected
+    finally:
+        collected.extend(_records[mark:])
+        del _records[mark:]
+        _current_store = previous_store
+
+
+def take_timings():
+    """إرجاع القياسات المسجلة خارج run_per_store وتفريغها"""
+    records = list(_records)
+    del _records[:]
+    return records
+
+
+def add_timing_arguments(parser):
+    """إضافة خياري --timings و --profile"""
+    parser.add_argument('--timings', metavar='PATH',
+                        help="كتابة تقرير JSON بزمن كل مرحلة لكل متجر")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="حفظ ملف cProfile (يُفتح بـ snakeviz أو flameprof)؛ يفرض التشغيل التسلسلي")
+
+
+def summarize(records):
+    """مجموع الأزمنة لكل متجر ولكل مرحلة"""
+    stores = {}
+    stages = {}
+    for record in records:
+        store = record['store'] or '-'
+        stores.setdefault(store, {})
+        stores[store][record['stage']] = round(stores[store].get(record['stage'], 0) + record['seconds'], 6)
+        stages[record['stage']] = round(stages.get(record['stage'], 0) + record['seconds'], 6)
+    return {'stores': stores, 'stages': stages}
+
+
+def write_timing_report(path, script, records, total_seconds):
+    """كتابة تقرير الأزمنة"""
+    report = {
+        'script': script,
+        'started_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'total_seconds': round(total_seconds, 6),
+        'summary': summarize(records),
+        'records': records,
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def instrumented(args):
+    """تشغيل جسم main مع التقرير والتحليل المطلوبين في args
+
+    يعطي قائمة يضيف إليها السكربت قياسات كل متجر (StoreResult.timings)،
+    وتُضاف إليها عند الخروج أي قياسات سُجلت خارج run_per_store.
+    """
+    records = []
+    profiler = cProfile.Profile() if args.profile else None
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield records
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f"🔬 ملف التحليل: {args.profile}")
+        records.extend(take_timings())
+        if args.timings:
+            write_timing_report(args.timings, os.path.basename(sys.argv[0]), records,
+                                time.perf_counter() - start)
+            print(f"⏱️  تقرير الأزمنة: {args.timings}")
+
+
+def effective_workers(args):
+    """عدد العمليات مع مراعاة --profile (cProfile لا يرى العمليات الفرعية)"""
+    return 1 if getattr(args, 'profile', None) else args.workers
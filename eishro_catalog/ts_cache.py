@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""ذاكرة تحليل ملفات بيانات TS: المنتجات المستخرجة لكل ملف حسب بصمة محتواه
+
+المفتاح هو بصمة blake2b لبايتات الملف مع PARSER_VERSION، فأي تعديل على
+الملف أو على المحلل يعيد التحليل، وغير ذلك تُقرأ المنتجات الجاهزة مباشرة.
+"""
+
+import hashlib
+import json
+import os
+
+from .publish import write_atomic
+from .ts_literal import PARSER_VERSION, iter_source_products
+
+TS_CACHE_PATH = '.ts_parse_cache.json'
+
+CACHE_VERSION = 1
+
+
+def empty_ts_cache():
+    """ذاكرة تحليل فارغة"""
+    return {'version': CACHE_VERSION, 'files': {}}
+
+
+def load_ts_cache(path=TS_CACHE_PATH):
+    """تحميل ذاكرة التحليل من القرص (أو ذاكرة فارغة إن لم توجد)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return empty_ts_cache()
+    if cache.get('version') != CACHE_VERSION:
+        return empty_ts_cache()
+    return cache
+
+
+def save_ts_cache(cache, path=TS_CACHE_PATH):
+    """حفظ ذاكرة التحليل بشكل ذري (قد تعمل عدة سكربتات معاً)"""
+    data = json.dumps(cache, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return write_atomic(path, data)
+
+
+def content_key(data):
+    """مفتاح الذاكرة: بصمة المحتوى مع إصدار المحلل"""
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    return f'{PARSER_VERSION}:{digest}'
+
+
+def cached_ts_products(path, skipped=None, cache=None):
+    """منتجات ملف TS كقائمة قواميس، من الذاكرة إن لم يتغير الملف
+
+    عند تمرير cache تُحدَّث في الذاكرة فقط (ليحفظها المستدعي مرة واحدة)،
+    وإلا تُحمَّل الذاكرة الافتراضية وتُحفظ إن تغيرت.
+    """
+    own_cache = cache is None
+    if own_cache:
+        cache = load_ts_cache()
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    key = content_key(data)
+    file_key = os.path.normpath(path)
+
+    entry = cache['files'].get(file_key)
+    if entry is None or entry.get('key') != key:
+        file_skipped = []
+        products = list(iter_source_products(data.decode('utf-8'), file_skipped))
+        entry = {'key': key, 'products': products, 'skipped': file_skipped}
+        cache['files'][file_key] = entry
+        if own_cache:
+            save_ts_cache(cache)
+
+    if skipped is not None:
+        skipped.extend(tuple(item) for item in entry['skipped'])
+    return entry['products']
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""مقطّع خطي لملفات بيانات TypeScript: إيجاد كائنات المنتجات في تمريرة واحدة
+
+المقطّع يقفز بين الرموز المهمة فقط (الأقواس، النصوص، القوالب، التعليقات)
+بتعبير نمطي واحد، فيتجاهل ما داخل النصوص والتعليقات ويتتبع ${...} داخل
+القوالب، ويحسب أرقام الأسطر تراكمياً بدل العد من بداية الملف لكل منتج.
+"""
+
+import glob
+import re
+from collections import namedtuple
+
+DATA_MODULE_PATTERNS = ('src/data/*Products.ts', 'src/data/stores/*/products.ts')
+
+ProductSpan = namedtuple('ProductSpan', ['start', 'end', 'line', 'product_id', 'store_id'])
+
+_IDENT = r'[A-Za-z_$][\w$]*'
+
+# كل مطابقة تبدأ من نهاية السابقة: الجزء الأول يبتلع داخل محرك التعابير
+# (بلا حلقة بايثون لكل حرف أو نص) كل ما لا يهم: نصاً عادياً، ونصوصاً بين علامات
+# تنصيص، وتعليقات، ويتوقف عند أول رمز مهم. آخر البدائل (. و \Z) تطابق دائماً،
+# فلا تفشل المطابقة ولا يتراجع المحرك داخل التكرار.
+_CODE_TOKEN = re.compile(r'''
+    (?:
+        [^{}`"'/sc]+
+      | "(?!storeId")[^"\\\n]*(?:\\.[^"\\\n]*)*"
+      | '(?!storeId')[^'\\\n]*(?:\\.[^'\\\n]*)*'
+      | //[^\n]*
+      | /\*.*?\*/
+      | /(?![/*])
+      | s(?!toreId)
+      | c(?!onst)
+    )*
+    (?:
+        (?P<store>(?:"storeId"|'storeId'|(?<![\w$.])storeId)\s*:\s*(?P<store_value>\d+|''' + _IDENT + r'''))
+      | (?P<const>\bconst\s+(?P<const_name>''' + _IDENT + r''')\s*=\s*(?P<const_value>\d+)\s*;)
+      | (?P<open>\{(?:\s*(?:"id"|'id'|id)\s*:\s*(?P<product_id>\d+)\s*,)?)
+      | (?P<close>\})
+      | (?P<template>`)
+      | .
+      | \Z
+    )
+''', re.S | re.X)
+
+_TEMPLATE_TOKEN = re.compile(r'\\.|`|\$\{', re.S)
+
+# علامة في المكدس لـ ${ داخل قالب نصي
+_TEMPLATE_EXPR = object()
+
+
+def scan_products(source):
+    """إرجاع ProductSpan لكل كائن يبدأ بـ id رقمي، مع الثوابت العددية في الملف
+
+    store_id يكون رقماً، أو اسم ثابت لم يُعرف قيمته، أو None إن لم يوجد.
+    """
+    spans = []
+    constants = {}
+    stack = []
+    pos = 0
+    line = 1
+    line_pos = 0
+    in_template = False
+
+    while True:
+        if in_template:
+            match = _TEMPLATE_TOKEN.search(source, pos)
+            if match is None:
+                break
+            pos = match.end()
+            token = match.group()
+            if token == '`':
+                in_template = False
+            elif token == '${':
+                stack.append(_TEMPLATE_EXPR)
+                in_template = False
+            continue
+
+        match = _CODE_TOKEN.match(source, pos)
+        if match.end() == pos:
+            break
+        pos = match.end()
+        kind = match.lastgroup
+
+        if kind == 'open':
+            product_id = match.group('product_id')
+            if product_id is None:
+                stack.append(None)
+                continue
+            start = match.start('open')
+            line += source.count('\n', line_pos, start)
+            line_pos = start
+            stack.append([start, line, int(product_id), None])
+        elif kind == 'close':
+            if not stack:
+                continue
+            frame = stack.pop()
+            if frame is _TEMPLATE_EXPR:
+                in_template = True
+            elif frame is not None:
+                spans.append(ProductSpan(frame[0], pos, frame[1], frame[2], frame[3]))
+        elif kind == 'template':
+            in_template = True
+        elif kind == 'store':
+            if stack and isinstance(stack[-1], list) and stack[-1][3] is None:
+                value = match.group('store_value')
+                stack[-1][3] = int(value) if value.isdigit() else value
+        elif kind == 'const':
+            constants[match.group('const_name')] = int(match.group('const_value'))
+
+    spans.sort()
+    resolved = [
+        span._replace(store_id=constants.get(span.store_id, span.store_id))
+        if isinstance(span.store_id, str) else span
+        for span in spans
+    ]
+    return resolved, constants
+
+
+def scan_products_file(path):
+    """قراءة ملف TS وإرجاع (المصدر، المنتجات، الثوابت)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    spans, constants = scan_products(source)
+    return source, spans, constants
+
+
+def data_module_paths(patterns=DATA_MODULE_PATTERNS):
+    """مسارات ملفات بيانات المنتجات في src/data"""
+    paths = set()
+    for pattern in patterns:
+        paths.update(glob.glob(pattern))
+    return sorted(paths)
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""تحويل كائنات TypeScript الحرفية (object literals) إلى قواميس بايثون
+
+يدعم المفاتيح بدون علامات تنصيص، والنصوص بعلامات مفردة أو مزدوجة أو قوالب
+بدون ${}، والفواصل الزائدة، والتعليقات، والثوابت المعرفة في الملف مثل
+MAGNA_BEAUTY_STORE_ID. أي تعبير آخر (استدعاء دالة، spread، ...) يرفع
+TSLiteralError بدل تخمين قيمته.
+"""
+
+import json
+import re
+
+from .ts_extract import scan_products
+
+# يُرفع عند أي تغيير في المقطّع أو المحلل يغيّر ناتج الاستخراج (يبطل ذاكرة التحليل)
+PARSER_VERSION = 2
+
+_STRING = r'''"[^"\\\n]*(?:\\.[^"\\\n]*)*"|'[^'\\\n]*(?:\\.[^'\\\n]*)*'|`[^`\\$]*(?:(?:\\.|\$(?!\{))[^`\\$]*)*`'''
+_NUMBER = r'-?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)'
+_IDENT = r'[A-Za-z_$][\w$]*'
+
+_TOKEN = re.compile(r'''
+    (?P<skip>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>''' + _STRING + r''')
+  | (?P<number>''' + _NUMBER + r''')
+  | (?P<ident>''' + _IDENT + r''')
+  | (?P<punct>\.\.\.|[{}\[\]:,])
+''', re.S | re.X)
+
+# المسار السريع إلى json.loads: كل مطابقة = جزء مطابق لـ JSON كما هو (plain)
+# ثم رمز واحد يختلف عنه (تعليق، نص غير JSON، مفتاح بلا علامات تنصيص، معرف،
+# فاصلة زائدة). آخر البدائل (. و \Z) تطابق دائماً فلا تراجع في التكرار.
+_JSON_TOKEN = re.compile(r'''
+    (?P<plain>(?:
+        [^"'`/,A-Za-z_$]+
+      | "[^"\\\n]*"
+      | /(?![/*])
+      | ,(?!\s*[}\]])
+    )*)
+    (?:
+        (?P<skip>//[^\n]*|/\*.*?\*/)
+      | (?P<string>''' + _STRING + r''')
+      | (?<![\w$.])(?P<key>''' + _IDENT + r''')(?=\s*:)
+      | (?<![\w$.])(?P<ident>''' + _IDENT + r''')
+      | (?P<comma>,)
+      | .
+      | \Z
+    )
+''', re.S | re.X)
+
+_ESCAPE = re.compile(r'''\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)''', re.S)
+
+_SIMPLE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+    '\n': '', '\r\n': '', '\u2028': '', '\u2029': '',
+}
+
+_KEYWORDS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+
+class TSLiteralError(ValueError):
+    """تعبير لا يمكن تحويله إلى قيمة ثابتة"""
+
+
+def _unescape_match(match):
+    escape = match.group(1)
+    if escape[0] == 'u' and len(escape) > 1:
+        return chr(int(escape[1:].strip('{}'), 16))
+    if escape[0] == 'x' and len(escape) == 3:
+        return chr(int(escape[1:], 16))
+    return _SIMPLE_ESCAPES.get(escape, escape)
+
+
+def _string_value(token):
+    body = token[1:-1]
+    if '\\' not in body:
+        return body
+    return _ESCAPE.sub(_unescape_match, body)
+
+
+def _tokenize(text):
+    tokens = []
+    pos = 0
+    length = len(text)
+    while pos < length:
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            raise TSLiteralError(f"رمز غير مدعوم عند الموضع {pos}: {text[pos:pos + 20]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind != 'skip':
+            tokens.append((kind, match.group()))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens, constants):
+        self.tokens = tokens
+        self.constants = constants
+        self.index = 0
+
+    def next(self):
+        if self.index >= len(self.tokens):
+            raise TSLiteralError("نهاية غير متوقعة للكائن")
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def peek(self):
+        return self.tokens[self.index] if self.index < len(self.tokens) else (None, None)
+
+    def resolve(self, name):
+        if name in _KEYWORDS:
+            return _KEYWORDS[name]
+        if name in self.constants:
+            return self.constants[name]
+        raise TSLiteralError(f"معرف غير معروف: {name}")
+
+    def value(self):
+        kind, token = self.next()
+        if kind == 'string':
+            if token[0] == '`' and '${' in token:
+                raise TSLiteralError("قوالب نصية بتعبيرات غير مدعومة")
+            return _string_value(token)
+        if kind == 'number':
+            if token.lstrip('-')[:2] in ('0x', '0X'):
+                return int(token, 16)
+            if any(c in token for c in '.eE'):
+                return float(token)
+            return int(token)
+        if kind == 'ident':
+            return self.resolve(token)
+        if token == '{':
+            return self.object()
+        if token == '[':
+            return self.array()
+        raise TSLiteralError(f"رمز غير متوقع: {token}")
+
+    def object(self):
+        result = {}
+        while True:
+            kind, token = self.next()
+            if token == '}':
+                return result
+            if token == '...':
+                raise TSLiteralError("spread غير مدعوم")
+            if kind == 'string':
+                key = _string_value(token)
+            elif kind in ('ident', 'number'):
+                key = token
+            else:
+                raise TSLiteralError(f"مفتاح غير متوقع: {token}")
+            separator = self.next()[1]
+            if separator == ':':
+                result[key] = self.value()
+                separator = self.next()[1]
+            elif kind == 'ident':
+                result[key] = self.resolve(key)  # { name } المختصرة
+            else:
+                raise TSLiteralError(f"متوقع ':' بعد {key}")
+            if separator == '}':
+                return result
+            if separator != ',':
+                raise TSLiteralError(f"متوقع ',' أو '}}' ووجد {separator}")
+
+    def array(self):
+        result = []
+        while True:
+            if self.peek()[1] == ']':
+                self.next()
+                return result
+            if self.peek()[1] == '...':
+                raise TSLiteralError("spread غير مدعوم")
+            result.append(self.value())
+            separator = self.next()[1]
+            if separator == ']':
+                return result
+            if separator != ',':
+                raise TSLiteralError(f"متوقع ',' أو ']' ووجد {separator}")
+
+
+def _json_text(text, constants):
+    """نص JSON مكافئ للكائن الحرفي، أو TSLiteralError لما لا يُترجم مباشرة"""
+
+    def replace(match):
+        kind = match.lastgroup
+        if kind == 'plain':
+            return match.group()
+        plain = match.group('plain')
+        token = match.group(kind)
+        if kind == 'skip':
+            return plain + ' '
+        if kind == 'comma':
+            return plain
+        if kind == 'key':
+            return f'{plain}"{token}"'
+        if kind == 'ident':
+            if token in _KEYWORDS:
+                return plain + json.dumps(_KEYWORDS[token])
+            if token in constants:
+                return plain + json.dumps(constants[token])
+            raise TSLiteralError(f"معرف غير معروف: {token}")
+        if token[0] == '`' and '${' in token:
+            raise TSLiteralError("قوالب نصية بتعبيرات غير مدعومة")
+        # ensure_ascii=False يبقي أنصاف الأزواج (surrogates) كما يفكها _string_value
+        return plain + json.dumps(_string_value(token), ensure_ascii=False)
+
+    return _JSON_TOKEN.sub(replace, text)
+
+
+def parse_ts_literal(text, constants=None):
+    """تحويل نص كائن أو مصفوفة TypeScript حرفية إلى قيمة بايثون
+
+    الكائنات التي تُترجم إلى JSON صالح تُحلَّل بـ json.loads، وما عدا ذلك
+    (أرقام ست عشرية، مفاتيح رقمية، { name } المختصرة، أخطاء) يمر بالمحلل الكامل
+    الذي يعطي نفس القيم أو يرفع الخطأ المناسب.
+    """
+    constants = constants or {}
+    try:
+        return json.loads(_json_text(text, constants))
+    except ValueError:
+        pass
+    parser = _Parser(_tokenize(text), constants)
+    result = parser.value()
+    if parser.index != len(parser.tokens):
+        raise TSLiteralError("نص زائد بعد نهاية الكائن")
+    return result
+
+
+def iter_source_products(source, skipped=None):
+    """توليد منتجات نص ملف TS كقواميس، واحداً تلو الآخر
+
+    المنتجات التي لا يمكن تحويلها تُتخطى، وتُضاف (رقم السطر، الخطأ) إلى
+    skipped إن مُررت قائمة.
+    """
+    spans, constants = scan_products(source)
+    for span in spans:
+        try:
+            product = parse_ts_literal(source[span.start:span.end], constants)
+        except TSLiteralError as e:
+            if skipped is not None:
+                skipped.append((span.line, str(e)))
+            continue
+        if isinstance(span.store_id, int):
+            product['storeId'] = span.store_id
+        yield product
+
+
+def iter_ts_products(path, skipped=None):
+    """توليد منتجات ملف TS كقواميس (انظر iter_source_products)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    yield from iter_source_products(source, skipped)
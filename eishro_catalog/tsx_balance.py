@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""فحص توازن الأقواس في ملفات TS/TSX مع فهم السياق اللغوي
+
+المقطّع يقفز بين الرموز المهمة بتعبيرات نمطية كما في ts_extract، ويتجاهل ما
+داخل النصوص والقوالب (مع تتبع ${...}) والتعليقات والتعبيرات النمطية ونص JSX،
+ويتتبع وسوم JSX نفسها. عند أول خلل يُبلّغ عن القوس المفتوح الذي لم يُغلق
+(سطره وعموده والمكوّن الذي يحتويه) بدل عدّ الأحرف في كل الملف.
+"""
+
+import bisect
+import json
+import os
+import re
+from collections import namedtuple
+
+CHECKER_VERSION = 4
+
+CHECK_CACHE_PATH = '.tsx_check_cache.json'
+
+Imbalance = namedtuple('Imbalance', ['line', 'column', 'message', 'component'])
+
+_CLOSERS = {')': '(', ']': '[', '}': '{'}
+
+_CODE_TOKEN = re.compile(r'''
+    "(?:[^"\\\n]|\\.)*"
+  | '(?:[^'\\\n]|\\.)*'
+  | //[^\n]*
+  | /\*.*?\*/
+  | /\*
+  | ["']
+  | [{}()\[\]`<]
+  | /
+''', re.S | re.X)
+
+_TEMPLATE_TOKEN = re.compile(r'\\.|`|\$\{', re.S)
+_TAG_TOKEN = re.compile(r'"[^"]*"|\'[^\']*\'|[{>]|/>')
+_CHILDREN_TOKEN = re.compile(r'[{}<]')
+
+_REGEX_LITERAL = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*')
+_TAG_NAME = re.compile(r'<\s*([A-Za-z_$][\w$.:-]*)')
+_CLOSE_TAG = re.compile(r'</\s*([\w$.:-]*)\s*>')
+# معاملات نوع لدالة سهمية عامة في TSX: <T,>(...) أو <T extends X>(...)
+_TYPE_PARAMS = re.compile(r'<\s*(?:const\s+)?[A-Za-z_$][\w$]*\s*(?:,|extends\b(?!\s*=))')
+
+# بعد هذه الرموز أو الكلمات يبدأ تعبير جديد: / تعبير نمطي و < وسم JSX
+_EXPRESSION_START = set('(,=:[!&|?{};')
+_REGEX_AFTER = _EXPRESSION_START | set('+-*%<>~^')
+_JSX_AFTER = _EXPRESSION_START | {'>'}
+_EXPRESSION_KEYWORDS = {
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'yield', 'await',
+    'void', 'delete', 'throw', 'default',
+}
+
+# تصريحات المكوّنات (أسماء تبدأ بحرف كبير) في بداية السطر
+_DECLARATION = re.compile(
+    r'^[ \t]*(?:export\s+)?(?:default\s+)?(?:async\s+)?'
+    r'(?:function\s*\*?\s*|(?:const|let|var|class)\s+)([A-Z][\w$]*)',
+    re.M,
+)
+
+
+def _starts_expression(source, pos, allowed, floor=0):
+    # هل الرمز عند pos في بداية تعبير؟ (بالنظر إلى ما قبله حتى floor)
+    index = pos - 1
+    while index >= floor and source[index] in ' \t\r\n':
+        index -= 1
+    if index < floor:
+        return True
+    char = source[index]
+    if char in allowed:
+        return True
+    if char.isalpha():
+        start = index
+        while start > 0 and (source[start - 1].isalnum() or source[start - 1] in '_$'):
+            start -= 1
+        return source[start:index + 1] in _EXPRESSION_KEYWORDS
+    return False
+
+
+class _Components:
+    """أسماء التصريحات ومواضعها لمعرفة المكوّن المحيط بموضع ما"""
+
+    def __init__(self, source):
+        self.starts = []
+        self.names = []
+        for match in _DECLARATION.finditer(source):
+            self.starts.append(match.start())
+            self.names.append(match.group(1))
+
+    def at(self, pos):
+        index = bisect.bisect_right(self.starts, pos) - 1
+        return self.names[index] if index >= 0 else None
+
+
+def _position(source, pos):
+    line = source.count('\n', 0, pos) + 1
+    return line, pos - (source.rfind('\n', 0, pos) + 1) + 1
+
+
+JSX_EXTENSIONS = ('.tsx', '.jsx')
+
+
+def uses_jsx(path):
+    """هل يُحلل الملف بوسوم JSX؟ في .ts و .js تكون <T>x تحويل نوع لا وسماً"""
+    return path.endswith(JSX_EXTENSIONS)
+
+
+def check_source(source, jsx=True):
+    """أول خلل في توازن الأقواس (ووسوم JSX مع jsx)، أو None إن كان الملف متوازناً"""
+    return _scan(source, jsx=jsx)[0]
+
+
+def construct_end(source, start, jsx=True):
+    """نهاية البناء الذي يبدأ عند start: (خلل أو None، موضع بعد نهاية سطره الأخير)
+
+    البناء ينتهي عند أول نهاية سطر تُغلق فيها كل الأقواس والوسوم التي فُتحت
+    منذ start، مثل دالة أو مكوّن أو عنصر JSX كامل أو تعبير {cond && (...)}.
+    """
+    return _scan(source, start, until_closed=True, jsx=jsx)
+
+
+def _scan(source, start=0, until_closed=False, jsx=True):
+    # كل إطار: [الرمز الفاتح، الموضع، الوضع بعد الإغلاق، اسم الوسم]
+    stack = []
+    mode = 'code'
+    pos = start
+    seen = False
+    components = None
+
+    def report(at, message, opener=None):
+        nonlocal components
+        if components is None:
+            components = _Components(source)
+        if opener is not None:
+            opener_line, opener_column = _position(source, opener[1])
+            what = f'<{opener[3]}>' if opener[0] == '<' else opener[0]
+            message += f"؛ المفتوح {what} في السطر {opener_line}:{opener_column} لم يُغلق"
+            at = opener[1]
+        line, column = _position(source, at)
+        return Imbalance(line, column, message, components.at(at)), None
+
+    while True:
+        if mode == 'template':
+            match = _TEMPLATE_TOKEN.search(source, pos)
+            if match is None:
+                return report(len(source), "قالب نصي ` غير مغلق")
+            pos = match.end()
+            if match.group() == '`':
+                mode = stack.pop()[2]
+            elif match.group() == '${':
+                stack.append(['{', match.start(), 'template', None])
+                mode = 'code'
+            continue
+
+        if mode == 'tag':
+            match = _TAG_TOKEN.search(source, pos)
+            if match is None:
+                return report(len(source), "وسم JSX غير مكتمل", stack[-1])
+            pos = match.end()
+            token = match.group()
+            if token == '{':
+                stack.append(['{', match.start(), 'tag', None])
+                mode = 'code'
+            elif token == '/>':
+                mode = stack.pop()[2]
+            elif token == '>':
+                mode = 'children'
+            continue
+
+        if mode == 'children':
+            match = _CHILDREN_TOKEN.search(source, pos)
+            if match is None:
+                return report(len(source), "نهاية الملف داخل عنصر JSX", stack[-1])
+            begin = match.start()
+            if match.group() == '}':
+                # } في نص JSX خطأ في TSX: عنصر لم يُغلق، أو بقية تعبير {cond && (...)} حُذف أوله
+                return report(begin, f"}} في السطر {_position(source, begin)[0]} داخل نص JSX", stack[-1])
+            if match.group() == '{':
+                stack.append(['{', begin, 'children', None])
+                pos = match.end()
+                mode = 'code'
+                continue
+            closing = _CLOSE_TAG.match(source, begin)
+            if closing is not None:
+                frame = stack[-1]
+                if closing.group(1) != frame[3]:
+                    return report(begin, f"وسم إغلاق </{closing.group(1)}> لا يطابق", frame)
+                stack.pop()
+                pos = closing.end()
+                mode = frame[2]
+                continue
+            mode, pos = _open_tag(source, begin, stack, 'children')
+            continue
+
+        match = _CODE_TOKEN.search(source, pos)
+        if until_closed and seen and not stack:
+            newline = source.find('\n', pos)
+            if newline == -1:
+                return None, len(source)
+            if match is None or match.start() > newline:
+                return None, newline + 1
+        if match is None:
+            break
+        pos = match.end()
+        token = match.group()
+        char = token[0]
+        begin = match.start()
+        if not token.startswith(('//', '/*')):
+            seen = True
+
+        if char in '{([':
+            stack.append([char, begin, 'code', None])
+        elif char in '})]':
+            if not stack:
+                return report(begin, f"{char} زائد بلا قوس مفتوح")
+            frame = stack[-1]
+            if frame[0] != _CLOSERS[char]:
+                return report(begin, f"{char} في السطر {_position(source, begin)[0]} لا يطابق", frame)
+            stack.pop()
+            mode = frame[2]
+        elif char == '`':
+            stack.append(['`', begin, mode, None])
+            mode = 'template'
+        elif char == '<':
+            if jsx and _starts_expression(source, begin, _JSX_AFTER, start) and (
+                source.startswith('>', pos) or _TAG_NAME.match(source, begin)
+            ) and not _TYPE_PARAMS.match(source, begin):
+                mode, pos = _open_tag(source, begin, stack, 'code')
+        elif token == '/*':
+            return report(begin, "تعليق /* غير مغلق")
+        elif token in ('"', "'"):
+            return report(begin, f"نص {token} غير مغلق في نفس السطر")
+        elif token == '/' and _starts_expression(source, begin, _REGEX_AFTER, start):
+            regex = _REGEX_LITERAL.match(source, begin)
+            if regex is not None:
+                pos = regex.end()
+
+    if stack:
+        return report(len(source), "نهاية الملف والأقواس غير مغلقة", stack[-1])
+    return None, len(source)
+
+
+def _open_tag(source, start, stack, resume):
+    # بداية عنصر JSX: <> أو <Name ...؛ يُرجع (الوضع التالي، الموضع)
+    if source.startswith('<>', start):
+        stack.append(['<', start, resume, ''])
+        return 'children', start + 2
+    name = _TAG_NAME.match(source, start)
+    if name is None:
+        return resume, start + 1
+    stack.append(['<', start, resume, name.group(1)])
+    return 'tag', name.end()
+
+
+def check_file(path):
+    """فحص ملف واحد: Imbalance أو None"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return check_source(f.read(), uses_jsx(path))
+
+
+def source_paths(roots, extensions=('.ts', '.tsx')):
+    """ملفات TS/TSX تحت الجذور (أو الملفات نفسها)، مرتبة"""
+    paths = []
+    for root in roots:
+        if os.path.isfile(root):
+            if root.endswith(extensions):
+                paths.append(root)
+            continue
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames[:] = [name for name in dirnames if name != 'node_modules']
+            paths += [os.path.join(directory, name) for name in filenames if name.endswith(extensions)]
+    return sorted(paths)
+
+
+def file_signature(path):
+    """(mtime_ns، الحجم) لمعرفة إن تغير الملف منذ آخر فحص"""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def load_check_cache(path=CHECK_CACHE_PATH):
+    """نتائج آخر فحص: {'version', 'files': {مسار: [توقيع، خلل أو None]}}"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {'version': CHECKER_VERSION, 'files': {}}
+    if cache.get('version') != CHECKER_VERSION:
+        return {'version': CHECKER_VERSION, 'files': {}}
+    return cache
+
+
+def save_check_cache(cache, path=CHECK_CACHE_PATH):
+    """حفظ نتائج الفحص بكتابة ذرية"""
+    from .publish import write_atomic
+    write_atomic(path, json.dumps(cache, ensure_ascii=False).encode('utf-8'))
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""مراقبة ملفات store.json وإعادة المعالجة عند تغيرها
+
+على لينكس تُستخدم inotify مباشرة عبر ctypes (بدون مكتبات خارجية)، وفي غير
+ذلك فحص دوري لتوقيع الملفات. التغييرات المتتابعة تُجمع (debounce) حتى
+يهدأ المجلد، ثم تُمرر المتاجر التي تغيرت فقط إلى دالة المعالجة. الملفات
+التي كتبتها المعالجة نفسها تُتجاهل حتى لا تدخل المراقبة في حلقة.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+
+from .stores import ASSETS_DIR
+
+STORE_FILE = 'store.json'
+
+# ثوابت inotify من <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def file_signature(path):
+    """توقيع الملف (inode، وقت التعديل، الحجم) أو None إن لم يوجد"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class PollingSource:
+    """مصدر تغييرات بالفحص الدوري لتوقيع كل store.json"""
+
+    def __init__(self, assets_dir, interval=1.0):
+        self.assets_dir = assets_dir
+        self.interval = interval
+        self.signatures = self._scan()
+
+    def _scan(self):
+        signatures = {}
+        try:
+            entries = os.listdir(self.assets_dir)
+        except FileNotFoundError:
+            return signatures
+        for entry in entries:
+            signature = file_signature(os.path.join(self.assets_dir, entry, STORE_FILE))
+            if signature is not None:
+                signatures[entry] = signature
+        return signatures
+
+    def wait(self, timeout):
+        """انتظار حتى timeout ثانية وإرجاع مجموعة المتاجر التي تغيرت"""
+        time.sleep(min(timeout, self.interval) if timeout is not None else self.interval)
+        current = self._scan()
+        changed = {folder for folder, signature in current.items() if self.signatures.get(folder) != signature}
+        self.signatures = current
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifySource:
+    """مصدر تغييرات عبر inotify: مراقبة مجلد الأصول وكل مجلد متجر فيه"""
+
+    def __init__(self, assets_dir):
+        libc_name = ctypes.util.find_library('c')
+        if libc_name is None:
+            raise OSError("libc غير موجودة")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError("inotify غير مدعومة")
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 فشلت")
+        self.assets_dir = assets_dir
+        self.folders = {}
+        self._root_wd = self._add_watch(assets_dir, IN_CREATE | IN_MOVED_TO)
+        for entry in sorted(os.listdir(assets_dir)):
+            self._watch_folder(entry)
+
+    def _add_watch(self, path, mask):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch فشلت: {path}")
+        return wd
+
+    def _watch_folder(self, folder):
+        path = os.path.join(self.assets_dir, folder)
+        if not os.path.isdir(path):
+            return
+        # write_atomic يكتب بإعادة التسمية (IN_MOVED_TO)، والمحررات قد تكتب مباشرة (IN_CLOSE_WRITE)
+        wd = self._add_watch(path, IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE_SELF)
+        self.folders[wd] = folder
+
+    def _read_events(self):
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+            offset += length
+            yield wd, mask, name
+
+    def wait(self, timeout):
+        """انتظار حتى timeout ثانية (None بلا حد) وإرجاع مجموعة المتاجر التي تغيرت"""
+        changed = set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return changed
+        for wd, mask, name in self._read_events():
+            if mask & IN_IGNORED:
+                self.folders.pop(wd, None)
+            elif wd == self._root_wd:
+                if mask & IN_ISDIR:
+                    self._watch_folder(name)
+                    if os.path.isfile(os.path.join(self.assets_dir, name, STORE_FILE)):
+                        changed.add(name)
+            elif name == STORE_FILE and wd in self.folders:
+                changed.add(self.folders[wd])
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def open_source(assets_dir=ASSETS_DIR, polling=False, interval=1.0):
+    """inotify إن أمكن، وإلا الفحص الدوري"""
+    if not polling:
+        try:
+            return InotifySource(assets_dir)
+        except (OSError, AttributeError):
+            pass
+    return PollingSource(assets_dir, interval)
+
+
+def watch_stores(process, assets_dir=ASSETS_DIR, debounce=0.3, polling=False, interval=1.0,
+                 on_start=None):
+    """حلقة المراقبة: process(folders) تُستدعى بمجموعة المتاجر التي تغيرت
+
+    process تُرجع مسارات الملفات التي كتبتها، فيُحفظ توقيعها ويُتجاهل الحدث
+    الناتج عن كتابتها. تعمل حتى KeyboardInterrupt.
+    """
+    source = open_source(assets_dir, polling, interval)
+    own_writes = {}
+    if on_start is not None:
+        on_start(source)
+    try:
+        while True:
+            pending = source.wait(None if isinstance(source, InotifySource) else interval)
+            if not pending:
+                continue
+            # debounce: نستمر في الجمع حتى تمر فترة هادئة كاملة
+            while True:
+                more = source.wait(debounce)
+                if not more:
+                    break
+                pending |= more
+
+            changed = set()
+            for folder in pending:
+                path = os.path.normpath(os.path.join(assets_dir, folder, STORE_FILE))
+                signature = file_signature(path)
+                if signature is None:
+                    continue
+                if own_writes.get(path) == signature:
+                    continue
+                changed.add(folder)
+            if not changed:
+                continue
+
+            for path in process(sorted(changed)) or ():
+                path = os.path.normpath(path)
+                own_writes[path] = file_signature(path)
+                if isinstance(source, PollingSource):
+                    folder = os.path.basename(os.path.dirname(path))
+                    source.signatures[folder] = own_writes[path]
+    finally:
+        source.close()
@@ -1,43 +1,22 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
 import json
 import os
-import sys
-import io
-import re
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-def calculate_badge(product):
-    """حساب التمييز بناءً على الإحصائيات"""
-    quantity = product.get('quantity', 0)
-    orders = product.get('orders', 0)
-    likes = product.get('likes', 0)
-    views = product.get('views', 0)
-    price = product.get('price', 0)
-    original_price = product.get('originalPrice', 0)
-    
-    discount = 0
-    if original_price > 0:
-        discount = ((original_price - price) / original_price) * 100
-    
-    if quantity <= 0:
-        return "غير متوفر"
-    elif discount > 10:
-        return "تخفيضات"
-    elif orders > 100 and likes > 200:
-        return "مميزة"
-    elif orders > 100:
-        return "أكثر مبيعاً"
-    elif likes > 200:
-        return "أكثر إعجاباً"
-    elif orders > 50:
-        return "أكثر طلباً"
-    elif views > 400:
-        return "أكثر مشاهدة"
-    else:
-        return "جديد"
+from eishro_catalog import assign_badges
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.incremental import (
+    changed_products,
+    forget_store,
+    load_badge_cache,
+    remember_store_file,
+    save_badge_cache,
+    store_file_unchanged,
+)
+from eishro_catalog.publish import publish_store
+from eishro_catalog.ts_cache import cached_ts_products
 
 def extract_products_from_ts():
     """استخراج المنتجات من allStoreProducts.ts"""
@@ -50,41 +29,17 @@ def extract_products_from_ts():
     }
     
     try:
-        with open('src/data/allStoreProducts.ts', 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         products_in_file = []
+        skipped = []
         
-        pattern = r'\{\s*id:\s*(\d+),\s*storeId:\s*(?:MAGNA_BEAUTY_STORE_ID|(\d+)),'
-        for match in re.finditer(pattern, content):
-            product_id = int(match.group(1))
-            store_id = int(match.group(2)) if match.group(2) else 5
-            
-            start = match.start()
-            brace_count = 1
-            pos = match.start() + 1
-            
-            while brace_count > 0 and pos < len(content):
-                if content[pos] == '{':
-                    brace_count += 1
-                elif content[pos] == '}':
-                    brace_count -= 1
-                pos += 1
-            
-            product_str = content[start:pos]
-            
-            try:
-                product_json = '{' + product_str.split('{', 1)[1].rsplit('}', 1)[0] + '}'
-                product_json = product_json.replace("MAGNA_BEAUTY_STORE_ID", "5")
-                product_json = product_json.replace("\n", " ")
-                product_json = re.sub(r',\s*\}', '}', product_json)
-                
-                product_dict = {}
-                if 'storeId' in product_json:
-                    if store_id in stores:
-                        products_in_file.append((store_id, product_id, product_str))
-            except:
-                pass
+        for product in cached_ts_products('src/data/allStoreProducts.ts', skipped):
+            store_id = product.get('storeId')
+            if store_id in stores:
+                stores[store_id]['products'].append(product)
+                products_in_file.append((store_id, product['id'], product))
+        
+        for line, error in skipped:
+            print(f"تحذير: تعذر تحويل المنتج في السطر {line}: {error}")
         
         print(f"عدد المنتجات المستخرجة: {len(products_in_file)}")
         return products_in_file, stores
@@ -93,8 +48,12 @@ def extract_products_from_ts():
         print(f"خطأ: {str(e)}")
         return [], {}
 
-def load_and_process_stores():
-    """تحميل ملفات store.json وتحديث المنتجات"""
+def load_and_process_stores(incremental=False, ts_stores=None):
+    """تحميل ملفات store.json وتحديث المنتجات
+
+    عند تمرير ts_stores (من extract_products_from_ts) تُستبدل منتجات كل متجر
+    له منتجات في ملفات TS بتلك المنتجات قبل حساب الشارات.
+    """
     store_config = {
         1: {'folder': 'nawaem', 'name': 'نواعم'},
         2: {'folder': 'sheirine', 'name': 'شيرين'},
@@ -106,6 +65,9 @@ def load_and_process_stores():
     print("\nمعالجة ملفات store.json:")
     print("=" * 60)
     
+    cache = load_badge_cache() if incremental else None
+    written_count = 0
+    
     for store_id, config in store_config.items():
         store_path = f"public/assets/{config['folder']}/store.json"
         
@@ -113,45 +75,73 @@ def load_and_process_stores():
             print(f"تحذير: لم يتم العثور على {store_path}")
             continue
         
+        ts_products = (ts_stores or {}).get(store_id, {}).get('products')
+        
+        if not ts_products and cache is not None and store_file_unchanged(cache, config['folder'], store_path):
+            print(f"SKIP - {config['name']}: لا تغيير منذ التشغيل السابق")
+            continue
+        
         try:
             with open(store_path, 'r', encoding='utf-8') as f:
                 store_data = json.load(f)
             
+            products_replaced = False
+            if ts_products:
+                products_replaced = store_data.get('products') != ts_products
+                store_data['products'] = ts_products
+                print(f"TS - {config['name']}: {len(ts_products)} منتج من ملفات البيانات")
+            
             products = store_data.get('products', [])
-            updated_count = 0
+            rated_products = [p for p in products if all(k in p for k in ['rating', 'orders', 'likes'])]
+            if cache is not None:
+                changed = changed_products(cache, config['folder'], rated_products)
+                # منتجات TS جديدة من المصدر فلا يُعتمد على شاراتها السابقة
+                if not ts_products:
+                    rated_products = changed
+            updated_count = assign_badges(rated_products, with_color=False)
             
-            for product in products:
-                if all(k in product for k in ['rating', 'orders', 'likes']):
-                    old_badge = product.get('badge', '')
-                    new_badge = calculate_badge(product)
-                    
-                    if new_badge and (old_badge != new_badge):
-                        product['badge'] = new_badge
-                        updated_count += 1
-                    elif new_badge and 'badge' not in product:
-                        product['badge'] = new_badge
-                        updated_count += 1
+            if cache is not None and updated_count == 0 and not products_replaced:
+                remember_store_file(cache, config['folder'], store_path)
+                print(f"OK - {config['name']}: {len(products)} منتج، لا تغيير في الشارات")
+                continue
             
-            with open(store_path, 'w', encoding='utf-8') as f:
-                json.dump(store_data, f, ensure_ascii=False, indent=2)
+            if publish_store(config['folder'], store_data):
+                written_count += 1
             
-            dist_path = f"dist/assets/{config['folder']}/store.json"
-            os.makedirs(os.path.dirname(dist_path), exist_ok=True)
-            with open(dist_path, 'w', encoding='utf-8') as f:
-                json.dump(store_data, f, ensure_ascii=False, indent=2)
+            if cache is not None:
+                remember_store_file(cache, config['folder'], store_path)
             
             print(f"OK - {config['name']}: {len(products)} منتج، تم تحديث {updated_count}")
             
         except Exception as e:
+            if cache is not None:
+                forget_store(cache, config['folder'])
             print(f"خطأ - {config['name']}: {str(e)}")
+    
+    if cache is not None:
+        save_badge_cache(cache)
+    
+    print(f"عدد المتاجر التي كُتبت فعلاً: {written_count}")
 
-def main():
+def main(argv=None):
     """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="معالجة التمييز والإحصائيات للمتاجر")
+    parser.add_argument('--incremental', action='store_true',
+                        help="إعادة حساب المنتجات التي تغيرت إحصائياتها فقط")
+    parser.add_argument('--from-ts', action='store_true',
+                        help="أخذ المنتجات من src/data/allStoreProducts.ts بدل store.json الحالي")
+    args = parser.parse_args(argv)
+    
     print("=" * 60)
     print("نظام معالجة التمييز والإحصائيات للمتاجر الخمسة")
     print("=" * 60)
     
-    load_and_process_stores()
+    ts_stores = None
+    if args.from_ts:
+        _, ts_stores = extract_products_from_ts()
+    
+    load_and_process_stores(incremental=args.incremental, ts_stores=ts_stores)
     
     print("=" * 60)
     print("اكتمل المعالجة بنجاح")
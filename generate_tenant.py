@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import os
+import time
+
+from eishro_catalog import calculate_badge, get_badge_color
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.seed_export import MAX_INTEGER_ID, SeedWriter, product_row, store_row
+from eishro_catalog.store_io import write_store_stream
+from eishro_catalog.stores import ASSETS_DIR, store_path
+from eishro_catalog.synthetic import existing_images, iter_synthetic_products, synthetic_store_header
+
+DEFAULT_MERCHANT_ID = '00000000-0000-0000-0000-000000000001'
+
+# خارج public/assets حتى لا تلتقطها discover_stores في أدوات الشارات والنشر
+DEFAULT_OUTPUT_DIR = 'synthetic_tenants'
+
+# معرفات المنتجات متتالية بعد هذا الرقم عبر كل المتاجر المولدة، فتبقى ضمن INTEGER
+DEFAULT_ID_OFFSET = 100000000
+
+def tenant_products(count, seed, store_id, folder, image_pool, seed_writer, timestamp, first_id):
+    """منتجات المتجر بشاراتها، مع تمرير كل منتج إلى كاتب البذور أثناء المرور"""
+    for product in iter_synthetic_products(count, seed, store_id, folder, image_pool, first_id):
+        product['badge'] = calculate_badge(product)
+        product['badgeColor'] = get_badge_color(product['badge'])
+        seed_writer.add_product(product_row(product, timestamp))
+        yield product
+
+def generate_tenant(store_id, count, args, image_pool, seed_writer, timestamp, first_id):
+    """كتابة store.json لمتجر مولد (متدفقاً) وإرجاع مساره"""
+    folder = f'tenant-{store_id}'
+    header = synthetic_store_header(store_id, folder)
+    logos = [image for image in image_pool if image.startswith('/assets/stores/')]
+    if logos:
+        header['logo'] = logos[store_id % len(logos)]
+    seed_writer.add_store(store_row(header, args.merchant_id, timestamp))
+    
+    path = store_path(folder, args.output_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            products = tenant_products(count, args.seed, store_id, folder, image_pool, seed_writer, timestamp, first_id)
+            write_store_stream(f, header, products)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+def main(argv=None):
+    """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="توليد متاجر كبيرة لاختبار تحمل الخادم: store.json وبذور SQL/CSV")
+    parser.add_argument('--products', type=int, default=10000, help="عدد المنتجات لكل متجر")
+    parser.add_argument('--tenants', type=int, default=1, help="عدد المتاجر")
+    parser.add_argument('--store-id', type=int, default=900, help="معرف أول متجر (المجلد tenant-<id>)")
+    parser.add_argument('--seed', type=int, default=0, help="بذرة التوليد")
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR,
+                        help="المجلد الذي تُكتب فيه tenant-<id>/store.json (الافتراضي خارج public/assets)")
+    parser.add_argument('--id-offset', type=int, default=DEFAULT_ID_OFFSET,
+                        help="معرفات المنتجات تبدأ بعد هذا الرقم وتتتالى عبر كل المتاجر")
+    parser.add_argument('--seed-dir', default='synthetic_seeds', help="مجلد ملفات SQL و CSV")
+    parser.add_argument('--merchant-id', default=DEFAULT_MERCHANT_ID,
+                        help="معرف UUID لمستخدم تاجر موجود في جدول users (stores.merchant_id)")
+    parser.add_argument('--no-sql', action='store_true', help="بدون ملف seed.sql")
+    parser.add_argument('--no-csv', action='store_true', help="بدون ملفات CSV")
+    args = parser.parse_args(argv)
+    
+    last_id = args.id_offset + args.tenants * args.products
+    if args.id_offset < 0 or last_id > MAX_INTEGER_ID:
+        parser.error(f"آخر معرف ({last_id:,}) يتجاوز حد INTEGER ({MAX_INTEGER_ID:,}): قلل --id-offset أو --products")
+    
+    image_pool = existing_images(ASSETS_DIR)
+    timestamp = time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
+    os.makedirs(args.seed_dir, exist_ok=True)
+    
+    files = []
+    try:
+        sql = None if args.no_sql else open(os.path.join(args.seed_dir, 'seed.sql'), 'w', encoding='utf-8')
+        stores_csv = None if args.no_csv else open(os.path.join(args.seed_dir, 'stores.csv'), 'w', encoding='utf-8', newline='')
+        products_csv = None if args.no_csv else open(os.path.join(args.seed_dir, 'products.csv'), 'w', encoding='utf-8', newline='')
+        files = [f for f in (sql, stores_csv, products_csv) if f is not None]
+        seed_writer = SeedWriter(sql, stores_csv, products_csv)
+        
+        print(f"🏭 توليد {args.tenants} متجر × {args.products:,} منتج ({len(image_pool)} صورة موجودة)")
+        start = time.perf_counter()
+        for index, store_id in enumerate(range(args.store_id, args.store_id + args.tenants)):
+            first_id = args.id_offset + index * args.products + 1
+            path = generate_tenant(store_id, args.products, args, image_pool, seed_writer, timestamp, first_id)
+            print(f"✅ {path}")
+        seed_writer.close()
+    finally:
+        for f in files:
+            f.close()
+    
+    for f in files:
+        print(f"💾 {f.name}")
+    print(f"⏱️  {time.perf_counter() - start:.2f} ث")
+
+if __name__ == '__main__':
+    main()
@@ -2,46 +2,11 @@
 # -*- coding: utf-8 -*-
 
 import json
-import sys
-import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-def calculate_badge(product):
-    """حساب الشارة بناءً على بيانات المنتج"""
-    quantity = product.get('quantity', 0)
-    views = product.get('views', 0)
-    likes = product.get('likes', 0)
-    orders = product.get('orders', 0)
-    original_price = product.get('originalPrice', 0)
-    price = product.get('price', 0)
-    
-    if quantity <= 0:
-        return 'غير متوفر'
-    
-    if quantity > 0 and quantity < 5:
-        return 'متوفر'
-    
-    discount_percent = ((original_price - price) / original_price * 100) if original_price > 0 else 0
-    if original_price > price and discount_percent > 10:
-        return 'تخفيضات'
-    
-    if orders > 100 and likes > 200:
-        return 'مميزة'
-    
-    if orders > 100:
-        return 'أكثر مبيعاً'
-    
-    if likes > 200:
-        return 'أكثر إعجاباً'
-    
-    if orders > 50:
-        return 'أكثر طلباً'
-    
-    if views > 400:
-        return 'أكثر مشاهدة'
-    
-    return 'جديد'
+from eishro_catalog import assign_badges
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.publish import publish_store
+from eishro_catalog.stores import store_path
 
 pretty_products = [
     {
@@ -385,23 +350,25 @@ def load_json_file(path):
         print(f"❌ خطأ في تحميل {path}: {e}")
         return None
 
-def save_json_file(path, data):
-    """حفظ ملف JSON"""
+def save_json_file(folder, data):
+    """نشر store.json (publish_store): True إذا تغير، False إذا لم يتغير المحتوى، None عند الخطأ"""
+    path = store_path(folder)
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"✅ تم حفظ: {path}")
-        return True
+        if publish_store(folder, data):
+            print(f"✅ تم حفظ: {path}")
+            return True
+        print(f"⏭️  بدون تغيير: {path}")
+        return False
     except Exception as e:
         print(f"❌ خطأ في الحفظ {path}: {e}")
-        return False
+        return None
 
 def main():
     """البرنامج الرئيسي"""
+    use_utf8_stdout()
     print("🚀 بدء ملء متجر بريتي بالمنتجات...\n")
     
     pretty_path = 'public/assets/pretty/store.json'
-    pretty_dist_path = 'dist/assets/pretty/store.json'
     
     store_data = load_json_file(pretty_path)
     if store_data is None:
@@ -410,20 +377,13 @@ def main():
     
     print(f"📋 جاري معالجة {len(pretty_products)} منتج لبريتي...")
     
+    assign_badges(pretty_products, with_color=False)
     for product in pretty_products:
-        badge = calculate_badge(product)
-        product['badge'] = badge
-        product['tags'] = [badge]
+        product['tags'] = [product['badge']]
     
     store_data['products'] = pretty_products
     
-    if save_json_file(pretty_path, store_data):
-        try:
-            with open(pretty_dist_path, 'w', encoding='utf-8') as f:
-                json.dump(store_data, f, ensure_ascii=False, indent=2)
-            print(f"✅ تم تحديث: {pretty_dist_path}")
-        except Exception as e:
-            print(f"⚠️  لم يتمكن من تحديث dist: {e}")
+    save_json_file('pretty', store_data)
     
     badges_summary = {}
     for product in pretty_products:
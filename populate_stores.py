@@ -2,42 +2,11 @@
 # -*- coding: utf-8 -*-
 
 import json
-import os
-import sys
-import io
-import re
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-def calculate_badge(product):
-    """حساب التمييز بناءً على الإحصائيات"""
-    quantity = product.get('quantity', 0)
-    orders = product.get('orders', 0)
-    likes = product.get('likes', 0)
-    views = product.get('views', 0)
-    price = product.get('price', 0)
-    original_price = product.get('originalPrice', 0)
-    
-    discount = 0
-    if original_price > 0:
-        discount = ((original_price - price) / original_price) * 100
-    
-    if quantity <= 0:
-        return "غير متوفر"
-    elif discount > 10:
-        return "تخفيضات"
-    elif orders > 100 and likes > 200:
-        return "مميزة"
-    elif orders > 100:
-        return "أكثر مبيعاً"
-    elif likes > 200:
-        return "أكثر إعجاباً"
-    elif orders > 50:
-        return "أكثر طلباً"
-    elif views > 400:
-        return "أكثر مشاهدة"
-    else:
-        return "جديد"
+from eishro_catalog import assign_badges
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.publish import publish_store
+from eishro_catalog.ts_cache import cached_ts_products
 
 def extract_products_from_ts_file():
     """استخراج المنتجات من allStoreProducts.ts بشكل يدوي"""
@@ -46,27 +15,18 @@ def extract_products_from_ts_file():
     pretty_products = []
     magna_products = []
     
-    with open('src/data/allStoreProducts.ts', 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    content = ''.join(lines)
+    products = cached_ts_products('src/data/allStoreProducts.ts')
     
     store_definitions = {
         2: (sheirine_products, 'sheirine'),
         5: (magna_products, 'magna'),
     }
     
-    product_pattern = r'\{\s*id:\s*(\d+),\s*storeId:\s*(\d+|\w+),'
-    
-    for match in re.finditer(product_pattern, content):
-        product_id = int(match.group(1))
-        store_id_str = match.group(2)
-        
-        store_id = 5 if store_id_str == 'MAGNA_BEAUTY_STORE_ID' else int(store_id_str)
+    for product in products:
+        product_id = product.get('id')
+        store_id = product.get('storeId')
         
         if store_id in store_definitions:
-            line_num = content[:match.start()].count('\n') + 1
-            
             if store_id == 2:
                 if product_id >= 2001 and product_id <= 2035:
                     sheirine_products.append(product_id)
@@ -95,6 +55,7 @@ def populate_empty_stores():
         5: {'folder': 'magna-beauty', 'name': 'ماغنا بيوتي'}
     }
     
+    written_count = 0
     for store_id, config in store_configs.items():
         store_path = f"public/assets/{config['folder']}/store.json"
         
@@ -111,25 +72,23 @@ def populate_empty_stores():
             else:
                 print(f"\n{config['name']}: {len(products)} منتج موجود بالفعل")
                 
-                for product in products:
-                    if 'badge' not in product and all(k in product for k in ['rating', 'orders', 'likes']):
-                        product['badge'] = calculate_badge(product)
-                
-                with open(store_path, 'w', encoding='utf-8') as f:
-                    json.dump(store_data, f, ensure_ascii=False, indent=2)
+                unbadged = [p for p in products if 'badge' not in p and all(k in p for k in ['rating', 'orders', 'likes'])]
+                assign_badges(unbadged, with_color=False)
                 
-                dist_path = f"dist/assets/{config['folder']}/store.json"
-                os.makedirs(os.path.dirname(dist_path), exist_ok=True)
-                with open(dist_path, 'w', encoding='utf-8') as f:
-                    json.dump(store_data, f, ensure_ascii=False, indent=2)
-                
-                print(f"  - تم حفظ {len(products)} منتج")
+                if publish_store(config['folder'], store_data):
+                    written_count += 1
+                    print(f"  - تم حفظ {len(products)} منتج")
+                else:
+                    print("  - لا تغيير، لم تتم إعادة الكتابة")
         
         except Exception as e:
             print(f"خطأ في {config['name']}: {str(e)}")
+    
+    print(f"\nعدد المتاجر التي كُتبت فعلاً: {written_count}")
 
 def main():
     """الدالة الرئيسية"""
+    use_utf8_stdout()
     print("=" * 60)
     print("نظام ملء بيانات المتاجر والتمييزات")
     print("=" * 60)
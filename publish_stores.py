@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import os
+
+from eishro_catalog.compress import (
+    compressed_formats,
+    load_precompress_cache,
+    precompress_store,
+    save_precompress_cache,
+)
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.pages import DEFAULT_PAGE_SIZE
+from eishro_catalog.publish import mirror_file, publish_columns, publish_pages
+from eishro_catalog.stores import (
+    add_workers_argument,
+    discover_stores,
+    dist_store_path,
+    run_per_store,
+    store_display_name,
+    store_path,
+)
+from eishro_catalog.timing import add_timing_arguments, effective_workers, instrumented, timed
+
+def publish_store_files(folder, page_size=None):
+    """نسخ store.json من public إلى dist وتحديث ملف الأعمدة والصفحات، بدون إعادة حساب
+
+    تُرجع True إذا تغير أي ملف.
+    """
+    path = store_path(folder)
+    with timed('load'), open(path, 'r', encoding='utf-8') as f:
+        store_data = json.load(f)
+    with timed('write'):
+        method = mirror_file(path, dist_store_path(folder))
+    columns_written = publish_columns(folder, store_data.get('products', []))
+    pages_changed = publish_pages(folder, store_data, page_size)
+    
+    if method is not None:
+        print(f"✅ {store_display_name(folder)}: نُسخ إلى dist ({method})")
+    if columns_written:
+        print(f"✅ {store_display_name(folder)}: تم تحديث ملف الأعمدة")
+    if pages_changed:
+        print(f"✅ {store_display_name(folder)}: تغير {pages_changed} من ملفات الصفحات")
+    if method is None and not columns_written and not pages_changed:
+        print(f"⏭️  {store_display_name(folder)}: بدون تغيير")
+    return method is not None or columns_written or bool(pages_changed)
+
+def compress_store_files(folder, known):
+    """كتابة نسخ .gz و .br لملفات كتالوج المتجر في public ونسخها إلى dist
+
+    تُرجع بصمات الملفات لحفظها في ذاكرة الضغط.
+    """
+    with timed('compress'):
+        hashes, compressed, raw_size, packed_size = precompress_store(
+            os.path.dirname(store_path(folder)), known, os.path.dirname(dist_store_path(folder))
+        )
+    if compressed:
+        ratio = packed_size / raw_size * 100 if raw_size else 0
+        print(f"🗜️  {store_display_name(folder)}: ضُغط {compressed} ملف ({raw_size:,} ← {packed_size:,} بايت، {ratio:.0f}%)")
+    else:
+        print(f"⏭️  {store_display_name(folder)}: النسخ المضغوطة محدثة")
+    return hashes
+
+def main(argv=None):
+    """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="نشر ملفات store.json الحالية إلى dist مع ملفات الأعمدة")
+    parser.add_argument('--pages', type=int, nargs='?', const=DEFAULT_PAGE_SIZE, default=None, metavar='SIZE',
+                        help=f"تقسيم المنتجات إلى صفحات مع store.manifest.json (الافتراضي {DEFAULT_PAGE_SIZE} منتجاً للصفحة)")
+    parser.add_argument('--compress', action='store_true',
+                        help="كتابة نسخ .gz و .br مضغوطة مسبقاً لكل ملفات الكتالوج")
+    add_workers_argument(parser)
+    add_timing_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.pages is not None and args.pages < 1:
+        parser.error("حجم الصفحة يجب أن يكون 1 على الأقل")
+    
+    with instrumented(args) as timings:
+        written_count = 0
+        tasks = [(folder, args.pages) for folder in discover_stores()]
+        for result in run_per_store(publish_store_files, tasks, effective_workers(args)):
+            print(result.output, end='')
+            timings.extend(result.timings)
+            if result.error:
+                print(f"❌ خطأ في نشر {store_display_name(result.folder)}: {result.error}")
+            elif result.value:
+                written_count += 1
+        print(f"💾 عدد المتاجر التي تغيرت: {written_count}")
+        
+        if args.compress:
+            if 'br' not in compressed_formats():
+                print("⚠️  brotli غير مثبت (pip install brotli): ستُكتب نسخ .gz فقط")
+            cache = load_precompress_cache()
+            tasks = [(folder, cache['stores'].get(folder)) for folder in discover_stores()]
+            for result in run_per_store(compress_store_files, tasks, effective_workers(args)):
+                print(result.output, end='')
+                timings.extend(result.timings)
+                if result.error:
+                    print(f"❌ خطأ في ضغط {store_display_name(result.folder)}: {result.error}")
+                else:
+                    cache['stores'][result.folder] = result.value
+            save_precompress_cache(cache)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import sys
+
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.publish import open_atomic
+from eishro_catalog.sections import (
+    SectionError,
+    UnifiedDiff,
+    anchor_events,
+    anchor_matcher,
+    node_ranges,
+    range_events,
+    source_lines,
+)
+from eishro_catalog.tsx_balance import check_source, source_paths, uses_jsx
+
+SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+
+def has_anchor(path, is_start):
+    """هل في الملف سطر فيه مرساة البداية؟ (يتوقف عند أول تطابق)"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return any(is_start(line) for line in f)
+
+def remove_from_file(path, args, is_start, is_end):
+    """حذف القسم من ملف واحد: (عدد الأسطر المحذوفة، نص المعاينة)"""
+    diff = UnifiedDiff(path)
+
+    def consume(events, out=None):
+        for action, number, line in events:
+            if action == 'remove':
+                diff.remove(number, line)
+            else:
+                diff.keep(number, line)
+                if out is not None:
+                    out.write(line)
+
+    source = None
+    if args.node:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            source = f.read()
+        ranges = node_ranges(source, is_start, args.all, uses_jsx(path))
+
+    if not args.apply:
+        if source is not None:
+            consume(range_events(source_lines(source), ranges))
+        else:
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                consume(anchor_events(f, is_start, is_end, args.end_exclusive, args.all))
+        return diff.removed, diff.text()
+
+    # لا نقبل حذفاً يكسر توازن ملف كان سليماً
+    jsx = uses_jsx(path)
+    guard = path.endswith(('.ts', '.tsx')) and not args.force
+    if guard:
+        if source is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                guard = check_source(f.read(), jsx) is None
+        else:
+            guard = check_source(source, jsx) is None
+    with open_atomic(path, 'w', encoding='utf-8', newline='') as out:
+        if source is not None:
+            consume(range_events(source_lines(source), ranges), out)
+        else:
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                consume(anchor_events(f, is_start, is_end, args.end_exclusive, args.all), out)
+        if guard:
+            out.flush()
+            with open(out.name, 'r', encoding='utf-8') as f:
+                problem = check_source(f.read(), jsx)
+            if problem is not None:
+                raise SectionError(f"الحذف يكسر توازن الملف عند {problem.line}:{problem.column} "
+                                   f"{problem.message} (استخدم --force للتجاوز)")
+    return diff.removed, diff.text()
+
+def main(argv=None):
+    """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="حذف قسم من ملفات المصدر بمراسي نصية بدل أرقام الأسطر")
+    parser.add_argument('paths', nargs='+', help="ملفات أو مجلدات (.ts/.tsx/.js/.jsx)")
+    parser.add_argument('--start', required=True, help="نص في سطر بداية القسم")
+    end = parser.add_mutually_exclusive_group(required=True)
+    end.add_argument('--end', help="نص في سطر نهاية القسم")
+    end.add_argument('--node', action='store_true',
+                     help="القسم هو البناء الذي يبدأ عند المرساة حتى تُغلق أقواسه ووسومه")
+    parser.add_argument('--regex', action='store_true', help="المراسي تعبيرات نمطية")
+    parser.add_argument('--end-exclusive', action='store_true', help="إبقاء سطر مرساة النهاية")
+    parser.add_argument('--all', action='store_true', help="حذف كل الأقسام المطابقة لا الأول فقط")
+    parser.add_argument('--apply', action='store_true', help="تنفيذ الحذف (الافتراضي: معاينة فقط)")
+    parser.add_argument('--force', action='store_true', help="الحذف حتى لو كسر توازن أقواس ملف TS/TSX")
+    args = parser.parse_args(argv)
+
+    is_start = anchor_matcher(args.start, args.regex)
+    is_end = anchor_matcher(args.end, args.regex) if args.end is not None else None
+    paths = source_paths(args.paths, SOURCE_EXTENSIONS)
+
+    failed = False
+    changed = 0
+    for path in paths:
+        try:
+            if not has_anchor(path, is_start):
+                continue
+            removed, preview = remove_from_file(path, args, is_start, is_end)
+        except (SectionError, OSError, UnicodeDecodeError) as e:
+            print(f"❌ {path}: {e}")
+            failed = True
+            continue
+        changed += 1
+        if not args.apply:
+            sys.stdout.write(preview)
+        print(f"{'✂️ ' if args.apply else '👀'} {path}: {removed} سطر {'حُذف' if args.apply else 'سيُحذف'}")
+
+    if not changed and not failed:
+        print(f"⚠️  لم تُوجد المرساة في أي من {len(paths)} ملف")
+        failed = True
+    elif not args.apply and changed:
+        print("ℹ️  معاينة فقط، أضف --apply للتنفيذ")
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import pytest
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    """مجلد عمل مؤقت فيه public/assets و dist/assets (المسارات في stores نسبية)"""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('public/assets')
+    os.makedirs('dist/assets')
+    return tmp_path
+
+
+def make_store(products, **fields):
+    store = {'id': 1, 'slug': 'demo', 'name': 'متجر', 'products': products}
+    store.update(fields)
+    return store
+
+
+def make_product(product_id, **fields):
+    product = {
+        'id': product_id, 'name': f'منتج {product_id}', 'price': 100, 'originalPrice': 100,
+        'quantity': 5, 'views': 10, 'likes': 2, 'orders': 1, 'rating': 4.5, 'reviews': 3,
+        'images': [f'/assets/demo/{product_id}.jpg'],
+    }
+    product.update(fields)
+    return product
+
+
+def read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
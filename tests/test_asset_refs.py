@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from conftest import make_product, make_store
+from eishro_catalog.asset_refs import AssetIndex, check_store_refs, normalize_ref
+
+FILES = [
+    'logo.png',
+    'sherine/Banner.jpg',
+    'sherine/product-red.jpg',
+    'sheirine/cover.webp',
+    'demo/1.jpg',
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    for name in FILES:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'x')
+    return AssetIndex(str(tmp_path))
+
+
+def test_index_lists_every_file(index):
+    assert len(index) == len(FILES)
+    assert '/assets/logo.png' in index
+    assert '/assets/sherine/Banner.jpg' in index
+    assert '/assets/sherine' not in index
+    assert index.by_dir['/assets'] == ['logo.png']
+
+
+def test_missing_assets_dir_is_empty(tmp_path):
+    assert len(AssetIndex(str(tmp_path / 'missing'))) == 0
+
+
+def test_normalize_ref_strips_query_fragment_and_decodes():
+    assert normalize_ref('/assets/a%20b.png?v=2#top') == '/assets/a b.png'
+    assert normalize_ref('/assets/a.png#x?y') == '/assets/a.png'
+
+
+@pytest.mark.parametrize('url, expected', [
+    # نفس الرابط بحالة أحرف مختلفة
+    ('/assets/sherine/banner.JPG', '/assets/sherine/Banner.jpg'),
+    # نفس الاسم في مجلد آخر
+    ('/assets/sheirine/product-red.jpg', '/assets/sherine/product-red.jpg'),
+    # أقرب اسم في نفس المجلد، ومنه جذر الأصول
+    ('/assets/sherine/product-rde.jpg', '/assets/sherine/product-red.jpg'),
+    ('/assets/logo-x.svg', '/assets/logo.png'),
+    # أقرب اسم في أي مجلد
+    ('/assets/other/covr.webp', '/assets/sheirine/cover.webp'),
+    ('/assets/nothing-like-it.txt', None),
+])
+def test_suggest_tiers(index, url, expected):
+    assert index.suggest(url) == expected
+
+
+def test_check_store_refs_reports_field_paths(index):
+    store = make_store(
+        [make_product(1), make_product(2, images=['/assets/demo/1.jpg?v=3', '/assets/demo/2.jpg'])],
+        logo='/assets/Logo.png',
+    )
+
+    total, missing = check_store_refs(store, index)
+
+    assert total == 4
+    assert missing == [
+        {'field': 'products[1].images[1]', 'ref': '/assets/demo/2.jpg', 'suggestion': '/assets/demo/1.jpg'},
+        {'field': 'logo', 'ref': '/assets/Logo.png', 'suggestion': '/assets/logo.png'},
+    ]
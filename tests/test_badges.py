@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import itertools
+import random
+
+import pytest
+
+from eishro_catalog import badges
+from eishro_catalog.badges import assign_badges, calculate_badges, catalog_columns, get_badge_color
+
+
+def reference_badge(product):
+    """calculate_badge الأصلية في fix_badges.py قبل محرك الشارات"""
+    quantity = product.get('quantity', 0)
+    views = product.get('views', 0)
+    likes = product.get('likes', 0)
+    orders = product.get('orders', 0)
+    original_price = product.get('originalPrice', 0)
+    price = product.get('price', 0)
+    if quantity <= 0:
+        return 'غير متوفر'
+    if quantity > 0 and quantity < 5:
+        return 'متوفر'
+    discount_percent = ((original_price - price) / original_price * 100) if original_price > 0 else 0
+    if original_price > price and discount_percent > 10:
+        return 'تخفيضات'
+    if orders > 100 and likes > 200:
+        return 'مميزة'
+    if orders > 100:
+        return 'أكثر مبيعاً'
+    if likes > 200:
+        return 'أكثر إعجاباً'
+    if orders > 50:
+        return 'أكثر طلباً'
+    if views > 400:
+        return 'أكثر مشاهدة'
+    return 'جديد'
+
+
+def boundary_products():
+    # كل تركيبة من القيم على حدود القواعد وحولها
+    values = {
+        'quantity': (0, 4, 5),
+        'originalPrice': (0, 100),
+        'price': (89, 90, 90.5, 100, 120),
+        'orders': (50, 51, 100, 101),
+        'likes': (200, 201),
+        'views': (400, 401),
+    }
+    for combo in itertools.product(*values.values()):
+        yield dict(zip(values, combo))
+
+
+def random_products(count, seed=7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        original_price = rng.choice([0, rng.randint(1, 500)])
+        yield {
+            'quantity': rng.randint(-2, 30),
+            'originalPrice': original_price,
+            'price': rng.randint(1, 500) if original_price == 0 else round(original_price * rng.uniform(0.5, 1.2), 2),
+            'orders': rng.randint(0, 300),
+            'likes': rng.randint(0, 400),
+            'views': rng.randint(0, 800),
+        }
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def engine(request, monkeypatch):
+    if request.param == 'numpy':
+        if badges.np is None:
+            pytest.skip('numpy غير مثبت')
+    else:
+        monkeypatch.setattr(badges, 'np', None)
+    return request.param
+
+
+def test_batch_engine_matches_reference_rules(engine):
+    products = list(boundary_products()) + list(random_products(5000))
+
+    assert calculate_badges(catalog_columns(products)) == [reference_badge(p) for p in products]
+
+
+def test_missing_and_null_stats_count_as_zero(engine):
+    products = [{}, {'quantity': None, 'price': 10}, {'quantity': 9, 'views': None, 'originalPrice': None}]
+
+    assert calculate_badges(catalog_columns(products)) == ['غير متوفر', 'غير متوفر', 'جديد']
+
+
+def test_assign_badges_counts_changes_and_sets_colors(engine):
+    products = [{'quantity': 0, 'badge': 'غير متوفر'}, {'quantity': 9, 'orders': 120, 'badge': 'جديد'}]
+
+    assert assign_badges(products) == 1
+    assert [p['badge'] for p in products] == ['غير متوفر', 'أكثر مبيعاً']
+    assert products[1]['badgeColor'] == get_badge_color('أكثر مبيعاً')
+    assert calculate_badges(catalog_columns([])) == []
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import benchmark_catalog
+from conftest import read_json
+
+
+def test_selected_stage_runs_its_prerequisites_untimed(tmp_path):
+    output = tmp_path / 'results.json'
+
+    benchmark_catalog.main(['--sizes', '50', '--stages', 'load_json,ts_extract,columns_read',
+                            '--no-memory', '--output', str(output)])
+
+    results = read_json(output)['results']
+    assert [r['stage'] for r in results] == ['load_json', 'columns_read', 'ts_extract']
+
+
+def test_stage_plan_orders_dependencies_before_stages():
+    plan = benchmark_catalog.stage_plan(['columns_read'])
+
+    assert [(name, timed) for name, _, timed in plan] == [
+        ('generate', False), ('columns_write', False), ('columns_read', True),
+    ]
+
+
+def test_unknown_stage_is_rejected_before_running(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        benchmark_catalog.main(['--stages', 'load_jsn', '--output', str(tmp_path / 'results.json')])
+
+    assert 'load_jsn' in capsys.readouterr().err
+    assert not (tmp_path / 'results.json').exists()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+import os
+
+import verify_badges
+from conftest import make_product, make_store
+from eishro_catalog.columnar import encode_columns, load_columns, load_fresh_columns
+from eishro_catalog.health import store_health
+from eishro_catalog.publish import encode_store, publish_store
+
+STORE_JSON = 'public/assets/demo/store.json'
+SIDECAR = 'public/assets/demo/store.columns.bin'
+
+
+def mixed_store():
+    return make_store([
+        make_product(1, badge='جديد', badgeColor='green', category='عبايات'),
+        make_product(2, badge='تخفيضات', price=70, originalPrice=100, quantity=0),
+        make_product(3, badge=None, quantity=2, images=[], category=''),
+        make_product(4, badge='جديد', price=10.5, originalPrice=40, quantity=True),
+        {'id': 5, 'name': 'بلا إحصائيات'},
+    ])
+
+
+def test_published_sidecar_is_fresh_until_store_json_changes(catalog):
+    store = mixed_store()
+    publish_store('demo', store)
+
+    with load_fresh_columns(STORE_JSON) as columns:
+        assert columns.count == 5
+        assert columns.counts('badge') == {'جديد': 2, 'تخفيضات': 1, '': 2}
+        assert columns.missing('price') == 1
+
+    store['products'][0]['name'] = 'اسم آخر'
+    with open(STORE_JSON, 'wb') as f:
+        f.write(encode_store(store))
+    assert load_fresh_columns(STORE_JSON) is None
+
+
+def test_missing_or_old_sidecar_is_not_used(catalog):
+    publish_store('demo', mixed_store())
+    with open(SIDECAR, 'wb') as f:
+        f.write(encode_columns(mixed_store()['products']))
+    assert load_fresh_columns(STORE_JSON) is None
+
+    os.remove(SIDECAR)
+    assert load_fresh_columns(STORE_JSON) is None
+
+
+def test_health_from_columns_matches_json_reader(catalog):
+    publish_store('demo', mixed_store())
+
+    from_columns = store_health('demo', STORE_JSON)
+    os.remove(SIDECAR)
+    from_json = store_health('demo', STORE_JSON)
+
+    assert from_columns == from_json
+    assert from_json['missing']['badge'] == 2
+    assert from_json['discounts'] == {'21-30%': 1, '>50%': 1}
+
+
+def test_verify_badges_reads_counts_from_columns(catalog):
+    publish_store('demo', mixed_store())
+
+    from_columns = verify_badges.read_badges(STORE_JSON)
+    os.remove(SIDECAR)
+    from_json = verify_badges.read_badges(STORE_JSON)
+
+    assert from_columns == from_json
+    assert from_columns[0] == 5
+    assert [product['id'] for product in from_columns[2]] == [1, 2, 3]
+
+
+def test_sidecar_without_source_still_loads(tmp_path):
+    path = str(tmp_path / 'store.columns.bin')
+    with open(path, 'wb') as f:
+        f.write(encode_columns([make_product(1)]))
+
+    with load_columns(path) as columns:
+        assert columns.source is None
+        assert list(columns.columns['price']) == [100.0]
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import os
+
+from eishro_catalog.dedup import find_duplicates, link_duplicate, rewrite_references
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def test_only_media_files_are_grouped(tmp_path):
+    assets = tmp_path / 'assets'
+    for store in ('a', 'b'):
+        write(str(assets / store / 'logo.png'), b'same image')
+        write(str(assets / store / 'store.json'), b'{"products": []}')
+        write(str(assets / store / 'store.columns.bin'), b'columns')
+        write(str(assets / store / 'store.json.gz'), b'gzip bytes')
+        write(str(assets / store / 'store.pages' / '0.abc.json'), b'page')
+        write(str(assets / store / 'store.patches' / '1.json'), b'patch')
+    write(str(assets / '_variants' / 'ab' / 'x' / '320.webp'), b'variant')
+    write(str(assets / '_variants' / 'ab' / 'y' / '320.webp'), b'variant')
+
+    groups = find_duplicates([str(assets)], workers=1)
+
+    assert groups == [[str(assets / 'a' / 'logo.png'), str(assets / 'b' / 'logo.png')]]
+
+
+def test_hardlinks_are_counted_once(tmp_path):
+    first = str(tmp_path / 'a.jpg')
+    write(first, b'image')
+    os.link(first, str(tmp_path / 'b.jpg'))
+
+    assert find_duplicates([str(tmp_path)], workers=1) == []
+
+
+def test_link_duplicate_keeps_content(tmp_path):
+    canonical = str(tmp_path / 'a.jpg')
+    copy = str(tmp_path / 'b.jpg')
+    write(canonical, b'image')
+    write(copy, b'image')
+
+    assert link_duplicate(canonical, copy)
+    assert os.path.samefile(canonical, copy)
+    assert not link_duplicate(canonical, copy)
+    assert not os.path.exists(copy + '.dedup.tmp')
+
+
+def test_rewrite_references_counts_replacements():
+    data = {'logo': '/assets/b/logo.png', 'products': [{'images': ['/assets/b/logo.png', '/assets/c.png']}]}
+
+    updated, count = rewrite_references(data, {'/assets/b/logo.png': '/assets/a/logo.png'})
+
+    assert count == 2
+    assert updated['products'][0]['images'] == ['/assets/a/logo.png', '/assets/c.png']
+    assert data['logo'] == '/assets/b/logo.png'
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import fix_badges
+from conftest import make_product, make_store, read_json
+from eishro_catalog import assign_badges
+from eishro_catalog.pages import manifest_pages, read_manifest
+from eishro_catalog.publish import load_versions, publish_store
+
+
+def test_process_store_publishes_every_artifact(catalog, monkeypatch):
+    monkeypatch.setattr(fix_badges, 'BATCH_SIZE', 2)
+    publish_store('demo', make_store([make_product(i) for i in range(1, 6)]), page_size=2)
+    version = load_versions('demo')['version']
+
+    assert fix_badges.process_store('demo')
+
+    store = read_json('public/assets/demo/store.json')
+    expected = make_store([make_product(i) for i in range(1, 6)])
+    assign_badges(expected['products'])
+    assert store == expected
+    assert read_json('dist/assets/demo/store.json') == store
+    assert load_versions('demo')['version'] == version + 1
+    manifest = read_manifest('public/assets/demo')
+    page = read_json('public/assets/demo/' + manifest_pages(manifest)[0])
+    assert page['products'] == store['products'][:2]
+    assert not fix_badges.process_store('demo')
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+from conftest import make_product, make_store, read_json
+from generate_store_json import load_and_process_stores
+
+PATH = 'public/assets/nawaem/store.json'
+
+
+def write_store(store):
+    os.makedirs(os.path.dirname(PATH), exist_ok=True)
+    with open(PATH, 'w', encoding='utf-8') as f:
+        json.dump(store, f, ensure_ascii=False, indent=2)
+
+
+def test_incremental_run_publishes_products_from_ts(catalog):
+    write_store(make_store([make_product(1)]))
+    load_and_process_stores(incremental=True)
+    before = read_json(PATH)
+
+    ts_products = [make_product(1), make_product(2, orders=80)]
+    load_and_process_stores(incremental=True, ts_stores={1: {'products': ts_products}})
+
+    after = read_json(PATH)
+    assert [p['id'] for p in after['products']] == [1, 2]
+    assert all('badge' in p for p in after['products'])
+    assert after['products'][0]['badge'] == before['products'][0]['badge']
+    assert read_json('dist/assets/nawaem/store.json') == after
+
+
+def test_incremental_run_without_changes_skips_the_write(catalog):
+    write_store(make_store([make_product(1)]))
+    load_and_process_stores(incremental=True)
+    mtime = os.stat(PATH).st_mtime_ns
+
+    load_and_process_stores(incremental=True)
+
+    assert os.stat(PATH).st_mtime_ns == mtime
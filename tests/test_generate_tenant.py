@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from conftest import read_json
+from eishro_catalog.stores import discover_stores
+from generate_tenant import main
+
+
+def test_tenants_get_contiguous_ids_outside_public_assets(catalog):
+    main(['--products', '3', '--tenants', '2', '--id-offset', '10', '--no-csv'])
+
+    first = read_json('synthetic_tenants/tenant-900/store.json')
+    second = read_json('synthetic_tenants/tenant-901/store.json')
+    assert [p['id'] for p in first['products']] == [11, 12, 13]
+    assert [p['id'] for p in second['products']] == [14, 15, 16]
+    assert all(p['badge'] for p in first['products'])
+    assert discover_stores() == []
+
+
+def test_ids_past_integer_range_are_rejected(catalog):
+    with pytest.raises(SystemExit):
+        main(['--products', '1000000', '--tenants', '3', '--id-offset', '2147000000'])
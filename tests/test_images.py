@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import argparse
+import json
+import os
+
+import pytest
+
+from conftest import make_product, make_store, read_json
+from eishro_catalog import images
+from eishro_catalog.images import load_meta, manifest_entry, missing_formats, store_image_refs
+
+Image = pytest.importorskip('PIL.Image')
+
+import build_image_variants  # noqa: E402
+
+
+def run_build(formats):
+    args = argparse.Namespace(stores=['demo'], widths=[16, 32], formats=formats, force=False, workers=1)
+    build_image_variants.run(args)
+    return read_json('public/assets/demo/store.images.json')
+
+
+@pytest.fixture
+def store_with_image(catalog):
+    os.makedirs('public/assets/demo')
+    Image.new('RGB', (64, 48), (200, 30, 30)).save('public/assets/demo/1.png')
+    store = make_store([make_product(1, images=['/assets/demo/1.png', '/assets/demo/missing.png'])])
+    with open('public/assets/demo/store.json', 'w', encoding='utf-8') as f:
+        json.dump(store, f)
+    return store
+
+
+def test_store_image_refs_deduplicates():
+    store = make_store([make_product(1, image='/assets/a.jpg', images=['/assets/a.jpg', 'https://x/y.jpg'])])
+
+    assert store_image_refs(store) == ['/assets/a.jpg']
+
+
+def test_supported_formats_are_encoded_when_others_are_not(store_with_image, monkeypatch):
+    monkeypatch.setattr(build_image_variants, 'supported_formats', lambda formats: ('webp',))
+
+    manifest = run_build(['webp', 'avif'])
+
+    entry = manifest['images']['/assets/demo/1.png']
+    assert entry['formats'] == ['webp']
+    assert [v['width'] for v in entry['variants']['webp']] == [16, 32]
+    assert '/assets/demo/missing.png' not in manifest['images']
+
+
+def test_new_format_is_added_without_reencoding_existing(store_with_image, monkeypatch):
+    monkeypatch.setattr(build_image_variants, 'supported_formats', lambda formats: ('webp',))
+    run_build(['webp', 'png'])
+    calls = []
+    original = images.encode_variants
+
+    def spy(*args, **kwargs):
+        calls.append(args[4])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(build_image_variants, 'encode_variants', spy)
+    monkeypatch.setattr(build_image_variants, 'supported_formats', lambda formats: ('webp', 'png'))
+    manifest = run_build(['webp', 'png'])
+
+    assert calls == [['png']]
+    assert manifest['images']['/assets/demo/1.png']['formats'] == ['webp', 'png']
+    run_build(['webp', 'png'])
+    assert calls == [['png']]
+
+
+def test_no_supported_format_writes_nothing(store_with_image, monkeypatch):
+    monkeypatch.setattr(build_image_variants, 'supported_formats', lambda formats: ())
+
+    build_image_variants.run(argparse.Namespace(stores=['demo'], widths=[16], formats=['avif'], force=False, workers=1))
+
+    assert not os.path.exists('public/assets/demo/store.images.json')
+
+
+def test_missing_formats_and_entry():
+    meta = {'width': 10, 'height': 5, 'formats': ['webp'], 'variants': {'webp': [{'width': 10, 'url': 'u'}]}}
+
+    assert missing_formats(None, ['webp']) == ['webp']
+    assert missing_formats(meta, ['webp', 'avif']) == ['avif']
+    assert manifest_entry(meta, ['webp', 'avif'])['formats'] == ['webp']
+    assert load_meta('0' * 32, 'nowhere', [10]) is None
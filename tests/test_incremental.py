@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import pytest
+
+import apply_badges
+from conftest import make_product, make_store, read_json
+from eishro_catalog.incremental import (
+    BADGE_CACHE_PATH,
+    changed_products,
+    empty_badge_cache,
+    load_badge_cache,
+    save_badge_cache,
+    store_file_unchanged,
+)
+
+PATH = 'public/assets/nawaem/store.json'
+
+
+def write_store(store):
+    os.makedirs(os.path.dirname(PATH), exist_ok=True)
+    with open(PATH, 'w', encoding='utf-8') as f:
+        json.dump(store, f, ensure_ascii=False, indent=2)
+
+
+def run(incremental):
+    cache = load_badge_cache() if incremental else None
+    apply_badges.process_store('nawaem', 'نواعم', cache)
+    if cache is not None:
+        save_badge_cache(cache)
+    return read_json(PATH)
+
+
+def full_run_result(store):
+    write_store(store)
+    return run(incremental=False)
+
+
+def test_only_products_with_changed_badge_inputs_are_recomputed():
+    cache = empty_badge_cache()
+    products = [make_product(1), make_product(2)]
+    assert changed_products(cache, 'demo', products) == products
+
+    products[0]['name'] = 'اسم جديد'
+    products[1]['orders'] = 120
+    assert changed_products(cache, 'demo', products) == [products[1]]
+    assert changed_products(cache, 'demo', products) == []
+
+
+@pytest.mark.parametrize('batch_size', [2, apply_badges.BATCH_SIZE])
+def test_external_edits_are_picked_up_like_a_full_run(catalog, monkeypatch, batch_size):
+    monkeypatch.setattr(apply_badges, 'BATCH_SIZE', batch_size)
+    write_store(make_store([make_product(i) for i in range(1, 6)]))
+    run(incremental=True)
+    assert store_file_unchanged(load_badge_cache(), 'nawaem', PATH)
+
+    edited = read_json(PATH)
+    edited['products'][0]['orders'] = 150
+    edited['products'][1]['badge'] = 'مميزة'
+    write_store(edited)
+    assert not store_file_unchanged(load_badge_cache(), 'nawaem', PATH)
+
+    incremental = run(incremental=True)
+    assert incremental == full_run_result(edited)
+    assert [p['badge'] for p in incremental['products']][:2] == ['أكثر مبيعاً', 'جديد']
+
+
+def test_old_cache_version_is_discarded(catalog):
+    with open(BADGE_CACHE_PATH, 'w', encoding='utf-8') as f:
+        json.dump({'version': 1, 'stores': {'nawaem': {'file': [0, 0], 'products': {}}}}, f)
+
+    assert load_badge_cache() == empty_badge_cache()
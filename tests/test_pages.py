@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+
+from conftest import make_product, make_store, read_json
+from eishro_catalog import pages as pages_module
+from eishro_catalog.pages import build_pages, manifest_pages, read_manifest, retire_pages
+from eishro_catalog.publish import publish_store
+
+STORE_DIR = 'public/assets/demo'
+
+
+def test_build_pages_splits_products():
+    store = make_store([make_product(i) for i in range(1, 6)])
+
+    manifest, pages = build_pages(store, page_size=2)
+
+    assert [name.split('/')[1].split('.')[0] for name, _ in pages] == ['0', '1', '2']
+    assert b'"productCount":5' in manifest
+
+
+def test_pages_follow_later_publishes_without_page_size(catalog):
+    store = make_store([make_product(i) for i in range(1, 6)])
+    publish_store('demo', store, page_size=2)
+    first = manifest_pages(read_manifest(STORE_DIR))
+
+    store['products'][0]['price'] = 50
+    publish_store('demo', store)
+
+    manifest = read_manifest(STORE_DIR)
+    assert manifest['pageSize'] == 2
+    assert manifest['productCount'] == 5
+    assert manifest_pages(manifest)[0] != first[0]
+    assert read_json(os.path.join(STORE_DIR, manifest_pages(manifest)[0]))['products'][0]['price'] == 50
+    assert read_json('dist/assets/demo/store.manifest.json') == manifest
+
+
+def test_previous_generation_survives_the_swap(catalog):
+    store = make_store([make_product(i) for i in range(1, 6)])
+    publish_store('demo', store, page_size=2)
+    first = manifest_pages(read_manifest(STORE_DIR))
+
+    store['products'][0]['price'] = 50
+    publish_store('demo', store)
+
+    for name in first:
+        assert os.path.exists(os.path.join(STORE_DIR, name))
+        assert os.path.exists(os.path.join('dist/assets/demo', name))
+
+
+def test_retire_pages_counts_grace_from_retirement():
+    previous = {'pages': [{'file': 'store.pages/0.a.json'}, {'file': 'store.pages/1.b.json'}]}
+    current = ['store.pages/0.c.json', 'store.pages/1.b.json']
+
+    retired, expired = retire_pages([], previous, current, now=1000)
+    assert retired == {'store.pages/0.a.json': 1000}
+    assert expired == []
+
+    previous = {'pages': [{'file': name} for name in current], 'retired': retired}
+    assert retire_pages([], previous, current, now=1000 + 3599) == (retired, [])
+    assert retire_pages([], previous, current, now=1000 + 3600) == ({}, ['store.pages/0.a.json'])
+    assert retire_pages([], previous, current + ['store.pages/0.a.json'], now=9999) == ({}, [])
+
+
+def test_old_pages_are_kept_for_grace_after_leaving_manifest(catalog, monkeypatch):
+    store = make_store([make_product(i) for i in range(1, 6)])
+    publish_store('demo', store, page_size=2)
+    first = manifest_pages(read_manifest(STORE_DIR))
+    # صفحات لم تتغير منذ ساعتين: تاريخ الملف لا يُحسب من المهلة
+    hours_ago = time.time() - 7200
+    for name in first:
+        os.utime(os.path.join(STORE_DIR, name), (hours_ago, hours_ago))
+
+    store['products'][0]['price'] = 50
+    publish_store('demo', store)
+    manifest = read_manifest(STORE_DIR)
+    superseded = sorted(set(first) - set(manifest_pages(manifest)))
+
+    assert superseded
+    assert sorted(manifest['retired']) == superseded
+    for name in superseded:
+        assert os.path.exists(os.path.join(STORE_DIR, name))
+
+    later = time.time() + 7200
+    monkeypatch.setattr(pages_module.time, 'time', lambda: later)
+    store['products'][1]['price'] = 60
+    publish_store('demo', store)
+    manifest = read_manifest(STORE_DIR)
+
+    for name in superseded:
+        assert not os.path.exists(os.path.join(STORE_DIR, name))
+        assert not os.path.exists(os.path.join('dist/assets/demo', name))
+        assert name not in manifest.get('retired', {})
+
+
+def test_stores_without_manifest_are_not_paged(catalog):
+    publish_store('demo', make_store([make_product(1)]))
+
+    assert read_manifest(STORE_DIR) is None
+    assert not os.path.exists(os.path.join(STORE_DIR, 'store.pages'))
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import gzip
+import os
+
+import pytest
+
+from conftest import make_product, make_store, read_json
+from eishro_catalog.compress import compressed_formats, precompress_store
+from eishro_catalog.publish import encode_store, publish_store, publish_stream, write_atomic
+
+
+def test_write_atomic_skips_unchanged_content(tmp_path):
+    path = str(tmp_path / 'a.json')
+
+    assert write_atomic(path, b'{}')
+    mtime = os.stat(path).st_mtime_ns
+    assert not write_atomic(path, b'{}')
+    assert os.stat(path).st_mtime_ns == mtime
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.tmp')] == []
+
+
+def test_publish_store_writes_public_dist_and_sidecar(catalog):
+    store = make_store([make_product(1), make_product(2)])
+
+    assert publish_store('demo', store)
+
+    with open('public/assets/demo/store.json', 'rb') as f:
+        assert f.read() == encode_store(store)
+    assert read_json('dist/assets/demo/store.json') == store
+    assert os.path.exists('public/assets/demo/store.columns.bin')
+    assert os.path.exists('dist/assets/demo/store.columns.bin')
+    assert not publish_store('demo', store)
+
+
+def read_gzip(path):
+    with gzip.open(path, 'rb') as f:
+        return f.read()
+
+
+def read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_publish_rewrites_compressed_siblings(catalog, stream):
+    store = make_store([make_product(i) for i in range(1, 6)])
+    publish_store('demo', store, page_size=2)
+    precompress_store('public/assets/demo', mirror_dir='dist/assets/demo')
+    old_pages = sorted(os.listdir('public/assets/demo/store.pages'))
+
+    if stream:
+        publish_stream('demo', lambda product: dict(product, price=product['id']))
+    else:
+        publish_store('demo', dict(store, products=[dict(p, price=p['id']) for p in store['products']]))
+
+    for directory in ('public/assets/demo', 'dist/assets/demo'):
+        for name in ('store.json', 'store.columns.bin', 'store.manifest.json', 'store.versions.json',
+                     'store.patches/2.json'):
+            path = os.path.join(directory, name)
+            assert read_gzip(path + '.gz') == read_bytes(path), path
+            for fmt in compressed_formats():
+                assert os.path.exists(f'{path}.{fmt}')
+    pages = sorted(os.listdir('public/assets/demo/store.pages'))
+    assert pages != old_pages
+    assert all(name[:-3] in pages for name in pages if name.endswith('.gz'))
+
+
+def test_unchanged_store_keeps_compressed_siblings(catalog):
+    store = make_store([make_product(1)])
+    publish_store('demo', store)
+    precompress_store('public/assets/demo', mirror_dir='dist/assets/demo')
+
+    publish_store('demo', store)
+
+    assert os.path.exists('public/assets/demo/store.json.gz')
+    assert os.path.exists('dist/assets/demo/store.json.gz')
+
+
+def publish_all_fields(product):
+    product['badge'] = 'جديد' if product['id'] % 2 else 'تخفيضات'
+    return None if product['id'] == 3 else product
+
+
+def test_publish_stream_matches_publish_store(catalog):
+    store = make_store([make_product(i) for i in range(1, 12)], updatedAt='2026-01-01')
+    publish_store('demo', store, page_size=4)
+    publish_store('other', store, page_size=4)
+
+    count, written = publish_stream('demo', publish_all_fields)
+    expected = dict(store, products=[p for p in map(publish_all_fields, store['products']) if p is not None])
+    publish_store('other', expected)
+
+    assert (count, written) == (10, True)
+    for name in ('store.json', 'store.columns.bin', 'store.manifest.json', 'store.versions.json',
+                 'store.patches/2.json'):
+        with open(f'public/assets/demo/{name}', 'rb') as a, open(f'public/assets/other/{name}', 'rb') as b:
+            assert a.read() == b.read(), name
+    assert sorted(os.listdir('dist/assets/demo/store.pages')) == sorted(os.listdir('public/assets/other/store.pages'))
+
+
+def test_unchanged_publish_stream_returns_before_derived_files(catalog):
+    publish_store('demo', make_store([make_product(1), make_product(2)]), page_size=1)
+    before = {name: os.stat(f'public/assets/demo/{name}').st_mtime_ns
+              for name in ('store.json', 'store.columns.bin', 'store.manifest.json', 'store.versions.json')}
+
+    assert publish_stream('demo', lambda product: product) == (2, False)
+
+    assert {name: os.stat(f'public/assets/demo/{name}').st_mtime_ns for name in before} == before
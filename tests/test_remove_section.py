@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import remove_section
+from eishro_catalog.tsx_balance import check_source
+
+PAGE = '''import React from 'react';
+
+export const Page = () => {
+  return (
+    <main>
+      <Header />
+      {/* promo-banner */}
+      <section className="promo">
+        <h2>{"عرض }"}</h2>
+        <p>نص</p>
+      </section>
+      <Footer />
+    </main>
+  );
+};
+'''
+
+
+def write(path, text, newline='\n'):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text.replace('\n', newline))
+
+
+def read(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def test_preview_does_not_touch_the_file(tmp_path, capsys):
+    path = str(tmp_path / 'Page.tsx')
+    write(path, PAGE)
+
+    remove_section.main([path, '--start', 'promo-banner', '--node'])
+
+    assert read(path) == PAGE
+    removed = [line[1:] for line in capsys.readouterr().out.splitlines() if line.startswith('-') and not line.startswith('---')]
+    assert removed[0].strip() == '{/* promo-banner */}'
+    assert removed[-1].strip() == '</section>'
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_node_removal_keeps_file_balanced_and_line_endings(tmp_path, newline):
+    path = str(tmp_path / 'Page.tsx')
+    write(path, PAGE, newline)
+
+    remove_section.main([path, '--start', 'promo-banner', '--node', '--apply'])
+
+    result = read(path)
+    expected = PAGE.replace(PAGE[PAGE.index('      {/* promo'):PAGE.index('      <Footer')], '')
+    assert result == expected.replace('\n', newline)
+    assert check_source(result) is None
+
+
+def test_anchor_range_with_exclusive_end(tmp_path):
+    path = str(tmp_path / 'data.ts')
+    write(path, 'a\n// start\nb\nc\n// end\nd\n')
+
+    remove_section.main([path, '--start', '// start', '--end', '// end', '--end-exclusive', '--apply'])
+
+    assert read(path) == 'a\n// end\nd\n'
+
+
+def test_removal_that_breaks_balance_is_refused(tmp_path, capsys):
+    path = str(tmp_path / 'Page.tsx')
+    write(path, PAGE)
+
+    with pytest.raises(SystemExit):
+        remove_section.main([path, '--start', '<section', '--end', '<p>', '--apply'])
+
+    assert read(path) == PAGE
+    assert 'توازن' in capsys.readouterr().out
+    assert [p.name for p in tmp_path.iterdir()] == ['Page.tsx']
+
+
+def test_missing_anchor_fails(tmp_path):
+    path = str(tmp_path / 'Page.tsx')
+    write(path, PAGE)
+
+    with pytest.raises(SystemExit):
+        remove_section.main([path, '--start', 'no-such-anchor', '--node', '--apply'])
+
+    assert read(path) == PAGE
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import copy
+
+import pytest
+
+from conftest import make_product, make_store
+from eishro_catalog.publish import encode_store
+from eishro_catalog.store_diff import ProductChanges, apply_patch, diff_products, diff_stores
+
+
+def round_trip(old, new):
+    patch = diff_stores(old, new)
+    assert encode_store(apply_patch(old, patch)) == encode_store(new)
+    return patch
+
+
+def base_store():
+    return make_store([
+        make_product(1, colors=[{'name': 'أحمر', 'value': 1}], stats={'views': 10, 'flags': [True, 1]}),
+        make_product(2),
+        make_product(3),
+    ], settings={'theme': {'radius': 4, 'dark': False}})
+
+
+@pytest.mark.parametrize('mutate', [
+    lambda store: store['products'][0]['colors'][0].update(value=1.0),
+    lambda store: store['products'][0]['stats']['flags'].__setitem__(0, 1),
+    lambda store: store['products'][0]['stats'].update(views=10.0),
+    lambda store: store['products'][0].update(price=100.0),
+    lambda store: store['settings']['theme'].update(dark=0),
+    lambda store: store['products'][0].update(stats={'flags': [True, 1], 'views': 10}),
+])
+def test_nested_type_and_order_changes_are_not_dropped(mutate):
+    old = base_store()
+    new = copy.deepcopy(old)
+    mutate(new)
+
+    patch = round_trip(old, new)
+
+    assert patch
+
+
+def test_identical_stores_give_an_empty_patch():
+    old = base_store()
+
+    assert round_trip(old, copy.deepcopy(old)) == {}
+
+
+def test_added_removed_reordered_and_changed_products_round_trip():
+    old = base_store()
+    new = copy.deepcopy(old)
+    new['products'] = [new['products'][2], make_product(4), new['products'][0]]
+    new['products'][2]['likes'] = 500
+    del new['products'][0]['reviews']
+
+    patch = round_trip(old, new)
+
+    assert patch['products']['removed'] == [2]
+    assert [product['id'] for product in patch['products']['added']] == [4]
+
+
+def streamed_changes(products, transform):
+    changes = ProductChanges()
+    new_products = []
+    for product in copy.deepcopy(products):
+        before = changes.snapshot(product)
+        product = transform(product)
+        changes.add(before, product)
+        if product is not None:
+            new_products.append(product)
+    return changes.products(), new_products
+
+
+@pytest.mark.parametrize('transform', [
+    lambda p: p,
+    lambda p: None if p['id'] == 2 else p,
+    lambda p: dict(p, price=100.0) if p['id'] == 1 else p,
+    lambda p: {key: p[key] for key in reversed(list(p))} if p['id'] == 3 else p,
+    lambda p: dict(p, badge='جديد', reviews=None),
+])
+def test_streamed_product_changes_match_diff_products(transform):
+    products = base_store()['products']
+
+    patch, new_products = streamed_changes(products, transform)
+
+    assert patch == diff_products(products, new_products)
+
+
+def test_streamed_product_changes_give_up_on_id_changes_and_duplicates():
+    products = base_store()['products']
+
+    assert streamed_changes(products, lambda p: dict(p, id=p['id'] + 10))[0] is None
+    assert streamed_changes(products + [make_product(1)], lambda p: p)[0] is None
+    assert streamed_changes([{'name': 'بلا معرف'}], lambda p: p)[0] is None
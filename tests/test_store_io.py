@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import os
+
+import pytest
+
+from conftest import make_product, make_store
+from eishro_catalog.store_io import StoreReader, stream_store, write_store_stream
+
+
+def write_json(path, value):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(value, f, ensure_ascii=False, indent=2)
+
+
+def store_with_trailer():
+    store = make_store([make_product(i, price=10.5 * i, tags=['وسم', i], inStock=i % 2 == 0) for i in range(1, 40)])
+    store['updatedAt'] = '2026-01-01'
+    store['meta'] = {'currency': 'د.ل', 'ratios': [1.0, 2, None]}
+    return store
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 1 << 16])
+def test_reader_yields_products_and_header_in_file_order(tmp_path, chunk_size):
+    store = store_with_trailer()
+    path = str(tmp_path / 'store.json')
+    write_json(path, store)
+
+    with StoreReader(path, chunk_size=chunk_size) as reader:
+        products = list(reader.products())
+        header = reader.header
+
+    assert products == store['products']
+    assert list(header) == list(store)
+    assert {key: value for key, value in header.items() if key != 'products'} == \
+        {key: value for key, value in store.items() if key != 'products'}
+
+
+@pytest.mark.parametrize('store', [store_with_trailer(), make_store([]), {'name': 'بلا منتجات'}])
+def test_stream_writer_matches_json_dump(tmp_path, store):
+    path = str(tmp_path / 'store.json')
+    write_json(path, store)
+
+    out = io.StringIO()
+    with StoreReader(path, chunk_size=5) as reader:
+        write_store_stream(out, reader.header, reader.products())
+
+    expected = json.dumps(dict(store, products=store.get('products', [])), ensure_ascii=False, indent=2)
+    if 'products' in store:
+        assert out.getvalue() == expected
+    else:
+        assert json.loads(out.getvalue()) == dict(store, products=[])
+
+
+def test_stream_store_skips_identical_output_and_drops_none(tmp_path):
+    path = str(tmp_path / 'store.json')
+    write_json(path, store_with_trailer())
+    mtime = os.stat(path).st_mtime_ns
+
+    assert stream_store(path, lambda product: product) == (39, False)
+    assert os.stat(path).st_mtime_ns == mtime
+
+    assert stream_store(path, lambda product: product if product['id'] % 3 else None) == (26, True)
+    with open(path, 'r', encoding='utf-8') as f:
+        store = json.load(f)
+    assert [p['id'] for p in store['products']][:3] == [1, 2, 4]
+    assert store['meta']['currency'] == 'د.ل'
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.tmp')] == []
+
+
+def test_stream_store_keeps_mode_and_original_on_error(tmp_path):
+    path = str(tmp_path / 'store.json')
+    write_json(path, store_with_trailer())
+    os.chmod(path, 0o640)
+    with open(path, 'rb') as f:
+        original = f.read()
+
+    def fail(product):
+        if product['id'] == 20:
+            raise ValueError('خطأ')
+        return product
+
+    with pytest.raises(ValueError):
+        stream_store(path, fail)
+    with open(path, 'rb') as f:
+        assert f.read() == original
+
+    assert stream_store(path, lambda product: dict(product, price=1)) == (39, True)
+    assert os.stat(path).st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ['store.json']
+
+
+def test_batched_transform_matches_per_product_transform(tmp_path):
+    store = store_with_trailer()
+    first, second = str(tmp_path / 'a.json'), str(tmp_path / 'b.json')
+    write_json(first, store)
+    write_json(second, store)
+    sizes = []
+
+    def per_product(product):
+        return None if product['id'] % 5 == 0 else dict(product, price=product['id'])
+
+    def per_batch(products):
+        sizes.append(len(products))
+        return [per_product(product) for product in products]
+
+    assert stream_store(first, per_product) == stream_store(second, per_batch, batch_size=7) == (32, True)
+    assert sizes == [7, 7, 7, 7, 7, 4]
+    with open(first, 'rb') as a, open(second, 'rb') as b:
+        assert a.read() == b.read()
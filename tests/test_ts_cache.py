@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from eishro_catalog import ts_cache
+from eishro_catalog.ts_cache import cached_ts_products, empty_ts_cache, load_ts_cache
+
+MODULE = '''export const products = [
+  { id: 1, storeId: 1, name: "أ", price: 10 },
+  { id: 2, storeId: 1, name: "ب", price: broken( },
+];
+'''
+
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def reparsed(*args):
+    raise AssertionError('الملف حُلّل من جديد رغم أنه لم يتغير')
+
+
+def test_unchanged_file_is_served_from_cache(catalog, monkeypatch):
+    write('data.ts', MODULE)
+    skipped = []
+    products = cached_ts_products('data.ts', skipped)
+    assert [p['id'] for p in products] == [1]
+    assert [line for line, _ in skipped] == [3]
+
+    monkeypatch.setattr(ts_cache, 'iter_source_products', reparsed)
+    skipped_again = []
+    assert cached_ts_products('data.ts', skipped_again) == products
+    assert skipped_again == skipped
+
+
+def test_edited_file_is_parsed_again(catalog):
+    cache = empty_ts_cache()
+    write('data.ts', MODULE)
+    cached_ts_products('data.ts', cache=cache)
+
+    write('data.ts', MODULE.replace('price: 10', 'price: 12'))
+    products = cached_ts_products('data.ts', cache=cache)
+
+    assert products[0]['price'] == 12
+    # عند تمرير cache لا تُحفظ على القرص
+    assert load_ts_cache() == empty_ts_cache()
+
+
+def test_parser_version_change_invalidates(catalog, monkeypatch):
+    write('data.ts', MODULE)
+    cached_ts_products('data.ts')
+    monkeypatch.setattr(ts_cache, 'PARSER_VERSION', ts_cache.PARSER_VERSION + 1)
+    calls = []
+    real = ts_cache.iter_source_products
+    monkeypatch.setattr(ts_cache, 'iter_source_products', lambda *a: calls.append(1) or real(*a))
+
+    cached_ts_products('data.ts')
+
+    assert calls == [1]
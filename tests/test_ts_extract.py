@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import re
+
+import pytest
+
+from eishro_catalog.synthetic import iter_synthetic_products, write_ts_module
+from eishro_catalog.ts_extract import DATA_MODULE_PATTERNS, data_module_paths, scan_products
+from eishro_catalog.ts_literal import TSLiteralError, _Parser, _tokenize, parse_ts_literal
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def baseline_spans(content):
+    """المستخرج الأصلي (generate_store_json قبل ts_extract): تعبير للرأس ثم عد الأقواس"""
+    spans = []
+    pattern = r'\{\s*id:\s*(\d+),\s*storeId:\s*(?:MAGNA_BEAUTY_STORE_ID|(\d+)),'
+    for match in re.finditer(pattern, content):
+        brace_count = 1
+        pos = match.start() + 1
+        while brace_count > 0 and pos < len(content):
+            if content[pos] == '{':
+                brace_count += 1
+            elif content[pos] == '}':
+                brace_count -= 1
+            pos += 1
+        store_id = int(match.group(2)) if match.group(2) else 5
+        spans.append((match.start(), pos, int(match.group(1)), store_id))
+    return spans
+
+
+def full_parse(text, constants):
+    parser = _Parser(_tokenize(text), constants)
+    return parser.value()
+
+
+def synthetic_source(count):
+    f = io.StringIO()
+    write_ts_module(f, iter_synthetic_products(count))
+    return f.getvalue()
+
+
+@pytest.mark.parametrize('path', data_module_paths([os.path.join(ROOT, p) for p in DATA_MODULE_PATTERNS]))
+def test_scan_matches_baseline_extractor_on_data_modules(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    spans, constants = scan_products(source)
+    found = {(span.start, span.end, span.product_id, span.store_id) for span in spans}
+
+    assert set(baseline_spans(source)) <= found
+    for span in spans:
+        text = source[span.start:span.end]
+        try:
+            expected = full_parse(text, constants)
+        except TSLiteralError:
+            with pytest.raises(TSLiteralError):
+                parse_ts_literal(text, constants)
+        else:
+            assert parse_ts_literal(text, constants) == expected
+
+
+def test_scan_matches_baseline_extractor_on_synthetic_module():
+    source = synthetic_source(300)
+
+    spans, _ = scan_products(source)
+
+    assert [(s.start, s.end, s.product_id, s.store_id) for s in spans] == baseline_spans(source)
+    assert [s.line for s in spans] == [source.count('\n', 0, s.start) + 1 for s in spans]
+
+
+def test_braces_and_store_ids_inside_strings_and_comments_are_ignored():
+    source = '''const MAGNA_BEAUTY_STORE_ID = 5;
+export const products = [
+  { id: 1, storeId: MAGNA_BEAUTY_STORE_ID, name: "{ id: 9, storeId: 2, }", note: 'x}' },
+  // { id: 2, storeId: 3, },
+  /* } */ { id: 3, description: "storeId: 7", "storeId": 4, tag: `a${ {b: 1}.b }}` },
+];
+'''
+    spans, constants = scan_products(source)
+
+    assert constants == {'MAGNA_BEAUTY_STORE_ID': 5}
+    assert [(s.product_id, s.store_id, s.line) for s in spans] == [(1, 5, 3), (3, 4, 5)]
+    assert source[spans[0].start:spans[0].end].endswith("'x}' }")
+
+
+@pytest.mark.parametrize('text', [
+    '{ id: 1, name: "a", tags: ["x", "y",], }',
+    "{ id: 2, 'name': 'it\\'s', price: 1e3, ratio: .5, hex: 0x1F, old: 07 }",
+    '{ id: 3, // تعليق\n  name: "b" /* } */, store: MAGNA_BEAUTY_STORE_ID, ok: true, none: undefined }',
+    '{ id: 4, text: `سطر\\n${"$"}`.length }',
+    '{ id: 5, emoji: "\\ud83d\\ude00", tab: "a\tb", MAGNA_BEAUTY_STORE_ID }',
+    '{ id: 6, 1: "numeric key", nested: { deep: [1, 2.5, -0, null] } }',
+    '{ id: 7, value: e5, exp: 2e5 }',
+    '{ id: 8, ...base }',
+])
+def test_json_fast_path_matches_full_parser(text):
+    constants = {'MAGNA_BEAUTY_STORE_ID': 5, 'e5': 99}
+    try:
+        expected = full_parse(text, constants)
+    except TSLiteralError:
+        with pytest.raises(TSLiteralError):
+            parse_ts_literal(text, constants)
+    else:
+        assert parse_ts_literal(text, constants) == expected
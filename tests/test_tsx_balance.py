@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import argparse
+import subprocess
+
+import pytest
+
+import check_tsx
+from eishro_catalog.tsx_balance import check_file, check_source, construct_end
+
+COMPONENT = '''export const Card = ({ items }) => {
+  const label = `total: ${items.length}`;
+  return (
+    <div className="card">
+      {items.map((item) => <span key={item}>{item}</span>)}
+      <p>{label}</p>
+    </div>
+  );
+};
+'''
+
+
+def test_balanced_component_passes():
+    assert check_source(COMPONENT) is None
+
+
+def test_unclosed_tag_reports_opener_and_component():
+    problem = check_source(COMPONENT.replace('    </div>\n', ''))
+
+    assert problem is not None
+    assert problem.component == 'Card'
+    assert problem.line == 4
+
+
+def test_strings_comments_and_regex_are_ignored():
+    source = 'const a = "{(";\n// )}\nconst b = /[{]/g;\n/* } */\nconst c = `${"}"}`;\n'
+
+    assert check_source(source, jsx=False) is None
+
+
+def test_stray_brace_in_jsx_text_is_reported():
+    problem = check_source('const A = () => (\n  <div>\n    text )}\n  </div>\n);\n')
+
+    assert problem is not None
+    assert problem.line == 2
+    assert 'في السطر 3' in problem.message
+
+
+def test_type_assertion_is_not_jsx_in_ts_files(tmp_path):
+    source = 'const x = <any>window;\nexport const y = (x as number) + 1;\n'
+    (tmp_path / 'a.ts').write_text(source, encoding='utf-8')
+    (tmp_path / 'a.tsx').write_text(source, encoding='utf-8')
+
+    assert check_source(source, jsx=False) is None
+    assert check_file(str(tmp_path / 'a.ts')) is None
+    assert check_file(str(tmp_path / 'a.tsx')) is not None
+
+
+@pytest.mark.parametrize('source', [
+    'const f = <T,>(x: T) => x;\n',
+    'const f = <T extends object>(x: T) => x;\n',
+    'const g = useMemo(() => <K, V>(map: Map<K, V>) => map.size, []);\n',
+])
+def test_generic_arrow_functions_are_not_jsx(source):
+    assert check_source(source) is None
+    assert check_source(source + 'export const A = () => <div>;\n') is not None
+
+
+def test_construct_end_covers_whole_element():
+    start = COMPONENT.index('      <p>')
+    problem, end = construct_end(COMPONENT, start)
+
+    assert problem is None
+    assert COMPONENT[start:end] == '      <p>{label}</p>\n'
+
+
+def git(cwd, *args):
+    subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True)
+
+
+def test_staged_check_reads_the_index(tmp_path, monkeypatch):
+    try:
+        git(tmp_path, 'init', '-q')
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip('git غير متاح')
+    path = tmp_path / 'Broken.tsx'
+    path.write_text('export const A = () => <div>;\n', encoding='utf-8')
+    git(tmp_path, 'add', 'Broken.tsx')
+    path.write_text('export const A = () => <div />;\n', encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+
+    args = argparse.Namespace(staged=True, paths=[], incremental=False, workers=1)
+    assert check_tsx.run(args) == 1
+
+    git(tmp_path, 'add', 'Broken.tsx')
+    assert check_tsx.run(args) == 0
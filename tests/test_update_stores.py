@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from conftest import make_product, make_store, read_json
+from eishro_catalog.publish import load_versions, publish_store
+from eishro_catalog.store_diff import apply_patch
+from update_stores import update_store
+
+
+@pytest.mark.parametrize('bulk', [False, True])
+def test_update_store_goes_through_the_publish_step(catalog, bulk):
+    bare = make_product(2)
+    for field in ('views', 'likes', 'orders', 'rating', 'reviews'):
+        del bare[field]
+    old = make_store([make_product(1), bare])
+    publish_store('nawaem', old)
+    before = load_versions('nawaem')
+
+    assert update_store('nawaem', bulk=bulk)
+
+    new = read_json('public/assets/nawaem/store.json')
+    assert all('views' in p and 'badge' in p for p in new['products'])
+    assert read_json('dist/assets/nawaem/store.json') == new
+    versions = load_versions('nawaem')
+    assert versions['version'] == before['version'] + 1
+    patch = read_json(f"public/assets/nawaem/store.patches/{versions['version']}.json")
+    assert apply_patch(old, patch) == new
+    assert os.path.getmtime('public/assets/nawaem/store.columns.bin') >= os.path.getmtime(
+        'public/assets/nawaem/store.json')
+
+
+@pytest.mark.parametrize('bulk', [False, True])
+def test_second_run_is_a_no_op(catalog, bulk):
+    publish_store('nawaem', make_store([make_product(1)]))
+    update_store('nawaem', bulk=bulk)
+    version = load_versions('nawaem')['version']
+
+    update_store('nawaem', bulk=bulk)
+
+    assert load_versions('nawaem')['version'] == version
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+from conftest import make_product, make_store, read_json
+from eishro_catalog import timing
+from eishro_catalog.publish import publish_store
+from watch_badges import process_changed
+
+
+def test_repeated_batches_do_not_accumulate_timings(catalog):
+    publish_store('demo', make_store([make_product(1), make_product(2, orders=500)]))
+    before = len(timing._records)
+
+    for _ in range(20):
+        process_changed(['demo'])
+
+    assert len(timing._records) == before
+    assert read_json('public/assets/demo/store.json')['products'][1]['badge']
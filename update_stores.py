@@ -1,60 +1,94 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import argparse
 import json
-import random
-from pathlib import Path
-import sys
+import os
 
-# Set UTF-8 encoding for output
-if sys.platform == 'win32':
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.publish import publish_store, publish_stream
+from eishro_catalog.stats import (
+    DEFAULT_DISTRIBUTIONS,
+    DEFAULT_SEED,
+    fill_product_stats,
+    load_distributions,
+    store_distributions,
+    synthesize_stats,
+)
+from eishro_catalog.stores import store_path
+from eishro_catalog.timing import add_timing_arguments, instrumented, timed
 
-def update_store(store_dir):
-    base_path = Path(__file__).parent / 'public' / 'assets' / store_dir / 'store.json'
+def fill_default_badge(product):
+    """شارة افتراضية للمنتجات التي لا شارة لها"""
+    if 'badge' not in product or product['badge'] is None:
+        product['badge'] = 'جديد'
+    return product
+
+def fill_missing_stats(product, distributions=DEFAULT_DISTRIBUTIONS, seed=DEFAULT_SEED, store=''):
+    """تعبئة الإحصائيات الناقصة لمنتج واحد (قيم حتمية من البذرة)"""
+    fill_product_stats(product, distributions, seed, store)
+    return fill_default_badge(product)
+
+def update_store(store_dir, config=None, seed=DEFAULT_SEED, bulk=False):
+    distributions = store_distributions(config or load_distributions(), store_dir)
+    base_path = store_path(store_dir)
     
     print(f'Processing: {base_path}')
     
-    if not base_path.exists():
+    if not os.path.exists(base_path):
         print(f'  [!] File not found')
         return False
     
     try:
-        with open(base_path, 'r', encoding='utf-8') as f:
-            store = json.load(f)
-        
-        updated_count = 0
-        for product in store.get('products', []):
-            if 'rating' not in product or product['rating'] is None:
-                product['rating'] = round(4 + random.random(), 1)
-                updated_count += 1
-            if 'reviews' not in product or product['reviews'] is None:
-                product['reviews'] = random.randint(10, 100)
-            if 'views' not in product or product['views'] is None:
-                product['views'] = random.randint(50, 450)
-            if 'likes' not in product or product['likes'] is None:
-                product['likes'] = random.randint(10, 300)
-            if 'orders' not in product or product['orders'] is None:
-                product['orders'] = random.randint(5, 150)
-            if 'quantity' not in product or product['quantity'] is None:
-                product['quantity'] = random.randint(5, 50) if product.get('inStock') else 0
-            if 'badge' not in product or product['badge'] is None:
-                product['badge'] = 'جديد'
+        if bulk:
+            # المتجر كله في الذاكرة وكل حقل يُولَّد لكل المنتجات في استدعاء واحد
+            with timed('load', store_dir), open(base_path, 'r', encoding='utf-8') as f:
+                store_data = json.load(f)
+            with timed('transform', store_dir):
+                products = store_data.get('products', [])
+                synthesize_stats(products, distributions, seed, store_dir)
+                for product in products:
+                    fill_default_badge(product)
+            written = publish_store(store_dir, store_data)
+            product_count = len(products)
+        else:
+            # قراءة وكتابة متدفقة: منتج واحد في الذاكرة في كل مرة، والفرق وملف
+            # الأعمدة والصفحات تُبنى من نفس التدفق، فالتحميل والتحويل والكتابة
+            # متداخلة وتُقاس كمرحلة واحدة
+            with timed('stream', store_dir):
+                product_count, written = publish_stream(
+                    store_dir,
+                    lambda product: fill_missing_stats(product, distributions, seed, store_dir)
+                )
         
-        with open(base_path, 'w', encoding='utf-8') as f:
-            json.dump(store, f, ensure_ascii=False, indent=2)
-        
-        print(f'  [OK] Updated {store_dir} ({len(store.get("products", []))} products)')
+        if written:
+            print(f'  [OK] Updated {store_dir} ({product_count} products)')
+        else:
+            print(f'  [OK] Unchanged {store_dir} ({product_count} products), not rewritten')
         return True
     except Exception as e:
         print(f'  [ERROR] {str(e)}')
         return False
 
+def main(argv=None):
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description='Fill missing product stats in store.json files')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help='seed for the generated stats (same seed, same output)')
+    parser.add_argument('--distributions', metavar='PATH',
+                        help='JSON file with {"default": {...}, "stores": {"<folder>": {...}}} ranges')
+    parser.add_argument('--bulk', action='store_true',
+                        help='load each store and generate every missing field in one vectorized call')
+    add_timing_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    config = load_distributions(args.distributions)
+    with instrumented(args):
+        print('Starting store updates...\n')
+        results = [
+            update_store(store_dir, config, args.seed, args.bulk)
+            for store_dir in ('nawaem', 'delta-store', 'indeesh')
+        ]
+        print(f'\n[DONE] {sum(results)}/{len(results)} stores updated successfully')
+
 if __name__ == '__main__':
-    print('Starting store updates...\n')
-    results = [
-        update_store('nawaem'),
-        update_store('delta-store'),
-        update_store('indeesh')
-    ]
-    print(f'\n[DONE] {sum(results)}/{len(results)} stores updated successfully')
+    main()
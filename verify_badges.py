@@ -1,47 +1,60 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
-import sys
-import io
+import argparse
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+from eishro_catalog.columnar import load_fresh_columns
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.store_io import StoreReader
+from eishro_catalog.stores import add_workers_argument, discover_stores, run_per_store, store_path
 
-stores = [
-    ('nawaem', 'public/assets/nawaem/store.json'),
-    ('delta-store', 'public/assets/delta-store/store.json'),
-    ('pretty', 'public/assets/pretty/store.json'),
-    ('sheirine', 'public/assets/sheirine/store.json'),
-    ('magna-beauty', 'public/assets/magna-beauty/store.json'),
-]
+def read_badges(path, sample_size=3):
+    """(عدد المنتجات، {الشارة: العدد}، أول sample_size منتجات)
 
-print("=" * 60)
-print("📊 التحقق من نظام الشارات على جميع المتاجر")
-print("=" * 60)
+    العدّ من ملف الأعمدة إن كان مطابقاً لـ store.json الحالي، فتُقرأ من
+    store.json العينة فقط؛ وإلا يُعد بقراءة متدفقة للملف كله.
+    """
+    columns = load_fresh_columns(path)
+    sample = []
+    with StoreReader(path) as reader:
+        if columns is not None:
+            with columns:
+                product_count = columns.count
+                badges = {}
+                for badge, count in columns.counts('badge').items():
+                    badge = badge or 'غير محدد'
+                    badges[badge] = badges.get(badge, 0) + count
+            for product in reader.products():
+                if len(sample) == sample_size:
+                    break
+                sample.append(product)
+            return product_count, badges, sample
+        
+        badges = {}
+        product_count = 0
+        for product in reader.products():
+            badge = product.get('badge') or 'غير محدد'
+            badges[badge] = badges.get(badge, 0) + 1
+            if len(sample) < sample_size:
+                sample.append(product)
+            product_count += 1
+    return product_count, badges, sample
 
-for store_name, store_path in stores:
+def verify_store(store_name):
+    """طباعة ملخص الشارات وعينة من منتجات متجر واحد"""
     try:
-        with open(store_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        products = data.get('products', [])
-        product_count = len(products)
+        product_count, badges, sample = read_badges(store_path(store_name))
         
         print(f"\n✅ متجر {store_name}: {product_count} منتج")
         
         if product_count > 0:
-            badges = {}
-            for product in products:
-                badge = product.get('badge', 'غير محدد')
-                badges[badge] = badges.get(badge, 0) + 1
-            
             print("   ملخص الشارات:")
             for badge in sorted(badges.keys()):
                 count = badges[badge]
                 print(f"      • {badge}: {count}")
                 
             print("\n   عينة من المنتجات (أول 3):")
-            for i, product in enumerate(products[:3]):
+            for i, product in enumerate(sample):
                 print(f"      {i+1}. {product.get('name')} - الشارة: {product.get('badge')} - الكمية: {product.get('quantity', 0)}")
         else:
             print("   ⚠️  لا يوجد منتجات في المتجر")
@@ -51,6 +64,25 @@ for store_name, store_path in stores:
     except Exception as e:
         print(f"\n❌ متجر {store_name}: {e}")
 
-print("\n" + "=" * 60)
-print("✨ انتهت عملية التحقق")
-print("=" * 60)
+def main(argv=None):
+    """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="التحقق من نظام الشارات على جميع المتاجر")
+    add_workers_argument(parser)
+    args = parser.parse_args(argv)
+    
+    print("=" * 60)
+    print("📊 التحقق من نظام الشارات على جميع المتاجر")
+    print("=" * 60)
+    
+    for result in run_per_store(verify_store, discover_stores(), args.workers):
+        print(result.output, end='')
+        if result.error:
+            print(f"\n❌ متجر {result.folder}: {result.error}")
+    
+    print("\n" + "=" * 60)
+    print("✨ انتهت عملية التحقق")
+    print("=" * 60)
+
+if __name__ == '__main__':
+    main()
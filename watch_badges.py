@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import time
+
+from eishro_catalog.console import use_utf8_stdout
+from eishro_catalog.stores import discover_stores, store_display_name, store_path
+from eishro_catalog.timing import collect_timings
+from eishro_catalog.watch import InotifySource, watch_stores
+from fix_badges import process_store
+
+def process_changed(folders):
+    """إعادة حساب الشارات ونشر المتاجر التي تغيرت، وإرجاع الملفات المكتوبة"""
+    start = time.perf_counter()
+    print(f"🔄 تغيرت: {', '.join(store_display_name(folder) for folder in folders)}")
+    written = []
+    for folder in folders:
+        try:
+            # المراقبة لا تكتب تقرير أزمنة، فتُجمع قياسات كل متجر وتُهمل
+            # حتى لا تتراكم في timing طوال عمل العملية
+            with collect_timings(folder):
+                changed = process_store(folder)
+            if changed:
+                written.append(store_path(folder))
+        except Exception as e:
+            print(f"❌ خطأ في معالجة {store_display_name(folder)}: {e}\n")
+    print(f"⏱️  {time.perf_counter() - start:.3f} ث\n", flush=True)
+    return written
+
+def main(argv=None):
+    """الدالة الرئيسية"""
+    use_utf8_stdout()
+    parser = argparse.ArgumentParser(description="مراقبة ملفات store.json وإعادة حساب الشارات عند تغيرها")
+    parser.add_argument('--polling', action='store_true', help="الفحص الدوري بدل inotify")
+    parser.add_argument('--interval', type=float, default=1.0, help="فترة الفحص الدوري بالثواني")
+    parser.add_argument('--debounce', type=float, default=0.3,
+                        help="مدة الهدوء بالثواني قبل المعالجة (لجمع التعديلات المتتابعة)")
+    parser.add_argument('--initial', action='store_true', help="معالجة كل المتاجر مرة عند البدء")
+    args = parser.parse_args(argv)
+    
+    if args.initial:
+        process_changed(discover_stores())
+    
+    def started(source):
+        mode = 'inotify' if isinstance(source, InotifySource) else f'فحص دوري كل {args.interval} ث'
+        print(f"👀 مراقبة public/assets/*/store.json ({mode})، Ctrl+C للإيقاف\n", flush=True)
+    
+    try:
+        watch_stores(process_changed, debounce=args.debounce, polling=args.polling,
+                     interval=args.interval, on_start=started)
+    except KeyboardInterrupt:
+        print("\n👋 تم إيقاف المراقبة")
+
+if __name__ == '__main__':
+    main()